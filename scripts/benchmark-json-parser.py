@@ -0,0 +1,73 @@
+"""Script responsible for benchmarking the JSON parser's decoders."""
+
+import argparse
+import json
+import random
+import string
+import timeit
+from typing import Any
+
+from maison.parsers import json as json_parser
+
+
+def main() -> None:
+    """Parses args and prints the time each decoder takes to parse a document."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+
+    document: bytes = json.dumps(generate_config(keys=args.keys)).encode()
+    print(f"document of {args.keys} keys, {len(document) / 1024:.0f} KiB")
+
+    for backend in sorted(json_parser.BACKENDS):
+        reader = json_parser.JsonParser(backend=backend)
+        seconds: float = min(
+            timeit.repeat(
+                lambda reader=reader: reader.parse_config(document),
+                number=args.number,
+                repeat=5,
+            )
+        )
+        print(f"{backend:>8}: {seconds / args.number * 1000:.2f} ms per parse")
+
+
+def generate_config(keys: int) -> dict[str, Any]:
+    """Generates a config shaped like those produced by deploy tooling."""
+    rng: random.Random = random.Random(0)  # noqa: S311
+    services: dict[str, Any] = {}
+
+    for index in range(keys // 10):
+        services[f"service-{index}"] = {
+            "image": "".join(rng.choices(string.ascii_lowercase, k=24)),
+            "replicas": rng.randint(1, 10),
+            "cpu": rng.random(),
+            "enabled": rng.random() > 0.5,
+            "ports": [rng.randint(1024, 65535) for _ in range(3)],
+            "env": {f"VAR_{key}": str(rng.random()) for key in range(5)},
+        }
+
+    return {"services": services}
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for benchmark-json-parser."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="benchmark-json-parser",
+        usage="python ./scripts/benchmark-json-parser.py --keys 100000",
+    )
+    parser.add_argument(
+        "--keys",
+        type=int,
+        default=50_000,
+        help="Approximate number of keys in the generated document.",
+    )
+    parser.add_argument(
+        "--number",
+        type=int,
+        default=10,
+        help="Number of parses per timing run.",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Script responsible for benchmarking the ways of merging config layers."""
+
+import argparse
+import copy
+import random
+import timeit
+from typing import Any
+from typing import Callable
+
+from maison import merging
+from maison import utils
+
+
+def main() -> None:
+    """Parses args and prints the time each merge takes over a stack of layers."""
+    parser: argparse.ArgumentParser = get_parser()
+    args: argparse.Namespace = parser.parse_args()
+
+    layers: list[dict[str, Any]] = [
+        generate_layer(keys=args.keys, seed=seed) for seed in range(args.layers)
+    ]
+    print(f"{args.layers} layers of {args.keys} keys")
+
+    plan = merging.MergePlan()
+    strategy_plan = merging.MergePlan(
+        strategies={"services.*.ports": "append", "services.*.env": "replace"}
+    )
+
+    def deep_merge() -> None:
+        merged: dict[str, Any] = {}
+        for layer in layers:
+            merged = utils.deep_merge(merged, copy.deepcopy(layer))
+
+    def merge_plan(plan: merging.MergePlan) -> Callable[[], None]:
+        def _merge() -> None:
+            merged: dict[str, Any] = {}
+            for layer in layers:
+                merged = plan.merge(merged, layer)
+
+        return _merge
+
+    for name, merge in (
+        ("deep_merge", deep_merge),
+        ("MergePlan", merge_plan(plan)),
+        ("MergePlan+strategies", merge_plan(strategy_plan)),
+    ):
+        seconds: float = min(timeit.repeat(merge, number=args.number, repeat=5))
+        print(f"{name:>20}: {seconds / args.number * 1000:.2f} ms per merge")
+
+
+def generate_layer(keys: int, seed: int) -> dict[str, Any]:
+    """Generates a layer overriding part of a config of deploy tooling."""
+    rng: random.Random = random.Random(seed)  # noqa: S311
+    services: dict[str, Any] = {}
+
+    for index in range(keys // 10):
+        if seed and rng.random() > 0.3:
+            continue
+        services[f"service-{index}"] = {
+            "replicas": rng.randint(1, 10),
+            "ports": [rng.randint(1024, 65535)],
+            "env": {f"VAR_{key}": str(rng.random()) for key in range(5)},
+        }
+
+    return {"services": services}
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for benchmark-merge."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="benchmark-merge",
+        usage="python ./scripts/benchmark-merge.py --keys 100000 --layers 4",
+    )
+    parser.add_argument(
+        "--keys",
+        type=int,
+        default=50_000,
+        help="Approximate number of keys in the first layer.",
+    )
+    parser.add_argument(
+        "--layers",
+        type=int,
+        default=4,
+        help="Number of layers to merge.",
+    )
+    parser.add_argument(
+        "--number",
+        type=int,
+        default=5,
+        help="Number of merges per timing run.",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 """Maison."""
 
+from .config import AsyncUserConfig
 from .config import UserConfig
+from .registry import ConfigRegistry
+from .registry import get_config
 
 
-__all__ = ["UserConfig"]
+__all__ = ["AsyncUserConfig", "ConfigRegistry", "UserConfig", "get_config"]
@@ -0,0 +1,171 @@
+"""Holds the building blocks for the caches used throughout the package."""
+
+import collections
+import threading
+import typing
+
+from maison import typedefs
+
+
+K = typing.TypeVar("K", bound=typing.Hashable)
+V = typing.TypeVar("V")
+
+
+class CacheInfo(typing.NamedTuple):
+    """Statistics about a cache, modelled on `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(typing.Generic[K, V]):
+    """A thread-safe mapping bounded in size with least-recently-used eviction."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """Instantiate the class.
+
+        Args:
+            maxsize: the maximum number of entries to hold. A `maxsize` of `0`
+                disables the cache.
+        """
+        self.maxsize = maxsize
+        self._entries: collections.OrderedDict[K, V] = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache.
+
+        Returns:
+            the number of entries
+        """
+        return len(self._entries)
+
+    def get(
+        self,
+        key: K,
+        is_valid: typing.Optional[typing.Callable[[V], bool]] = None,
+    ) -> typing.Optional[V]:
+        """Get an entry from the cache, marking it as recently used.
+
+        Args:
+            key: the key of the entry
+            is_valid: an optional callable to check whether the entry is still
+                usable. Entries failing the check are evicted and count as a miss.
+
+        Returns:
+            the entry, or `None` if it isn't in the cache
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+
+            if is_valid is not None and not is_valid(value):
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Add an entry to the cache, evicting the least recently used if full.
+
+        Args:
+            key: the key of the entry
+            value: the value of the entry
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                _ = self._entries.popitem(last=False)
+
+    def setdefault(self, key: K, value: V) -> V:
+        """Add an entry to the cache unless one is already held for the key.
+
+        Unlike `get`, this doesn't count as a hit or a miss.
+
+        Args:
+            key: the key of the entry
+            value: the value to add if the key isn't in the cache
+
+        Returns:
+            the entry held for the key, marked as recently used, otherwise `value`
+        """
+        with self._lock:
+            held = self._entries.get(key)
+            if held is not None:
+                self._entries.move_to_end(key)
+                return held
+
+            self.put(key, value)
+            return value
+
+    def discard(self, key: K) -> None:
+        """Remove an entry from the cache if present.
+
+        Args:
+            key: the key of the entry
+        """
+        with self._lock:
+            _ = self._entries.pop(key, None)
+
+    def discard_where(self, predicate: typing.Callable[[K, V], bool]) -> None:
+        """Remove every entry for which `predicate` returns `True`.
+
+        Args:
+            predicate: a callable receiving the key and value of each entry
+        """
+        with self._lock:
+            for key in [k for k, v in self._entries.items() if predicate(k, v)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return statistics about the cache.
+
+        Returns:
+            the hits, misses, maximum size and current size of the cache
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+
+ParseKey = tuple[typedefs.FileFingerprint, typing.Hashable]
+
+
+class ParseCache(LRUCache[ParseKey, typedefs.ConfigValues]):
+    """A cache of parsed config values keyed by file fingerprint and parser.
+
+    A fingerprint changes whenever its file is modified, replaced or resized, so
+    stale values are never served; they simply age out of the cache.
+
+    Cached values are shared and must never be mutated. Use `utils.copy_values` to
+    obtain a private copy.
+    """
+
+
+parse_cache = ParseCache()
+"""The process-wide `ParseCache` used by `UserConfig`."""
@@ -1,35 +1,359 @@
 """Module to hold the `UserConfig` class definition."""
 
 import pathlib
+import threading
 import typing
 
+from maison import caching
 from maison import config_parser
 from maison import config_validator as validator
 from maison import disk_filesystem
+from maison import environment
 from maison import errors
+from maison import frozen as frozen_values
+from maison import layers as config_layers
+from maison import merging
 from maison import parsers
+from maison import path_index
 from maison import protocols
 from maison import service
+from maison import subscriptions
 from maison import typedefs
+from maison import utils
 
 
-def _bootstrap_service(package_name: str) -> service.ConfigService:
-    _config_parser = config_parser.ConfigParser()
+if typing.TYPE_CHECKING:
+    import asyncio
+
+    from maison import disk_cache as persistent_cache
+    from maison import watcher
+
 
-    pyproject_parser = parsers.PyprojectParser(tool_name=package_name)
-    toml_parser = parsers.TomlParser()
-    ini_parser = parsers.IniParser()
+def _build_config_parser(package_name: str) -> config_parser.ConfigParser:
+    """Build the config parser used by the services.
+
+    The built-in parsers, and those installed as entry points, are only imported
+    when a file they parse is first encountered.
+
+    Args:
+        package_name: the name of the package, to be used to find the right section
+            in the config file
+
+    Returns:
+        the config parser, with the built-in and installed parsers registered
+    """
+    _config_parser = config_parser.ConfigParser()
 
     _config_parser.register_parser(
-        suffix=".toml", parser=pyproject_parser, stem="pyproject"
+        suffix=".toml",
+        parser=config_parser.LazyParser(
+            lambda: parsers.PyprojectParser(
+                tool_name=package_name, loader=parsers.pyproject.loader
+            )
+        ),
+        stem="pyproject",
     )
-    _config_parser.register_parser(suffix=".toml", parser=toml_parser)
-    _config_parser.register_parser(suffix=".ini", parser=ini_parser)
+    _config_parser.register_parser(
+        suffix=".toml", parser=config_parser.LazyParser(lambda: parsers.TomlParser())
+    )
+    _config_parser.register_parser(
+        suffix=".ini", parser=config_parser.LazyParser(lambda: parsers.IniParser())
+    )
+    _config_parser.register_parser(
+        suffix=".json", parser=config_parser.LazyParser(lambda: parsers.JsonParser())
+    )
+    _config_parser.register_entry_points(package_name=package_name)
+
+    return _config_parser
+
+
+def _build_disk_cache(
+    disk_cache: bool,
+) -> typing.Optional["persistent_cache.DiskCache"]:
+    """Build the cache of config values on disk, if enabled.
+
+    The module is only imported when the cache is enabled, as it imports
+    `platformdirs` and `pickle`.
+
+    Args:
+        disk_cache: whether config values should be cached on disk
+
+    Returns:
+        the disk cache, or `None`
+    """
+    if not disk_cache:
+        return None
+
+    from maison import disk_cache as persistent_cache
 
+    return persistent_cache.DiskCache()
+
+
+def bootstrap_service(
+    package_name: str,
+    disk_cache: bool = False,
+    filesystem: typing.Optional[disk_filesystem.DiskFilesystem] = None,
+    max_workers: typing.Optional[int] = None,
+    env_prefix: typing.Optional[str] = None,
+    env_priority: environment.Priority = "highest",
+    merge_strategies: typing.Optional[typing.Mapping[str, merging.Strategy]] = None,
+) -> service.ConfigService:
+    """Build the service used by a `UserConfig`.
+
+    Args:
+        package_name: the name of the package, to be used to find the right section
+            in the config file
+        disk_cache: whether config values should be cached on disk
+        filesystem: an optional filesystem, which may be shared between services
+        max_workers: an optional maximum number of threads with which to read and
+            parse merged config files concurrently
+        env_prefix: an optional prefix of environment variables to read config
+            values from
+        env_priority: whether the environment variables take precedence over the
+            config files, `"highest"`, or the other way round, `"lowest"`
+        merge_strategies: an optional mapping of dotted key paths to the strategies
+            with which to merge the values at them
+
+    Returns:
+        the service
+    """
     return service.ConfigService(
-        filesystem=disk_filesystem.DiskFilesystem(),
-        config_parser=_config_parser,
+        filesystem=filesystem or disk_filesystem.DiskFilesystem(),
+        config_parser=_build_config_parser(package_name=package_name),
         validator=validator.Validator(),
+        parse_cache=caching.parse_cache,
+        disk_cache=_build_disk_cache(disk_cache),
+        max_workers=max_workers,
+        environment=environment.EnvironmentSource(prefix=env_prefix)
+        if env_prefix
+        else None,
+        environment_priority=env_priority,
+        merge_plan=merging.MergePlan(strategies=merge_strategies)
+        if merge_strategies
+        else None,
+    )
+
+
+def bootstrap_async_service(
+    package_name: str,
+    disk_cache: bool = False,
+    filesystem: typing.Optional[disk_filesystem.AsyncDiskFilesystem] = None,
+    env_prefix: typing.Optional[str] = None,
+    env_priority: environment.Priority = "highest",
+    merge_strategies: typing.Optional[typing.Mapping[str, merging.Strategy]] = None,
+) -> service.AsyncConfigService:
+    """Build the service used by an `AsyncUserConfig`.
+
+    Args:
+        package_name: the name of the package, to be used to find the right section
+            in the config file
+        disk_cache: whether config values should be cached on disk
+        filesystem: an optional filesystem, which may be shared between services
+        env_prefix: an optional prefix of environment variables to read config
+            values from
+        env_priority: whether the environment variables take precedence over the
+            config files, `"highest"`, or the other way round, `"lowest"`
+        merge_strategies: an optional mapping of dotted key paths to the strategies
+            with which to merge the values at them
+
+    Returns:
+        the service
+    """
+    return service.AsyncConfigService(
+        filesystem=filesystem or disk_filesystem.AsyncDiskFilesystem(),
+        config_parser=_build_config_parser(package_name=package_name),
+        validator=validator.Validator(),
+        parse_cache=caching.parse_cache,
+        disk_cache=_build_disk_cache(disk_cache),
+        environment=environment.EnvironmentSource(prefix=env_prefix)
+        if env_prefix
+        else None,
+        environment_priority=env_priority,
+        merge_plan=merging.MergePlan(strategies=merge_strategies)
+        if merge_strategies
+        else None,
+    )
+
+
+def _get_fingerprints(
+    layers: typing.Iterable[typedefs.ConfigLayer],
+) -> tuple[typedefs.FileFingerprint, ...]:
+    """Get the fingerprints of the files behind some config layers.
+
+    Args:
+        layers: the config layers
+
+    Returns:
+        the fingerprint of each layer
+    """
+    return tuple(layer.fingerprint for layer in layers)
+
+
+def _copy_values(values: typedefs.ConfigValues, frozen: bool) -> typedefs.ConfigValues:
+    """Copy merged config values for a config to hand out.
+
+    Args:
+        values: the merged values, which share subtrees with the layers
+        frozen: whether to freeze the copy
+
+    Returns:
+        a mutable copy of the values, or a `FrozenDict` of them if `frozen`
+    """
+    if frozen:
+        return typing.cast("typedefs.ConfigValues", frozen_values.FrozenDict(values))
+    return utils.copy_values(values)
+
+
+def _values_differ(old: typedefs.ConfigValues, new: typedefs.ConfigValues) -> bool:
+    """Return whether config values differ.
+
+    Args:
+        old: the old values
+        new: the new values, either of which may be frozen
+
+    Returns:
+        whether the values differ, lists being equal to the tuples which replace
+        them in frozen values
+    """
+    if old is new or old == new:
+        return False
+    if isinstance(old, frozen_values.FrozenDict) or isinstance(
+        new, frozen_values.FrozenDict
+    ):
+        return frozen_values.FrozenDict(old) != frozen_values.FrozenDict(new)
+    return True
+
+
+def _dispatch(
+    config_subscriptions: subscriptions.Subscriptions,
+    previous: "_Snapshot",
+    snapshot: "_Snapshot",
+    frozen: bool,
+) -> None:
+    """Notify subscribers of the changes between two snapshots.
+
+    The merged values are shared with the parse cache, so subscribers are given
+    copies of the values at their key paths, which they can't corrupt it through.
+    The values themselves are diffed, so that the subtrees they share are skipped.
+
+    Args:
+        config_subscriptions: the subscriptions
+        previous: the snapshot being replaced
+        snapshot: the snapshot replacing it
+        frozen: whether to give subscribers frozen values rather than copies
+    """
+    if not config_subscriptions:
+        return
+
+    old, new = previous.current_values, snapshot.current_values
+    if isinstance(old, frozen_values.FrozenDict) != isinstance(
+        new, frozen_values.FrozenDict
+    ):
+        # values set on a frozen config hold tuples where the files have lists
+        old, new = frozen_values.FrozenDict(old), frozen_values.FrozenDict(new)
+
+    config_subscriptions.dispatch(
+        old, new, copy=frozen_values.freeze_value if frozen else utils.copy_value
+    )
+
+
+class _Snapshot(typing.NamedTuple):
+    """The result of loading a config, replaced as a whole on reload."""
+
+    discovered_paths: tuple[pathlib.Path, ...]
+    stack: config_layers.LayerStack
+    fingerprint: str
+    # a copy of the merged values, or `None` until they are first read
+    values: typing.Optional[typedefs.ConfigValues]
+    # whether the values were set rather than copied from the merged values
+    overridden: bool = False
+    # the index of the values, or `None` until it is first used
+    index: typing.Optional[path_index.PathIndex] = None
+    generation: int = 0
+    # the snapshot the generation is counted from, or `None` once it's resolved
+    base: typing.Optional["_Snapshot"] = None
+
+    @property
+    def current_values(self) -> typedefs.ConfigValues:
+        """Return the values which were set, or else the merged values.
+
+        Returns:
+            the values, which must not be mutated
+        """
+        if self.overridden and self.values is not None:
+            return self.values
+        return self.stack.values
+
+    def override(self, values: typedefs.ConfigValues) -> "_Snapshot":
+        """Replace the values.
+
+        Args:
+            values: the new values
+
+        Returns:
+            a new snapshot, whose generation is bumped if the values differ
+        """
+        snapshot = self.resolve()
+        return snapshot._replace(
+            values=values,
+            overridden=True,
+            index=None,
+            generation=snapshot.generation
+            + _values_differ(snapshot.current_values, values),
+        )
+
+    def follow(self, previous: "_Snapshot") -> "_Snapshot":
+        """Carry the generation of the snapshot this one replaces over.
+
+        The values aren't compared until the generation is resolved, so that
+        reloading a config which is only read through its view doesn't merge them.
+
+        Args:
+            previous: the snapshot this one replaces
+
+        Returns:
+            this snapshot, with a generation to resolve against the previous
+            snapshot's, or the one it has yet to be resolved against
+        """
+        base = previous if previous.base is None else previous.base
+        return self._replace(generation=base.generation, base=base)
+
+    def resolve(self) -> "_Snapshot":
+        """Bump the generation if the values differ from those it's counted from.
+
+        Returns:
+            this snapshot, with its generation resolved
+        """
+        if self.base is None:
+            return self
+        changed = _values_differ(self.base.current_values, self.current_values)
+        return self._replace(generation=self.base.generation + changed, base=None)
+
+
+def _may_differ(previous: _Snapshot, snapshot: _Snapshot) -> bool:
+    """Return whether a reload found other files or changed the values.
+
+    Only the layers of the files which changed are compared, so the values aren't
+    merged unless values had been set.
+
+    Args:
+        previous: the snapshot being replaced
+        snapshot: the snapshot replacing it
+
+    Returns:
+        whether other files were found, or the values of a file or the values which
+        had been set differ
+    """
+    if snapshot.discovered_paths != previous.discovered_paths:
+        return True
+    if previous.overridden:
+        return _values_differ(previous.current_values, snapshot.current_values)
+
+    old_layers, new_layers = previous.stack.layers, snapshot.stack.layers
+    return len(old_layers) != len(new_layers) or any(
+        old.path != new.path
+        or (old.fingerprint != new.fingerprint and old.values != new.values)
+        for old, new in zip(old_layers, new_layers)
     )
 
 
@@ -43,6 +367,14 @@ class UserConfig:
         source_files: typing.Optional[list[str]] = None,
         schema: typing.Optional[type[protocols.IsSchema]] = None,
         merge_configs: bool = False,
+        disk_cache: bool = False,
+        lazy: bool = False,
+        max_workers: typing.Optional[int] = None,
+        env_prefix: typing.Optional[str] = None,
+        env_priority: environment.Priority = "highest",
+        merge_strategies: typing.Optional[typing.Mapping[str, merging.Strategy]] = None,
+        frozen: bool = False,
+        config_service: typing.Optional[service.ConfigService] = None,
     ) -> None:
         """Initialize the config.
 
@@ -56,23 +388,51 @@ class UserConfig:
             schema: an optional `pydantic` model to define the config schema
             merge_configs: an optional boolean to determine whether configs should be
                 merged if multiple are found
+            disk_cache: an optional boolean to determine whether config values
+                should be cached on disk in the user's cache directory, so that
+                later processes reading the same unchanged files can skip parsing them
+            lazy: an optional boolean to determine whether finding and parsing the
+                config files should be deferred until the config is first read
+            max_workers: an optional maximum number of threads with which to read
+                and parse the config files concurrently when `merge_configs` is
+                `True`, which helps when they are on slow storage. The files are
+                merged in the same order either way.
+            env_prefix: an optional prefix of environment variables to read config
+                values from. For example with `"ACME"`, `ACME__DB__POOL_SIZE=20`
+                gives `{"db": {"pool_size": 20}}`.
+            env_priority: whether the environment variables take precedence over
+                the config files, `"highest"`, or the other way round, `"lowest"`
+            merge_strategies: an optional mapping of dotted key paths to the
+                strategies with which to merge the values at them when
+                `merge_configs` is `True`, e.g. `{"plugins": "append"}`. See
+                `maison.merging.MergePlan`.
+            frozen: an optional boolean to determine whether `values` should be a
+                read-only, hashable `FrozenDict`, in which lists are tuples. It can
+                be shared between threads without copying and used as a cache key.
+            config_service: an optional service to find, parse and validate the
+                config with, which may be shared between configs. If provided,
+                `disk_cache`, `max_workers`, `merge_strategies` and the `env_`
+                arguments are ignored.
         """
         self.source_files = source_files or ["pyproject.toml"]
         self.starting_path = starting_path
         self.merge_configs = merge_configs
         self._schema = schema
+        self._package_name = package_name
+        self._disk_cache = disk_cache
+        self._max_workers = max_workers
+        self._env_prefix = env_prefix
+        self._env_priority = env_priority
+        self._merge_strategies = merge_strategies
+        self._frozen = frozen
 
-        self._service = _bootstrap_service(package_name=package_name)
-
-        _sources = self._service.find_configs(
-            source_files=self.source_files,
-            starting_path=starting_path,
-        )
+        self._lock = threading.RLock()
+        self._service_instance = config_service
+        self._snapshot: typing.Optional[_Snapshot] = None
+        self._subscriptions = subscriptions.Subscriptions()
 
-        self._values = self._service.get_config_values(
-            config_file_paths=_sources,
-            merge_configs=merge_configs,
-        )
+        if not lazy:
+            self._load()
 
     def __str__(self) -> str:
         """Return the __str__.
@@ -89,26 +449,309 @@ class UserConfig:
         Returns:
             the user's configuration values
         """
-        return self._values
+        snapshot = self._load()
+        if snapshot.values is not None:
+            return snapshot.values
+
+        with self._lock:
+            snapshot = self._load()
+            if snapshot.values is not None:
+                return snapshot.values
+
+            values = _copy_values(snapshot.stack.values, frozen=self._frozen)
+            self._snapshot = snapshot._replace(values=values)
+            return values
 
     @values.setter
     def values(self, values: typedefs.ConfigValues) -> None:
-        """Set the user's configuration values."""
-        self._values = values
+        """Set the user's configuration values, which are frozen if `frozen`."""
+        if self._frozen:
+            values = _copy_values(values, frozen=True)
+        with self._lock:
+            self._snapshot = self._load().override(values)
+
+    @property
+    def view(self) -> merging.LayeredView:
+        """Return a read-only view of the config values, merged as they're read.
+
+        Unlike `values`, the config files are never merged as a whole: each key is
+        merged from the files which have it when it's first read, and the result
+        cached until the config is reloaded. This saves work when only a few keys
+        of a large config are read. Values set since loading, including by
+        `validate`, aren't reflected.
+
+        Returns:
+            a mapping of the config values, which must not be mutated
+        """
+        return self._load().stack.view
+
+    @property
+    def fingerprint(self) -> str:
+        """Return a digest identifying the loaded config.
+
+        The digest is computed once per load, from the fingerprints of the config
+        files, or of the environment variables, together with how they were parsed
+        and merged. It changes whenever one of them is modified, even if the values
+        don't, and doesn't reflect values set since loading.
+
+        Returns:
+            a hex digest, which is the same for the same files parsed and merged the
+            same way
+        """
+        return self._load().fingerprint
+
+    @property
+    def generation(self) -> int:
+        """Return the number of times the values have changed.
+
+        The generation starts at 0 and only increases when reloading, or setting
+        the values, changes them. The values are only compared when the generation
+        is next read, so reloading doesn't merge them, and changes undone before then
+        aren't counted.
+
+        Returns:
+            the generation of the values
+        """
+        snapshot = self._load()
+        if snapshot.base is not None:
+            with self._lock:
+                snapshot = self._snapshot = self._load().resolve()
+        return snapshot.generation
+
+    def get(self, key_path: str, default: typing.Any = None) -> typing.Any:
+        """Get the value at a dotted key path.
+
+        The values are indexed by key path on first use after each load, so a
+        lookup is a single dict lookup whatever the depth of the path. Values
+        mutated in place since aren't reflected, unlike values which are set.
+
+        Args:
+            key_path: a dotted key path, e.g. `"db.pool.size"`
+            default: the value to return if there is none at the key path
+
+        Returns:
+            the value at the key path, or the default
+        """
+        return self._get_index().get(key_path, default)
+
+    def select(self, pattern: str) -> dict[str, typing.Any]:
+        """Get the values at the dotted key paths matching a pattern.
+
+        Args:
+            pattern: a dotted key path in which `*` matches any single key, e.g.
+                `"db.*"` or `"services.*.port"`
+
+        Returns:
+            the matching dotted key paths and their values
+        """
+        return self._get_index().select(pattern)
+
+    def _get_index(self) -> path_index.PathIndex:
+        """Get the index of the values, building it if needed.
+
+        Returns:
+            the index
+        """
+        index = self._load().index
+        if index is None:
+            with self._lock:
+                values = self.values
+                snapshot = self._load()
+                index = snapshot.index
+                if index is None:
+                    index = path_index.PathIndex(values)
+                    self._snapshot = snapshot._replace(index=index)
+        return index
 
     @property
-    def discovered_paths(self) -> list[pathlib.Path]:
-        """Return a list of the paths to the config sources found on the filesystem.
+    def _service(self) -> service.ConfigService:
+        """Return the service, bootstrapping it on first use.
+
+        Returns:
+            the service
+        """
+        if self._service_instance is None:
+            with self._lock:
+                if self._service_instance is None:
+                    self._service_instance = bootstrap_service(
+                        package_name=self._package_name,
+                        disk_cache=self._disk_cache,
+                        max_workers=self._max_workers,
+                        env_prefix=self._env_prefix,
+                        env_priority=self._env_priority,
+                        merge_strategies=self._merge_strategies,
+                    )
+        return self._service_instance
+
+    def _load(self) -> _Snapshot:
+        """Find and parse the config files unless that has already been done.
 
         Returns:
-            a list of the paths to the config sources
+            the loaded snapshot
         """
-        return list(
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = self._build_snapshot()
+        return snapshot
+
+    def _build_snapshot(self, previous: typing.Optional[_Snapshot] = None) -> _Snapshot:
+        """Find and parse the config files.
+
+        Args:
+            previous: an optional earlier snapshot whose layers are reused for the
+                files which haven't changed since
+
+        Returns:
+            a new snapshot
+        """
+        discovered_paths = tuple(
             self._service.find_configs(
                 source_files=self.source_files,
                 starting_path=self.starting_path,
             )
         )
+        layers = self._service.get_config_layers(
+            config_file_paths=discovered_paths,
+            merge_configs=self.merge_configs,
+            previous_layers=previous.stack.layers if previous else (),
+        )
+
+        if previous and _get_fingerprints(previous.stack.layers) == _get_fingerprints(
+            layers
+        ):
+            return previous._replace(discovered_paths=discovered_paths)
+
+        stack = self._service.merge_layers(
+            layers=layers, previous=previous.stack if previous else None
+        )
+        return _Snapshot(
+            discovered_paths=discovered_paths,
+            stack=stack,
+            fingerprint=self._service.get_fingerprint(layers=stack.layers),
+            values=None,
+        )
+
+    def reload(self) -> None:
+        """Find and parse the config files again, discarding any values set since."""
+        with self._lock:
+            previous = self._snapshot
+            snapshot = self._build_snapshot()
+            if previous is None:
+                self._snapshot = snapshot
+                return
+
+            self._snapshot = snapshot.follow(previous)
+            _dispatch(self._subscriptions, previous, snapshot, frozen=self._frozen)
+
+    def refresh_if_changed(self) -> bool:
+        """Reload the config if any of its files has changed.
+
+        The config files are found again, which only stats the directories that were
+        searched if the discovery cache is in use, and each found file is stat'ed.
+        Only new or modified files are parsed, and only their values are compared
+        with what they were, so the values aren't merged again until they're read.
+
+        Returns:
+            whether the found config files, or the values of any of them, changed
+        """
+        with self._lock:
+            previous = self._load()
+            snapshot = self._build_snapshot(previous=previous)
+
+            if snapshot.discovered_paths == previous.discovered_paths and (
+                snapshot.stack is previous.stack
+            ):
+                return False
+
+            self._snapshot = snapshot.follow(previous)
+            _dispatch(self._subscriptions, previous, snapshot, frozen=self._frozen)
+            return _may_differ(previous, snapshot)
+
+    def subscribe(
+        self, key_path: str, callback: subscriptions.Callback
+    ) -> typing.Callable[[], None]:
+        """Subscribe to changes to part of the config when it's reloaded.
+
+        When the config is reloaded, by `reload`, `refresh_if_changed` or a watcher,
+        the old and new values are diffed once and only the callables subscribed to
+        a key path at, below or above a change are called.
+
+        Args:
+            key_path: a dotted key path, e.g. `"db.pool"`, or an empty string for
+                the whole config
+            callback: a callable to call with the old and new values at the key
+                path, either of which is `None` if there is no value there
+
+        Returns:
+            a callable which unsubscribes the callable
+        """
+        return self._subscriptions.subscribe(key_path=key_path, callback=callback)
+
+    def watch(
+        self,
+        callback: typing.Optional["watcher.Callback"] = None,
+        debounce: float = 0.1,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> "watcher.ConfigWatcher":
+        """Watch the config files and reload the config whenever they change.
+
+        The directories in which config files are searched for are watched too, so a
+        config file which appears with a higher priority is picked up.
+
+        Args:
+            callback: an optional callable to call with the new values whenever they
+                change. More can be added with `ConfigWatcher.subscribe`.
+            debounce: how long to wait for a burst of changes to settle before
+                reloading, in seconds
+            poll_interval: how often to check for changes when inotify isn't
+                available, in seconds
+            use_inotify: whether to use inotify on Linux rather than polling
+
+        Returns:
+            the started watcher, which can also be iterated over asynchronously
+        """
+        from maison import watcher
+
+        def _get_targets() -> watcher.Targets:
+            return watcher.get_watch_targets(
+                source_files=self.source_files,
+                starting_path=self.starting_path,
+                discovered_paths=self.discovered_paths,
+            )
+
+        directories, names = _get_targets()
+        config_watcher = watcher.ConfigWatcher(
+            refresh=self.refresh_if_changed,
+            get_values=lambda: self.values,
+            directories=directories,
+            names=names,
+            debounce=debounce,
+            poll_interval=poll_interval,
+            use_inotify=use_inotify,
+            get_targets=_get_targets,
+        )
+
+        if callback is not None:
+            config_watcher.subscribe(callback)
+
+        _ = self._load()
+        config_watcher.start()
+        return config_watcher
+
+    @property
+    def discovered_paths(self) -> tuple[pathlib.Path, ...]:
+        """Return the paths to the config sources found on the filesystem.
+
+        The paths are found once per load, see `reload`.
+
+        Returns:
+            a tuple of the paths to the config sources
+        """
+        return self._load().discovered_paths
 
     @property
     def path(self) -> typing.Optional[typing.Union[pathlib.Path, list[pathlib.Path]]]:
@@ -119,13 +762,15 @@ class UserConfig:
             sources if `merge_configs` is `True`, or the path to the active config
             source if `False`
         """
-        if len(self.discovered_paths) == 0:
+        discovered_paths = self.discovered_paths
+
+        if len(discovered_paths) == 0:
             return None
 
         if self.merge_configs:
-            return self.discovered_paths
+            return list(discovered_paths)
 
-        return self.discovered_paths[0]
+        return discovered_paths[0]
 
     @property
     def schema(self) -> typing.Optional[type[protocols.IsSchema]]:
@@ -193,3 +838,333 @@ class UserConfig:
             self.values = validated_values
 
         return self.values
+
+
+class AsyncUserConfig:
+    """Model the user configuration, loaded without blocking the event loop.
+
+    Create one with `await AsyncUserConfig.load(...)`, or instantiate it and await
+    `reload` before reading it.
+    """
+
+    def __init__(
+        self,
+        package_name: str,
+        starting_path: typing.Optional[pathlib.Path] = None,
+        source_files: typing.Optional[list[str]] = None,
+        schema: typing.Optional[type[protocols.IsSchema]] = None,
+        merge_configs: bool = False,
+        disk_cache: bool = False,
+        env_prefix: typing.Optional[str] = None,
+        env_priority: environment.Priority = "highest",
+        merge_strategies: typing.Optional[typing.Mapping[str, merging.Strategy]] = None,
+        frozen: bool = False,
+        config_service: typing.Optional[service.AsyncConfigService] = None,
+    ) -> None:
+        """Initialize the config, without loading it.
+
+        Args:
+            package_name: the name of the package, to be used to find the right section
+                in the config file
+            starting_path: an optional starting path to start the search for config
+                file
+            source_files: an optional list of source config filenames or absolute paths
+                to search for. If none is provided then `pyproject.toml` will be used.
+            schema: an optional `pydantic` model to define the config schema
+            merge_configs: an optional boolean to determine whether configs should be
+                merged if multiple are found
+            disk_cache: an optional boolean to determine whether config values
+                should be cached on disk in the user's cache directory
+            env_prefix: an optional prefix of environment variables to read config
+                values from
+            env_priority: whether the environment variables take precedence over
+                the config files, `"highest"`, or the other way round, `"lowest"`
+            merge_strategies: an optional mapping of dotted key paths to the
+                strategies with which to merge the values at them
+            frozen: an optional boolean to determine whether `values` should be a
+                read-only, hashable `FrozenDict`
+            config_service: an optional service to find, parse and validate the
+                config with, which may be shared between configs. If provided,
+                `disk_cache`, `merge_strategies` and the `env_` arguments are
+                ignored.
+        """
+        self.source_files = source_files or ["pyproject.toml"]
+        self.starting_path = starting_path
+        self.merge_configs = merge_configs
+        self._schema = schema
+        self._frozen = frozen
+
+        self._service = config_service or bootstrap_async_service(
+            package_name=package_name,
+            disk_cache=disk_cache,
+            env_prefix=env_prefix,
+            env_priority=env_priority,
+            merge_strategies=merge_strategies,
+        )
+        self._lock: typing.Optional[asyncio.Lock] = None
+        self._snapshot: typing.Optional[_Snapshot] = None
+        self._subscriptions = subscriptions.Subscriptions()
+
+    @classmethod
+    async def load(
+        cls,
+        package_name: str,
+        starting_path: typing.Optional[pathlib.Path] = None,
+        source_files: typing.Optional[list[str]] = None,
+        schema: typing.Optional[type[protocols.IsSchema]] = None,
+        merge_configs: bool = False,
+        disk_cache: bool = False,
+        env_prefix: typing.Optional[str] = None,
+        env_priority: environment.Priority = "highest",
+        merge_strategies: typing.Optional[typing.Mapping[str, merging.Strategy]] = None,
+        frozen: bool = False,
+        config_service: typing.Optional[service.AsyncConfigService] = None,
+    ) -> "AsyncUserConfig":
+        """Create and load a config.
+
+        See `AsyncUserConfig.__init__` for the arguments.
+
+        Returns:
+            the loaded config
+        """
+        user_config = cls(
+            package_name=package_name,
+            starting_path=starting_path,
+            source_files=source_files,
+            schema=schema,
+            merge_configs=merge_configs,
+            disk_cache=disk_cache,
+            env_prefix=env_prefix,
+            env_priority=env_priority,
+            merge_strategies=merge_strategies,
+            frozen=frozen,
+            config_service=config_service,
+        )
+        await user_config.reload()
+        return user_config
+
+    def __str__(self) -> str:
+        """Return the __str__.
+
+        Returns:
+            the string representation
+        """
+        return f"<class '{self.__class__.__name__}'>"
+
+    @property
+    def _loaded(self) -> _Snapshot:
+        """Return the loaded snapshot.
+
+        Returns:
+            the loaded snapshot
+
+        Raises:
+            NotLoadedError: when the config hasn't been loaded yet
+        """
+        if self._snapshot is None:
+            raise errors.NotLoadedError
+        return self._snapshot
+
+    @property
+    def values(self) -> typedefs.ConfigValues:
+        """Return the user's configuration values.
+
+        Returns:
+            the user's configuration values
+        """
+        snapshot = self._loaded
+        if snapshot.values is not None:
+            return snapshot.values
+
+        values = _copy_values(snapshot.stack.values, frozen=self._frozen)
+        self._snapshot = snapshot._replace(values=values)
+        return values
+
+    @values.setter
+    def values(self, values: typedefs.ConfigValues) -> None:
+        """Set the user's configuration values, which are frozen if `frozen`."""
+        if self._frozen:
+            values = _copy_values(values, frozen=True)
+        self._snapshot = self._loaded.override(values)
+
+    @property
+    def view(self) -> merging.LayeredView:
+        """See `UserConfig.view`."""
+        return self._loaded.stack.view
+
+    @property
+    def fingerprint(self) -> str:
+        """See `UserConfig.fingerprint`."""
+        return self._loaded.fingerprint
+
+    @property
+    def generation(self) -> int:
+        """See `UserConfig.generation`."""
+        snapshot = self._snapshot = self._loaded.resolve()
+        return snapshot.generation
+
+    def get(self, key_path: str, default: typing.Any = None) -> typing.Any:
+        """See `UserConfig.get`."""
+        return self._get_index().get(key_path, default)
+
+    def select(self, pattern: str) -> dict[str, typing.Any]:
+        """See `UserConfig.select`."""
+        return self._get_index().select(pattern)
+
+    def _get_index(self) -> path_index.PathIndex:
+        """See `UserConfig._get_index`."""
+        values = self.values
+        snapshot = self._loaded
+        if snapshot.index is None:
+            index = path_index.PathIndex(values)
+            self._snapshot = snapshot._replace(index=index)
+            return index
+        return snapshot.index
+
+    async def _build_snapshot(
+        self, previous: typing.Optional[_Snapshot] = None
+    ) -> _Snapshot:
+        """See `UserConfig._build_snapshot`."""
+        discovered_paths = tuple(
+            await self._service.find_configs(
+                source_files=self.source_files,
+                starting_path=self.starting_path,
+            )
+        )
+        layers = await self._service.get_config_layers(
+            config_file_paths=discovered_paths,
+            merge_configs=self.merge_configs,
+            previous_layers=previous.stack.layers if previous else (),
+        )
+
+        if previous and _get_fingerprints(previous.stack.layers) == _get_fingerprints(
+            layers
+        ):
+            return previous._replace(discovered_paths=discovered_paths)
+
+        stack = self._service.merge_layers(
+            layers=layers, previous=previous.stack if previous else None
+        )
+        return _Snapshot(
+            discovered_paths=discovered_paths,
+            stack=stack,
+            fingerprint=self._service.get_fingerprint(layers=stack.layers),
+            values=None,
+        )
+
+    def _get_lock(self) -> "asyncio.Lock":
+        """Return the lock serializing loads, created in the running event loop.
+
+        Returns:
+            the lock
+        """
+        import asyncio
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def reload(self) -> None:
+        """Find and parse the config files again, discarding any values set since."""
+        async with self._get_lock():
+            previous = self._snapshot
+            snapshot = await self._build_snapshot()
+            if previous is None:
+                self._snapshot = snapshot
+                return
+
+            self._snapshot = snapshot.follow(previous)
+            _dispatch(self._subscriptions, previous, snapshot, frozen=self._frozen)
+
+    async def refresh_if_changed(self) -> bool:
+        """Reload the config if any of its files has changed.
+
+        See `UserConfig.refresh_if_changed`.
+
+        Returns:
+            whether the found config files, or the values of any of them, changed
+        """
+        async with self._get_lock():
+            previous = self._snapshot
+            if previous is None:
+                self._snapshot = await self._build_snapshot()
+                return True
+
+            snapshot = await self._build_snapshot(previous=previous)
+
+            if snapshot.discovered_paths == previous.discovered_paths and (
+                snapshot.stack is previous.stack
+            ):
+                return False
+
+            self._snapshot = snapshot.follow(previous)
+            _dispatch(self._subscriptions, previous, snapshot, frozen=self._frozen)
+            return _may_differ(previous, snapshot)
+
+    def subscribe(
+        self, key_path: str, callback: subscriptions.Callback
+    ) -> typing.Callable[[], None]:
+        """See `UserConfig.subscribe`."""
+        return self._subscriptions.subscribe(key_path=key_path, callback=callback)
+
+    @property
+    def discovered_paths(self) -> tuple[pathlib.Path, ...]:
+        """Return the paths to the config sources found on the filesystem.
+
+        Returns:
+            a tuple of the paths to the config sources
+        """
+        return self._loaded.discovered_paths
+
+    @property
+    def path(self) -> typing.Optional[typing.Union[pathlib.Path, list[pathlib.Path]]]:
+        """See `UserConfig.path`."""
+        discovered_paths = self.discovered_paths
+
+        if len(discovered_paths) == 0:
+            return None
+
+        if self.merge_configs:
+            return list(discovered_paths)
+
+        return discovered_paths[0]
+
+    @property
+    def schema(self) -> typing.Optional[type[protocols.IsSchema]]:
+        """Return the schema.
+
+        Returns:
+            the schema
+        """
+        return self._schema
+
+    @schema.setter
+    def schema(self, schema: type[protocols.IsSchema]) -> None:
+        """Set the schema."""
+        self._schema = schema
+
+    def validate(
+        self,
+        schema: typing.Optional[type[protocols.IsSchema]] = None,
+        use_schema_values: bool = True,
+    ) -> typedefs.ConfigValues:
+        """See `UserConfig.validate`.
+
+        Raises:
+            NoSchemaError: when validation is attempted but no schema has been provided
+        """
+        selected_schema: typing.Union[type[protocols.IsSchema], None] = (
+            schema or self.schema
+        )
+
+        if not selected_schema:
+            raise errors.NoSchemaError
+
+        validated_values = self._service.validate_config(
+            values=self.values, schema=selected_schema
+        )
+
+        if use_schema_values:
+            self.values = validated_values
+
+        return self.values
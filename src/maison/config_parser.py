@@ -1,23 +1,32 @@
 """Holds the tools for parsing a config."""
 
+import functools
 import pathlib
+import sys
+import threading
 import typing
 
 from maison import errors
 from maison import typedefs
 
 
+if typing.TYPE_CHECKING:
+    import importlib.metadata
+
+
 ParserDictKey = tuple[str, typing.Union[str, None]]
 
+ENTRY_POINT_GROUP = "maison.parsers"
+
 
 class Parser(typing.Protocol):
     """Defines the interface for a `Parser` class that's used to parse a config."""
 
-    def parse_config(self, file: typing.BinaryIO) -> typedefs.ConfigValues:
+    def parse_config(self, data: bytes) -> typedefs.ConfigValues:
         """Parse a config.
 
         Args:
-            file: the binary stream of the config file
+            data: the contents of the config file
 
         Returns:
             the parsed config
@@ -25,12 +34,96 @@ class Parser(typing.Protocol):
         ...
 
 
+class LazyParser:
+    """A parser which is only created when a file is first parsed with it.
+
+    This defers importing the module of a parser, and whatever it depends on, until
+    a file that needs it is encountered.
+
+    Implements the `Parser` protocol
+    """
+
+    def __init__(self, factory: typing.Callable[[], Parser]) -> None:
+        """Instantiate the class.
+
+        Args:
+            factory: a callable which creates the parser
+        """
+        self._factory = factory
+        self._parser: typing.Optional[Parser] = None
+        self._lock = threading.Lock()
+
+    @property
+    def parser(self) -> Parser:
+        """Return the parser, creating it on first use.
+
+        Returns:
+            the parser
+        """
+        if self._parser is None:
+            with self._lock:
+                if self._parser is None:
+                    self._parser = self._factory()
+        return self._parser
+
+    @property
+    def cache_key(self) -> typing.Optional[typing.Hashable]:
+        """Return the cache key of the parser, if it has one.
+
+        Returns:
+            the cache key of the parser, or `None`
+        """
+        cache_key: typing.Optional[typing.Hashable] = getattr(
+            self.parser, "cache_key", None
+        )
+        return cache_key
+
+    def parse_config(self, data: bytes) -> typedefs.ConfigValues:
+        """See `Parser.parse_config`."""
+        return self.parser.parse_config(data)
+
+
+@functools.cache
+def _get_entry_points(group: str) -> tuple["importlib.metadata.EntryPoint", ...]:
+    """Get the installed entry points of a group, scanning the installed packages once.
+
+    Args:
+        group: the name of the group
+
+    Returns:
+        the entry points
+    """
+    import importlib.metadata
+
+    if sys.version_info >= (3, 10):
+        return tuple(importlib.metadata.entry_points(group=group))
+    return tuple(importlib.metadata.entry_points().get(group, ()))
+
+
+def _get_parser_key(name: str) -> ParserDictKey:
+    """Get the suffix and stem a parser entry point is registered for.
+
+    Args:
+        name: the name of the entry point, either a suffix such as `.json` or a file
+            name such as `package.json`
+
+    Returns:
+        the suffix and the optional stem
+    """
+    if name.startswith("."):
+        return name, None
+    path = pathlib.PurePath(name)
+    return path.suffix, path.stem
+
+
 class ConfigParser:
     """A utility class used to parse a config."""
 
     def __init__(self) -> None:
         """Instantiate the class."""
         self._parsers: dict[ParserDictKey, Parser] = {}
+        self._pending_entry_points: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
 
     def register_parser(
         self,
@@ -42,22 +135,134 @@ class ConfigParser:
         key = (suffix, stem)
         self._parsers[key] = parser
 
+    def register_entry_points(
+        self, package_name: str, group: str = ENTRY_POINT_GROUP, replace: bool = False
+    ) -> None:
+        """Register the parsers installed as entry points.
+
+        Each entry point is named after the suffix of the files it parses, e.g.
+        `.json`, or after a whole file name, e.g. `package.json`, to restrict it to
+        a stem. It refers to a callable which takes the `package_name` keyword
+        argument and returns a parser. Nothing is imported until a file with a
+        matching suffix is parsed.
+
+        Scanning the installed packages for entry points is slow, so by default it
+        is put off until a file without a parser registered for its suffix and stem
+        is parsed, e.g. `acme.json` but not `pyproject.toml`. The entry points then
+        only add parsers for the suffixes and stems which have none, so a plugin
+        named `.json` doesn't replace the built-in parser but one named
+        `acme.json` is used for `acme.json` files.
+
+        Args:
+            package_name: the name of the package whose config is parsed
+            group: the entry point group to look in
+            replace: whether to scan the entry points at once and let them replace
+                the parsers registered for the same suffix and stem
+        """
+        if replace:
+            self._register_entry_points(package_name, group, replace=True)
+        else:
+            with self._lock:
+                self._pending_entry_points.append((package_name, group))
+
     def parse_config(
         self,
         file_path: pathlib.Path,
-        file: typing.BinaryIO,
+        data: bytes,
     ) -> typedefs.ConfigValues:
         """See `Parser.parse_config`."""
+        return self._get_parser(file_path).parse_config(data)
+
+    def get_cache_key(
+        self, file_path: pathlib.Path
+    ) -> typing.Optional[typing.Hashable]:
+        """See `protocols.ConfigParser.get_cache_key`.
+
+        Parsers opt in to caching by exposing a hashable `cache_key` attribute.
+        """
+        parser = self._get_parser(file_path)
+        cache_key: typing.Optional[typing.Hashable] = getattr(parser, "cache_key", None)
+        return cache_key
+
+    def _register_entry_points(
+        self, package_name: str, group: str, replace: bool
+    ) -> None:
+        """Register the parsers installed as entry points.
+
+        Args:
+            package_name: the name of the package whose config is parsed
+            group: the entry point group to look in
+            replace: whether to replace the parsers registered for the same suffix
+                and stem, rather than only fill in those which aren't registered
+        """
+        for entry_point in _get_entry_points(group):
+
+            def _create_parser(
+                entry_point: "importlib.metadata.EntryPoint" = entry_point,
+            ) -> Parser:
+                factory: typing.Callable[..., Parser] = entry_point.load()
+                return factory(package_name=package_name)
+
+            suffix, stem = _get_parser_key(entry_point.name)
+            if not replace and (suffix, stem) in self._parsers:
+                continue
+
+            self.register_parser(
+                suffix=suffix, parser=LazyParser(_create_parser), stem=stem
+            )
+
+    def _register_pending_entry_points(self) -> None:
+        """Register the parsers installed as entry points, if not done yet."""
+        with self._lock:
+            pending, self._pending_entry_points = self._pending_entry_points, []
+            for package_name, group in pending:
+                self._register_entry_points(package_name, group, replace=False)
+
+    def _find_parser(self, file_path: pathlib.Path) -> typing.Optional[Parser]:
+        """Find the parser registered for a file.
+
+        Args:
+            file_path: the path to the config file
+
+        Returns:
+            the parser registered for the suffix and stem of the file, falling back to
+            the parser registered for the suffix alone, or `None`
+        """
         key: ParserDictKey
 
         # First try (suffix, stem)
         key = (file_path.suffix, file_path.stem)
         if key in self._parsers:
-            return self._parsers[key].parse_config(file)
+            return self._parsers[key]
 
         # Then fallback to (suffix, None)
         key = (file_path.suffix, None)
-        if key in self._parsers:
-            return self._parsers[key].parse_config(file)
+        return self._parsers.get(key)
+
+    def _get_parser(self, file_path: pathlib.Path) -> Parser:
+        """Get the parser registered for a file.
+
+        The parsers installed as entry points are registered when a file without a
+        parser registered for its suffix and stem is first encountered, as one of
+        them may be.
+
+        Args:
+            file_path: the path to the config file
+
+        Returns:
+            the parser registered for the suffix and stem of the file, falling back to
+            the parser registered for the suffix alone
+
+        Raises:
+            UnsupportedConfigError: when no parser is registered for the file
+        """
+        if (
+            self._pending_entry_points
+            and (file_path.suffix, file_path.stem) not in self._parsers
+        ):
+            self._register_pending_entry_points()
 
-        raise errors.UnsupportedConfigError(f"No parser registered for {file_path}")
+        parser = self._find_parser(file_path)
+        if parser is None:
+            raise errors.UnsupportedConfigError(f"No parser registered for {file_path}")
+        return parser
@@ -0,0 +1,150 @@
+"""Holds a cache of config values which persists on disk between processes."""
+
+import contextlib
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import typing
+
+import platformdirs
+
+from maison import typedefs
+
+
+_FORMAT_VERSION = 1
+_ENTRY_SUFFIX = ".pickle"
+
+
+class DiskCache:
+    """A size-bounded cache of config values stored in the user's cache directory.
+
+    Entries are addressed by a digest of their key, written atomically and evicted
+    least recently used first once the cache grows beyond its bounds. The cache is
+    best effort: any entry which can't be read or written is treated as a miss.
+    """
+
+    def __init__(
+        self,
+        directory: typing.Optional[pathlib.Path] = None,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        """Instantiate the class.
+
+        Args:
+            directory: an optional directory to store the cache in. Defaults to the
+                `maison` directory in the user's cache directory.
+            max_entries: the maximum number of entries to keep
+            max_bytes: the maximum total size of the entries to keep
+        """
+        self.directory = directory or pathlib.Path(
+            platformdirs.user_cache_dir("maison")
+        )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def get(self, key: typing.Hashable) -> typing.Optional[typedefs.ConfigValues]:
+        """Get the values stored for a key.
+
+        Args:
+            key: a key whose `repr` identifies the values, such as a tuple of file
+                fingerprints and parser cache keys
+
+        Returns:
+            the stored values, or `None` if there are none or they can't be read
+        """
+        entry_path = self._get_entry_path(key)
+
+        try:
+            data = entry_path.read_bytes()
+            # the cache directory belongs to the user so its entries are trusted
+            values: typedefs.ConfigValues = pickle.loads(data)  # noqa: S301
+        except Exception:  # noqa: BLE001
+            # an unpickled entry can raise anything, e.g. when it refers to a class
+            # which no longer exists, so treat any failure as a miss
+            return None
+
+        with contextlib.suppress(OSError):
+            # mark the entry as recently used
+            os.utime(entry_path)
+
+        return values
+
+    def put(self, key: typing.Hashable, values: typedefs.ConfigValues) -> None:
+        """Store the values for a key.
+
+        Args:
+            key: a key whose `repr` identifies the values
+            values: the values to store
+        """
+        data = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(
+                dir=self.directory, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(file_descriptor, "wb") as file:
+                    _ = file.write(data)
+                _ = pathlib.Path(temp_path).replace(self._get_entry_path(key))
+            except OSError:
+                pathlib.Path(temp_path).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return
+
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        for entry_path, _ in self._list_entries():
+            with contextlib.suppress(OSError):
+                entry_path.unlink()
+
+    def _get_entry_path(self, key: typing.Hashable) -> pathlib.Path:
+        """Get the path of the file holding the entry for a key.
+
+        Args:
+            key: the key of the entry
+
+        Returns:
+            the path to the entry file
+        """
+        digest = hashlib.sha256(repr((_FORMAT_VERSION, key)).encode()).hexdigest()
+        return self.directory / f"{digest}{_ENTRY_SUFFIX}"
+
+    def _list_entries(self) -> list[tuple[pathlib.Path, os.stat_result]]:
+        """List the entries in the cache.
+
+        Returns:
+            the path and stat result of each entry
+        """
+        entries: list[tuple[pathlib.Path, os.stat_result]] = []
+
+        try:
+            with os.scandir(self.directory) as dir_entries:
+                for dir_entry in dir_entries:
+                    if not dir_entry.name.endswith(_ENTRY_SUFFIX):
+                        continue
+                    with contextlib.suppress(OSError):
+                        entries.append((pathlib.Path(dir_entry.path), dir_entry.stat()))
+        except OSError:
+            return []
+
+        return entries
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache is within bounds."""
+        entries = sorted(self._list_entries(), key=lambda entry: entry[1].st_mtime_ns)
+        total_bytes = sum(stat.st_size for _, stat in entries)
+
+        while entries and (
+            len(entries) > self.max_entries or total_bytes > self.max_bytes
+        ):
+            entry_path, stat = entries.pop(0)
+            with contextlib.suppress(OSError):
+                entry_path.unlink()
+            total_bytes -= stat.st_size
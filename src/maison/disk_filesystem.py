@@ -1,10 +1,17 @@
 """Holds tools for interacting with the disk filesystem."""
 
-import functools
+import os
 import pathlib
 import typing
 from collections.abc import Generator
 
+from maison import caching
+from maison import typedefs
+
+
+DirectoryMtimes = tuple[tuple[pathlib.Path, int], ...]
+DiscoveryKey = tuple[str, pathlib.Path]
+
 
 def _path_contains_file(path: pathlib.Path, filename: str) -> bool:
     """Determine whether a file exists in the given path.
@@ -33,29 +40,303 @@ def _generate_search_paths(
     yield from [starting_path, *starting_path.parents]
 
 
+def _list_files(path: pathlib.Path) -> typing.Optional[set[str]]:
+    """List the names of the files in a directory with a single `scandir` call.
+
+    Args:
+        path: the directory to list
+
+    Returns:
+        the names of the files in the directory, or `None` if the directory can't be
+        listed
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return None
+
+
+def _get_mtime(path: pathlib.Path) -> int:
+    """Get the modification time of a directory.
+
+    Args:
+        path: the path to the directory
+
+    Returns:
+        the modification time in nanoseconds, or `-1` if the directory doesn't exist
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def get_candidate_directories(path: pathlib.Path, file_name: str) -> list[pathlib.Path]:
+    """Get the directories whose contents decide whether a file exists in a path.
+
+    Args:
+        path: the path in which the file is searched for
+        file_name: the name of the file, possibly containing subdirectories
+
+    Returns:
+        the path itself followed by any intermediate directories of `file_name`
+    """
+    directories = [path]
+    for part in pathlib.PurePath(file_name).parent.parts:
+        directories.append(directories[-1] / part)
+    return directories
+
+
+class Discovery(typing.NamedTuple):
+    """The result of searching for a file, as held in a `DiscoveryCache`."""
+
+    path: typing.Optional[pathlib.Path]
+    directory_mtimes: DirectoryMtimes
+
+
+class DiscoveryCache(caching.LRUCache[DiscoveryKey, Discovery]):
+    """A bounded cache of file discoveries keyed by file name and starting path.
+
+    Each entry remembers the modification times of the directories that were
+    searched, so creating, deleting or moving a file in any of them can be noticed.
+    """
+
+    def __init__(self, maxsize: int = 256, validate: bool = True) -> None:
+        """Instantiate the class.
+
+        Args:
+            maxsize: the maximum number of discoveries to hold
+            validate: whether to check the modification times of the searched
+                directories before serving a cached discovery. If `False`, entries
+                are served until they are evicted or invalidated.
+        """
+        super().__init__(maxsize=maxsize)
+        self.validate = validate
+
+    def lookup(
+        self, file_names: typing.Iterable[str], starting_path: pathlib.Path
+    ) -> dict[str, Discovery]:
+        """Get the usable cached discoveries for several file names.
+
+        Each directory is stat'ed at most once, however many entries depend on it.
+
+        Args:
+            file_names: the names of the files that were searched for
+            starting_path: the path the search started from
+
+        Returns:
+            a mapping of file name to discovery, for the names with a usable entry
+        """
+        mtimes: dict[pathlib.Path, int] = {}
+
+        def _is_fresh(discovery: Discovery) -> bool:
+            for directory, mtime in discovery.directory_mtimes:
+                if directory not in mtimes:
+                    mtimes[directory] = _get_mtime(directory)
+                if mtimes[directory] != mtime:
+                    return False
+            return True
+
+        is_valid = _is_fresh if self.validate else None
+
+        discoveries: dict[str, Discovery] = {}
+        for file_name in file_names:
+            if discovery := self.get((file_name, starting_path), is_valid=is_valid):
+                discoveries[file_name] = discovery
+
+        return discoveries
+
+    def invalidate(self, path: typing.Optional[pathlib.Path] = None) -> None:
+        """Drop cached discoveries.
+
+        Args:
+            path: an optional file or directory path. If provided, only the entries
+                that found this file or searched this directory (or the directory
+                containing this file) are dropped, otherwise all entries are.
+        """
+        if path is None:
+            self.discard_where(lambda _key, _discovery: True)
+            return
+
+        def _is_affected(_key: DiscoveryKey, discovery: Discovery) -> bool:
+            directories = {directory for directory, _ in discovery.directory_mtimes}
+            return (
+                discovery.path == path
+                or path in directories
+                or path.parent in directories
+            )
+
+        self.discard_where(_is_affected)
+
+
 class DiskFilesystem:
     """A class to represent the disk filesystem.
 
     Implements the `Filesystem` protocol.
     """
 
-    @functools.lru_cache
+    def __init__(self, cache: typing.Optional[DiscoveryCache] = None) -> None:
+        """Instantiate the class.
+
+        Args:
+            cache: an optional cache of file discoveries, which may be shared
+                between filesystems. If not provided a new one is created.
+        """
+        self.cache = DiscoveryCache() if cache is None else cache
+
     def get_file_path(
         self, file_name: str, starting_path: typing.Optional[pathlib.Path] = None
     ) -> typing.Optional[pathlib.Path]:
         """See `Filesystem.get_file_path`."""
-        filename_path = pathlib.Path(file_name).expanduser()
-        if filename_path.is_absolute() and filename_path.is_file():
-            return filename_path
+        paths = self.get_file_paths(file_names=[file_name], starting_path=starting_path)
+        return paths[0] if paths else None
 
+    def get_file_paths(
+        self,
+        file_names: typing.Sequence[str],
+        starting_path: typing.Optional[pathlib.Path] = None,
+    ) -> list[pathlib.Path]:
+        """See `Filesystem.get_file_paths`."""
         start = starting_path or pathlib.Path.cwd()
+        unique_names = list(dict.fromkeys(file_names))
 
-        for path in _generate_search_paths(starting_path=start):
-            if _path_contains_file(path=path, filename=file_name):
-                return path / file_name
+        discoveries = self.cache.lookup(file_names=unique_names, starting_path=start)
 
-        return None
+        if missing := [name for name in unique_names if name not in discoveries]:
+            for file_name, discovery in self._discover(missing, start).items():
+                self.cache.put((file_name, start), discovery)
+                discoveries[file_name] = discovery
+
+        return [
+            path
+            for file_name in file_names
+            if (path := discoveries[file_name].path) is not None
+        ]
+
+    def _discover(
+        self, file_names: list[str], starting_path: pathlib.Path
+    ) -> dict[str, Discovery]:
+        """Search for several files in a single walk up the tree.
+
+        Args:
+            file_names: the names of the files or absolute paths to search for
+            starting_path: the path from which to start searching
+
+        Returns:
+            a mapping of file name to discovery
+        """
+        discoveries: dict[str, Discovery] = {}
+        pending: dict[str, list[tuple[pathlib.Path, int]]] = {}
+
+        for file_name in file_names:
+            filename_path = pathlib.Path(file_name).expanduser()
+            if filename_path.is_absolute():
+                mtimes = ((filename_path.parent, _get_mtime(filename_path.parent)),)
+                found = filename_path if filename_path.is_file() else None
+                discoveries[file_name] = Discovery(found, mtimes)
+            else:
+                pending[file_name] = []
+
+        for path in _generate_search_paths(starting_path=starting_path):
+            if not pending:
+                break
+
+            # take the modification time before listing so that a change made
+            # in between is noticed on the next lookup rather than missed
+            path_mtime = _get_mtime(path)
+            listing = _list_files(path)
+
+            for file_name, mtimes in list(pending.items()):
+                mtimes.append((path, path_mtime))
+                mtimes.extend(
+                    (directory, _get_mtime(directory))
+                    for directory in get_candidate_directories(path, file_name)[1:]
+                )
+
+                if listing is None or pathlib.Path(file_name).name != file_name:
+                    # unlistable directory or a nested relative path, fall back to a
+                    # direct check
+                    is_present = _path_contains_file(path=path, filename=file_name)
+                else:
+                    is_present = file_name in listing
+
+                if is_present:
+                    discoveries[file_name] = Discovery(path / file_name, tuple(mtimes))
+                    del pending[file_name]
+
+        for file_name, mtimes in pending.items():
+            discoveries[file_name] = Discovery(None, tuple(mtimes))
+
+        return discoveries
+
+    def get_fingerprint(self, path: pathlib.Path) -> typedefs.FileFingerprint:
+        """See `Filesystem.get_fingerprint`."""
+        stat = path.stat()
+        return typedefs.FileFingerprint(
+            path=path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            inode=stat.st_ino,
+        )
+
+    def read_file(self, path: pathlib.Path) -> bytes:
+        """See `Filesystem.read_file`."""
+        return path.read_bytes()
 
     def open_file(self, path: pathlib.Path) -> typing.BinaryIO:
-        """See `Filesystem.open_file`."""
+        """Open a file.
+
+        The caller is responsible for closing the file, `read_file` is preferred.
+
+        Args:
+            path: the path to the file
+
+        Returns:
+            the opened file as a binary I/O stream
+        """
         return path.open(mode="rb")
+
+
+class AsyncDiskFilesystem:
+    """A class to represent the disk filesystem, for use with `asyncio`.
+
+    Every call is run in a worker thread of the event loop's default executor.
+
+    Implements the `AsyncFilesystem` protocol.
+    """
+
+    def __init__(self, filesystem: typing.Optional[DiskFilesystem] = None) -> None:
+        """Instantiate the class.
+
+        Args:
+            filesystem: an optional disk filesystem to delegate to, which may be
+                shared with synchronous code. If not provided a new one is created.
+        """
+        self.filesystem = filesystem or DiskFilesystem()
+
+    async def get_file_paths(
+        self,
+        file_names: typing.Sequence[str],
+        starting_path: typing.Optional[pathlib.Path] = None,
+    ) -> list[pathlib.Path]:
+        """See `AsyncFilesystem.get_file_paths`."""
+        import asyncio
+
+        return await asyncio.to_thread(
+            self.filesystem.get_file_paths,
+            file_names=file_names,
+            starting_path=starting_path,
+        )
+
+    async def get_fingerprint(self, path: pathlib.Path) -> typedefs.FileFingerprint:
+        """See `AsyncFilesystem.get_fingerprint`."""
+        import asyncio
+
+        return await asyncio.to_thread(self.filesystem.get_fingerprint, path=path)
+
+    async def read_file(self, path: pathlib.Path) -> bytes:
+        """See `AsyncFilesystem.read_file`."""
+        import asyncio
+
+        return await asyncio.to_thread(self.filesystem.read_file, path=path)
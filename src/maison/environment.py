@@ -0,0 +1,148 @@
+"""Holds the tools for reading config values from environment variables."""
+
+import hashlib
+import os
+import re
+import threading
+import typing
+from collections.abc import Mapping
+
+from maison import typedefs
+
+
+Priority = typing.Literal["highest", "lowest"]
+
+PRIORITIES: tuple[Priority, ...] = ("highest", "lowest")
+
+# integers as written in TOML: no leading zeros, which would make "0755" lose its
+# meaning, and underscores only between digits
+_INT_PATTERN = re.compile(
+    r"[+-]?(?:0|[1-9](?:_?\d)*)"
+    r"|0x[0-9a-fA-F](?:_?[0-9a-fA-F])*|0o[0-7](?:_?[0-7])*|0b[01](?:_?[01])*"
+)
+_FLOAT_PATTERN = re.compile(r"[+-]?(?:(?:0|[1-9]\d*)(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?")
+_BOOLEANS = {"true": True, "false": False}
+
+Scalar = typing.Union[str, int, float, bool]
+
+
+def coerce_value(value: str) -> Scalar:
+    """Convert the value of an environment variable to the scalar it represents.
+
+    Args:
+        value: the value of the environment variable
+
+    Returns:
+        a bool for `true` or `false` in any case, an int for integers written as
+        in TOML, a float for other numbers without leading zeros, otherwise the
+        value unchanged
+    """
+    boolean = _BOOLEANS.get(value.lower())
+    if boolean is not None:
+        return boolean
+    if _INT_PATTERN.fullmatch(value):
+        return int(value, 0)
+    if _FLOAT_PATTERN.fullmatch(value):
+        return float(value)
+    return value
+
+
+def build_values(
+    variables: typing.Iterable[tuple[str, str]], separator: str
+) -> typedefs.ConfigValues:
+    """Build nested config values from environment variables.
+
+    Args:
+        variables: the names, without their prefix, and values of the variables
+        separator: the string separating the keys of a nested value in a name
+
+    Returns:
+        the config values, with lower-cased keys. Where a name is both a value and
+        a table, such as `DB` and `DB__POOL`, the table wins.
+    """
+    values: typedefs.ConfigValues = {}
+
+    for name, value in variables:
+        keys = name.lower().split(separator)
+        if not all(keys):
+            continue
+
+        current = values
+        for key in keys[:-1]:
+            child = current.get(key)
+            if not isinstance(child, dict):
+                child = current[key] = {}
+            current = child
+
+        if not isinstance(current.get(keys[-1]), dict):
+            current[keys[-1]] = coerce_value(value)
+
+    return values
+
+
+class EnvironmentSource:
+    """A source of config values in environment variables sharing a prefix.
+
+    For example with the prefix `ACME`, `ACME__DB__POOL_SIZE=20` gives
+    `{"db": {"pool_size": 20}}`. The values are only built again when the relevant
+    variables change.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        separator: str = "__",
+        environ: typing.Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Instantiate the class.
+
+        Args:
+            prefix: the prefix of the variables, without the separator
+            separator: the string separating the prefix and the keys of a nested
+                value in a variable's name
+            environ: an optional mapping of environment variables. Defaults to
+                `os.environ`.
+        """
+        self.prefix = prefix
+        self.separator = separator
+        self.environ = os.environ if environ is None else environ
+        self._lock = threading.Lock()
+        self._digest = ""
+        self._variables: tuple[tuple[str, str], ...] = ()
+        self._layer: typing.Optional[typedefs.ConfigLayer] = None
+
+    def get_layer(self) -> typedefs.ConfigLayer:
+        """Get the config layer of the relevant environment variables.
+
+        The environment is scanned once. The layer is only built again if the
+        relevant variables differ from those of the last call.
+
+        Returns:
+            the layer, whose values may be shared and must not be mutated
+        """
+        full_prefix = f"{self.prefix}{self.separator}"
+        variables = tuple(
+            sorted(
+                (name[len(full_prefix) :], value)
+                for name, value in self.environ.items()
+                if name.startswith(full_prefix)
+            )
+        )
+        # unlike hash(), the digest is the same in every process, so it can
+        # identify the layer in fingerprints which outlive the process
+        digest = hashlib.blake2b(repr(variables).encode(), digest_size=16).hexdigest()
+
+        with self._lock:
+            layer = self._layer
+            # the digests are compared first, the variables only if they're equal
+            if layer is None or (self._digest, self._variables) != (digest, variables):
+                layer = self._layer = typedefs.ConfigLayer(
+                    path=None,
+                    fingerprint=typedefs.EnvironmentFingerprint(
+                        prefix=full_prefix, digest=digest
+                    ),
+                    values=build_values(variables, separator=self.separator),
+                )
+                self._digest, self._variables = digest, variables
+
+        return layer
@@ -11,3 +11,11 @@ class BadTomlError(Exception):
 
 class UnsupportedConfigError(Exception):
     """Raised when a config is attempted to be parsed but no parser is registered for it."""
+
+
+class NotLoadedError(Exception):
+    """Raised when an async config is read before it has been loaded."""
+
+
+class ReadOnlyConfigError(Exception):
+    """Raised when the values of a config shared through a registry are modified."""
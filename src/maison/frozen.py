@@ -0,0 +1,116 @@
+"""Holds an immutable, hashable mapping of config values."""
+
+import typing
+from collections.abc import Iterator
+from collections.abc import Mapping
+
+
+def freeze_value(value: typing.Any) -> typing.Any:
+    """Make a config value immutable.
+
+    Args:
+        value: the value
+
+    Returns:
+        the value, with mappings frozen and lists and tuples turned into tuples of
+        frozen values
+    """
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenDict(typing.cast("Mapping[str, typing.Any]", value))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in typing.cast("list[object]", value))
+    return value
+
+
+class FrozenDict(Mapping[str, typing.Any]):
+    """A read-only mapping of config values, which is hashable.
+
+    Nested mappings are frozen too and lists are turned into tuples, so the values
+    can be shared between threads without copying. The hash is computed once, when
+    the mapping is created, so the mapping is cheap to use as a key: equal mappings
+    have equal hashes within a process.
+    """
+
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, values: Mapping[str, typing.Any]) -> None:
+        """Freeze config values.
+
+        Args:
+            values: the config values, which aren't modified
+        """
+        self._data = {key: freeze_value(value) for key, value in values.items()}
+
+        self._hash: typing.Optional[int]
+        try:
+            self._hash = hash(frozenset(self._data.items()))
+        except TypeError:
+            # a value which isn't hashable, e.g. a set set by a schema
+            self._hash = None
+
+    def __getitem__(self, key: str) -> typing.Any:
+        """Get the value of a key.
+
+        Args:
+            key: the key
+
+        Returns:
+            the value
+        """
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys.
+
+        Returns:
+            an iterator over the keys
+        """
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of keys.
+
+        Returns:
+            the number of keys
+        """
+        return len(self._data)
+
+    def __hash__(self) -> int:
+        """Return the hash computed when the mapping was created.
+
+        Returns:
+            the hash
+
+        Raises:
+            TypeError: when one of the values isn't hashable
+        """
+        if self._hash is None:
+            raise TypeError(f"{self.__class__.__name__} holds an unhashable value")
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the mapping has the same items as another.
+
+        Args:
+            other: the other object
+
+        Returns:
+            whether the mappings are equal
+        """
+        if isinstance(other, FrozenDict):
+            if self._hash is not None and other._hash not in (None, self._hash):
+                return False
+            return self._data == other._data
+        if isinstance(other, Mapping):
+            return self._data == dict(typing.cast("Mapping[str, typing.Any]", other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return the __repr__.
+
+        Returns:
+            the string representation
+        """
+        return f"{self.__class__.__name__}({self._data!r})"
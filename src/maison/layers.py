@@ -0,0 +1,112 @@
+"""Holds the tools for merging config layers incrementally."""
+
+import typing
+
+from maison import merging
+from maison import typedefs
+
+
+def _count_common_layers(
+    first: typing.Sequence[typedefs.ConfigLayer],
+    second: typing.Sequence[typedefs.ConfigLayer],
+) -> int:
+    """Count the layers at the start of two sequences which come from the same files.
+
+    Args:
+        first: the first sequence of layers
+        second: the second sequence of layers
+
+    Returns:
+        the length of the common prefix of the sequences
+    """
+    count = 0
+    for first_layer, second_layer in zip(first, second):
+        if first_layer.fingerprint != second_layer.fingerprint:
+            break
+        count += 1
+    return count
+
+
+class LayerStack:
+    """Config layers together with the merged values of every prefix of them.
+
+    Keeping the merge of each prefix means that when a layer changes, only that layer
+    and the layers after it need to be merged again. Merging copies neither the
+    layers nor the earlier merges.
+
+    The layers are only merged when the merged values are first read, so a stack
+    read through its `view` is never merged as a whole.
+    """
+
+    def __init__(
+        self,
+        layers: typing.Sequence[typedefs.ConfigLayer] = (),
+        previous: typing.Optional["LayerStack"] = None,
+        plan: typing.Optional[merging.MergePlan] = None,
+    ) -> None:
+        """Merge the layers, later layers taking precedence.
+
+        Args:
+            layers: the layers to merge
+            previous: an optional stack from an earlier merge. The merges of the
+                layers it has in common with `layers` are reused if it was merged
+                with the same plan, and kept until they are.
+            plan: an optional plan of the strategies with which to merge the
+                layers. Defaults to merging dicts key by key and replacing
+                everything else.
+        """
+        self.layers = tuple(layers)
+        self.plan = plan or merging.DEFAULT_PLAN
+
+        self._merges: typing.Optional[tuple[typedefs.ConfigValues, ...]] = None
+        self._previous: typing.Optional[LayerStack] = None
+        self._reusable = 0
+        if previous is not None and previous.plan is self.plan:
+            self._previous = previous
+            self._reusable = _count_common_layers(previous.layers, self.layers)
+
+        self._view: typing.Optional[merging.LayeredView] = None
+
+    @property
+    def merges(self) -> tuple[typedefs.ConfigValues, ...]:
+        """Return the merged values of each prefix of the layers.
+
+        Returns:
+            the merged values, which share subtrees with each other and with the
+            layers and so must not be mutated
+        """
+        if self._merges is None:
+            previous = self._previous
+            merges = list(previous.merges[: self._reusable] if previous else ())
+            for layer in self.layers[len(merges) :]:
+                merges.append(
+                    self.plan.merge(merges[-1] if merges else {}, layer.values)
+                )
+
+            # concurrent readers may both merge the layers, into equal values
+            self._merges = tuple(merges)
+            self._previous = None
+        return self._merges
+
+    @property
+    def values(self) -> typedefs.ConfigValues:
+        """Return the merged values of all the layers.
+
+        Returns:
+            the merged values, which share subtrees with the layers and must not be
+            mutated
+        """
+        return self.merges[-1] if self.merges else {}
+
+    @property
+    def view(self) -> merging.LayeredView:
+        """Return a view of the merged values of the layers, resolved as it's read.
+
+        Returns:
+            the view, which shares its cache of resolved values with every reader
+        """
+        if self._view is None:
+            self._view = merging.LayeredView(
+                [layer.values for layer in self.layers], plan=self.plan
+            )
+        return self._view
@@ -0,0 +1,497 @@
+"""Holds a merge engine with declarative per-path merge strategies."""
+
+import typing
+from collections.abc import Mapping
+
+from maison import subscriptions
+from maison import typedefs
+from maison import utils
+
+
+Strategy = typing.Literal["merge", "replace", "append", "prepend", "union", "keyed"]
+
+STRATEGIES: tuple[Strategy, ...] = typing.get_args(Strategy)
+
+_WILDCARD = "*"
+_MISSING = object()
+
+
+class _PlanNode:
+    """The strategy for a path of a config and the nodes of the paths below it."""
+
+    __slots__ = ("children", "strategy", "wildcard")
+
+    def __init__(self) -> None:
+        """Instantiate the class."""
+        self.strategy: Strategy = "merge"
+        self.children: dict[str, _PlanNode] = {}
+        self.wildcard: typing.Optional[_PlanNode] = None
+
+
+_DEFAULT_NODE = _PlanNode()
+
+
+def _get_child(node: _PlanNode, key: str) -> _PlanNode:
+    """Get the node of a key below a node's path.
+
+    Args:
+        node: the node
+        key: the key
+
+    Returns:
+        the node of the key, else the wildcard node, else the default node
+    """
+    return node.children.get(key, node.wildcard or _DEFAULT_NODE)
+
+
+# a dict being built, the overlay to merge into it and the node of its path
+_PendingMerge = tuple[dict[str, typing.Any], Mapping[str, typing.Any], _PlanNode]
+
+
+def _merge_unique(
+    base: list[typing.Any], overlay: list[typing.Any]
+) -> list[typing.Any]:
+    """Append the items of a list which aren't already in another.
+
+    Args:
+        base: the list to append to, which isn't modified
+        overlay: the items to append
+
+    Returns:
+        a new list
+    """
+    merged = list(base)
+    hashable: set[typing.Any] = set()
+    for item in merged:
+        try:
+            hashable.add(item)
+        except TypeError:
+            continue
+
+    for item in overlay:
+        try:
+            if item in hashable:
+                continue
+            hashable.add(item)
+        except TypeError:
+            if item in merged:
+                continue
+        merged.append(item)
+
+    return merged
+
+
+class MergePlan:
+    """A set of per-path merge strategies compiled for applying to many merges.
+
+    Strategies are keyed by dotted paths, in which `*` matches any single key,
+    e.g. `"plugins"` or `"services.*.ports"`. The strategies are:
+
+    - `merge`: dicts are merged key by key, anything else is replaced. This is the
+      default for every path.
+    - `replace`: the overlay's value replaces the base's
+    - `append`, `prepend`: the overlay's list is added after, or before, the base's
+    - `union`: the overlay's list items which aren't in the base's are appended
+    - `keyed`: dicts in the lists sharing the same `list_key` value are merged,
+      the others are appended
+
+    List strategies fall back to `replace` when either value isn't a list. Merges
+    are iterative, so there is no limit to the depth of a config, and modify
+    neither argument: subtrees the overlay doesn't touch are shared with the
+    arguments, so the result must not be mutated. Use `utils.copy_values` to obtain
+    a private copy.
+    """
+
+    def __init__(
+        self,
+        strategies: typing.Optional[Mapping[str, Strategy]] = None,
+        list_key: str = "name",
+    ) -> None:
+        """Compile the strategies.
+
+        Args:
+            strategies: an optional mapping of dotted paths to strategies
+            list_key: the key identifying the dicts in lists merged with the
+                `keyed` strategy
+
+        Raises:
+            ValueError: when a strategy is unknown or a path is empty
+        """
+        self.strategies = dict(strategies or {})
+        self.list_key = list_key
+        self._root = _PlanNode()
+
+        for path, strategy in self.strategies.items():
+            if strategy not in STRATEGIES:
+                raise ValueError(
+                    f"Unknown merge strategy {strategy!r} for {path!r}, "
+                    f"expected one of {STRATEGIES}"
+                )
+            keys = subscriptions.parse_key_path(path)
+            if not keys:
+                raise ValueError("A merge strategy needs a non-empty path")
+
+            node = self._root
+            for key in keys:
+                if key == _WILDCARD:
+                    node.wildcard = node.wildcard or _PlanNode()
+                    node = node.wildcard
+                else:
+                    node = node.children.setdefault(key, _PlanNode())
+            node.strategy = strategy
+
+    def merge(
+        self, base: typedefs.ConfigValues, overlay: typedefs.ConfigValues
+    ) -> typedefs.ConfigValues:
+        """Merge two configs into a new one, the overlay taking precedence.
+
+        Args:
+            base: the config to merge into
+            overlay: the config whose values take precedence
+
+        Returns:
+            the merged config, which shares subtrees with the arguments and must
+            not be mutated
+
+        Raises:
+            RuntimeError: when a dict is merged on top of a non-dict with the
+                `merge` strategy, as with `utils.deep_merge`
+        """
+        return self._merge_at(base, overlay, self._root)
+
+    def _merge_at(
+        self,
+        base: typedefs.ConfigValues,
+        overlay: typedefs.ConfigValues,
+        plan_node: _PlanNode,
+    ) -> typedefs.ConfigValues:
+        """Merge two dicts found at the path of a node of the plan.
+
+        Args:
+            base: the dict to merge into
+            overlay: the dict whose values take precedence
+            plan_node: the node of the path of the dicts
+
+        Returns:
+            the merged dict
+        """
+        merged = dict(base)
+        stack: list[_PendingMerge] = [(merged, overlay, plan_node)]
+
+        while stack:
+            target, overlay_node, plan_node = stack.pop()
+
+            # the node of a key is its own, else the wildcard's, else the default
+            children = plan_node.children
+            fallback = plan_node.wildcard or _DEFAULT_NODE
+
+            for key, overlay_value in overlay_node.items():
+                base_value = target.get(key, _MISSING)
+                if base_value is _MISSING:
+                    target[key] = overlay_value
+                    continue
+
+                child = children.get(key, fallback)
+                strategy = child.strategy
+
+                if strategy == "merge":
+                    if isinstance(overlay_value, dict):
+                        if not isinstance(base_value, dict):
+                            raise RuntimeError(
+                                f"Cannot merge dict '{overlay_value}' into type "
+                                f"'{type(base_value)}'"
+                            )
+                        target[key] = dict(base_value)
+                        stack.append((target[key], overlay_value, child))
+                    else:
+                        target[key] = overlay_value
+                elif strategy == "replace" or not (
+                    isinstance(base_value, list) and isinstance(overlay_value, list)
+                ):
+                    target[key] = overlay_value
+                else:
+                    target[key] = self._merge_lists(
+                        base_value, overlay_value, child, stack
+                    )
+
+        return merged
+
+    def _merge_lists(
+        self,
+        base: list[typing.Any],
+        overlay: list[typing.Any],
+        plan_node: _PlanNode,
+        stack: list[_PendingMerge],
+    ) -> list[typing.Any]:
+        """Merge two lists with the list strategy of their path.
+
+        Args:
+            base: the list to merge into, which isn't modified
+            overlay: the list to merge
+            plan_node: the node of the path of the lists
+            stack: the pending merges
+
+        Returns:
+            the merged list
+        """
+        if plan_node.strategy == "append":
+            return [*base, *overlay]
+        if plan_node.strategy == "prepend":
+            return [*overlay, *base]
+        if plan_node.strategy == "union":
+            return _merge_unique(base, overlay)
+        return self._merge_keyed(base, overlay, plan_node, stack)
+
+    def _merge_keyed(
+        self,
+        base: list[typing.Any],
+        overlay: list[typing.Any],
+        plan_node: _PlanNode,
+        stack: list[_PendingMerge],
+    ) -> list[typing.Any]:
+        """Merge two lists of dicts identified by their `list_key` value.
+
+        Args:
+            base: the list to merge into, which isn't modified
+            overlay: the list whose dicts take precedence
+            plan_node: the node of the path of the lists, whose children apply to
+                the keys of the dicts
+            stack: the pending merges, to which the merges of matching dicts are
+                added
+
+        Returns:
+            the base's items, with the matching dicts to be merged in place, followed
+            by the overlay's other items
+        """
+        merged = list(base)
+        positions: dict[typing.Hashable, int] = {}
+        for index, item in enumerate(merged):
+            identity = self._get_identity(item)
+            if identity is not None:
+                _ = positions.setdefault(identity, index)
+
+        copied: set[int] = set()
+        pending: list[_PendingMerge] = []
+        for item in overlay:
+            identity = self._get_identity(item)
+            index = positions.get(identity, -1) if identity is not None else -1
+            if index < 0:
+                merged.append(item)
+                continue
+
+            if index not in copied:
+                merged[index] = dict(merged[index])
+                copied.add(index)
+            pending.append((merged[index], item, plan_node))
+
+        # the stack is last in first out, and later dicts must be merged last
+        stack.extend(reversed(pending))
+        return merged
+
+    def _get_identity(self, item: object) -> typing.Optional[typing.Hashable]:
+        """Get the value identifying a dict in a list merged with `keyed`.
+
+        Args:
+            item: the item of the list
+
+        Returns:
+            the item's hashable `list_key` value, or `None` if it has none
+        """
+        if not isinstance(item, dict) or self.list_key not in item:
+            return None
+        identity: typing.Hashable = item[self.list_key]
+        try:
+            _ = hash(identity)
+        except TypeError:
+            return None
+        return identity
+
+
+DEFAULT_PLAN = MergePlan()
+
+
+class LayeredView(Mapping[str, typing.Any]):
+    """A read-only view of the merge of config layers, resolved as it is read.
+
+    A key is looked up in the layers which have it, and its value merged from
+    theirs following the plan, only when it is first read. Dicts merged key by key
+    are resolved as views themselves, so a subtree is only merged as far as it is
+    read, and its keys are only gathered when it is iterated. Resolved values are
+    cached.
+
+    The view reads the same values as `MergePlan.merge` applied to the layers in
+    order. Dicts are read through views and lists are copied when first read, so
+    the layers, which may be shared with the parse cache, can't be modified
+    through the view. The copied lists are cached with the view, so they must not
+    be mutated either.
+    """
+
+    def __init__(
+        self,
+        layers: typing.Sequence[typedefs.ConfigValues],
+        plan: typing.Optional[MergePlan] = None,
+    ) -> None:
+        """Instantiate the class.
+
+        Args:
+            layers: the values of the layers, later layers taking precedence
+            plan: an optional plan of the strategies with which to merge the
+                layers. Defaults to merging dicts key by key and replacing
+                everything else.
+        """
+        self._layers = tuple(layers)
+        self._plan = plan or DEFAULT_PLAN
+        self._node = self._plan._root  # noqa: SLF001
+        self._resolved: dict[str, typing.Any] = {}
+        self._keys: typing.Optional[tuple[str, ...]] = None
+
+    def __getitem__(self, key: str) -> typing.Any:
+        """Get the merged value of a key.
+
+        Args:
+            key: the key
+
+        Returns:
+            the merged value, a view if it is a dict
+
+        Raises:
+            KeyError: when no layer has the key
+        """
+        value = self._resolved.get(key, _MISSING)
+        if value is _MISSING:
+            # concurrent readers may both resolve a key, to equal values
+            value = self._resolved[key] = self._resolve(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether any layer has a key.
+
+        Args:
+            key: the key
+
+        Returns:
+            whether the view has the key
+        """
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Iterate over the keys, in the order the merge would have them.
+
+        Returns:
+            an iterator over the keys
+        """
+        if self._keys is None:
+            self._keys = tuple(
+                dict.fromkeys(key for layer in self._layers for key in layer)
+            )
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        """Return the number of keys.
+
+        Returns:
+            the number of keys
+        """
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Return the __repr__.
+
+        Returns:
+            the string representation, which resolves the whole view
+        """
+        return f"{self.__class__.__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> typedefs.ConfigValues:
+        """Resolve the whole view.
+
+        Returns:
+            the merged values, in which views are replaced by dicts
+        """
+        merged: typedefs.ConfigValues = {}
+        stack: list[tuple[dict[str, typing.Any], LayeredView]] = [(merged, self)]
+
+        while stack:
+            target, view = stack.pop()
+            for key, value in view.items():
+                if isinstance(value, LayeredView):
+                    target[key] = {}
+                    stack.append((target[key], value))
+                else:
+                    target[key] = value
+
+        return merged
+
+    def _resolve(self, key: str) -> typing.Any:
+        """Merge the values the layers have for a key.
+
+        Args:
+            key: the key
+
+        Returns:
+            the merged value, or a sentinel if no layer has the key
+
+        Raises:
+            RuntimeError: when a dict is merged on top of a non-dict with the
+                `merge` strategy
+        """
+        values = [layer[key] for layer in self._layers if key in layer]
+        if not values:
+            return _MISSING
+
+        child = _get_child(self._node, key)
+        if len(values) == 1:
+            return self._protect(values[0], child)
+
+        if child.strategy == "merge" and isinstance(values[-1], dict):
+            # the dicts after the last non-dict are merged, and a dict can't be
+            # merged on top of a non-dict
+            first_dict = len(values)
+            while first_dict and isinstance(values[first_dict - 1], dict):
+                first_dict -= 1
+            if first_dict:
+                raise RuntimeError(
+                    f"Cannot merge dict '{values[first_dict]}' into type "
+                    f"'{type(values[first_dict - 1])}'"
+                )
+            return self._get_view(values, child)
+
+        merged: typedefs.ConfigValues = {key: values[0]}
+        for value in values[1:]:
+            merged = self._plan._merge_at(merged, {key: value}, self._node)  # noqa: SLF001
+        return self._protect(merged[key], child)
+
+    def _protect(self, value: typing.Any, node: _PlanNode) -> typing.Any:
+        """Keep a resolved value from exposing the layers' own dicts and lists.
+
+        Args:
+            value: the resolved value, which may be one of the layers' own or hold
+                them, e.g. a list merged with the `append` strategy
+            node: the node of the plan at the value
+
+        Returns:
+            a view of a dict, a copy of a list, or any other value unchanged
+        """
+        if isinstance(value, dict):
+            return self._get_view([value], node)
+        if isinstance(value, list):
+            return utils.copy_value(value)
+        return value
+
+    def _get_view(
+        self, layers: typing.Sequence[typedefs.ConfigValues], node: _PlanNode
+    ) -> "LayeredView":
+        """Create a view of dicts below this view.
+
+        Args:
+            layers: the dicts, later ones taking precedence
+            node: the node of the plan at the dicts
+
+        Returns:
+            the view
+        """
+        view = LayeredView(layers, plan=self._plan)
+        view._node = node
+        return view
@@ -1,6 +1,61 @@
-from .ini import IniParser
-from .pyproject import PyprojectParser
-from .toml import TomlParser
+"""The built-in parsers, each imported only when first used."""
 
+import importlib
+import typing
 
-__all__ = ["IniParser", "PyprojectParser", "TomlParser"]
+
+if typing.TYPE_CHECKING:
+    from . import ini
+    from . import json
+    from . import pyproject
+    from . import toml
+    from .ini import IniParser
+    from .json import JsonParser
+    from .pyproject import PyprojectLoader
+    from .pyproject import PyprojectParser
+    from .toml import TomlParser
+
+
+_SUBMODULES = {"ini", "json", "pyproject", "toml"}
+_ATTRIBUTE_MODULES = {
+    "IniParser": "ini",
+    "JsonParser": "json",
+    "PyprojectLoader": "pyproject",
+    "PyprojectParser": "pyproject",
+    "TomlParser": "toml",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import a parser module when one of its attributes is first accessed.
+
+    Args:
+        name: the name of the attribute
+
+    Returns:
+        the attribute
+
+    Raises:
+        AttributeError: when there is no such attribute
+    """
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name = _ATTRIBUTE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
+
+
+__all__ = [
+    "IniParser",
+    "JsonParser",
+    "PyprojectLoader",
+    "PyprojectParser",
+    "TomlParser",
+    "ini",
+    "json",
+    "pyproject",
+    "toml",
+]
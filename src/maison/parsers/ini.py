@@ -1,7 +1,6 @@
 """A parser for .ini files."""
 
 import configparser
-import io
 import typing
 
 from maison import typedefs
@@ -13,12 +12,13 @@ class IniParser:
     Implements the `Parser` protocol
     """
 
-    def parse_config(self, file: typing.BinaryIO) -> typedefs.ConfigValues:
+    cache_key: typing.Hashable = ("ini",)
+
+    def parse_config(self, data: bytes) -> typedefs.ConfigValues:
         """See the Parser.parse_config method."""
         config = configparser.ConfigParser()
-        text_io = io.TextIOWrapper(file, encoding="utf-8")
         try:
-            config.read_file(text_io)
+            config.read_string(data.decode("utf-8"))
         except UnicodeDecodeError:
             return {}
         return {section: dict(config.items(section)) for section in config.sections()}
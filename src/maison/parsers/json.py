@@ -0,0 +1,128 @@
+"""A parser for .json files."""
+
+import importlib
+import json
+import re
+import typing
+
+from maison import typedefs
+
+
+Loads = typing.Callable[[bytes], typing.Any]
+
+_BOM = b"\xef\xbb\xbf"
+# orjson decodes integers beyond 64 bits as floats, losing precision
+_LONG_NUMBER_PATTERN = re.compile(rb"\d{20}")
+
+
+def _find_backends() -> dict[str, Loads]:
+    """Find the installed JSON decoders.
+
+    Returns:
+        the `loads` function of each installed decoder, by name
+    """
+    backends: dict[str, Loads] = {"json": json.loads}
+
+    try:
+        orjson = importlib.import_module("orjson")
+    except ImportError:
+        pass
+    else:
+        backends["orjson"] = orjson.loads
+
+    return backends
+
+
+BACKENDS = _find_backends()
+"""The `loads` function of each installed JSON decoder, by name."""
+
+DEFAULT_BACKEND = "orjson" if "orjson" in BACKENDS else "json"
+"""The name of the fastest installed JSON decoder."""
+
+
+class JsonParser:
+    """Responsible for parsing .json files.
+
+    Documents are decoded with `orjson` when it is installed, otherwise with the
+    standard library's `json` module. `orjson` doesn't accept everything `json`
+    does, such as `NaN`, and decodes integers beyond 64 bits as floats, so those
+    documents are decoded with `json` instead, to give the same values whatever
+    the backend.
+
+    Implements the `Parser` protocol
+    """
+
+    def __init__(
+        self,
+        section_key: typing.Optional[tuple[str, ...]] = None,
+        backend: typing.Optional[str] = None,
+    ) -> None:
+        """Instantiate the class.
+
+        Args:
+            section_key: an optional key identifying an object to select within the
+                document. For example if the document is:
+
+                {"tool": {"my_section": {"my_value": true}}}
+
+                then setting `section_key=("tool", "my_section")` will return
+                `{"my_value": True}` as the config values.
+            backend: an optional name of the decoder to use, either `"json"` or
+                `"orjson"`. Defaults to the fastest installed decoder.
+
+        Raises:
+            ValueError: when the backend isn't installed
+        """
+        self.section_key = section_key or ()
+        self.backend = backend or DEFAULT_BACKEND
+        if self.backend not in BACKENDS:
+            raise ValueError(f"The {self.backend!r} JSON backend isn't available")
+        self._loads = BACKENDS[self.backend]
+
+    @property
+    def cache_key(self) -> typing.Hashable:
+        """Identify the values this parser produces for a given file.
+
+        Returns:
+            a key which is equal for parsers selecting the same section with the
+            same backend
+        """
+        return ("json", self.section_key, self.backend)
+
+    def parse_config(self, data: bytes) -> typedefs.ConfigValues:
+        """See the Parser.parse_config method."""
+        if data.startswith(_BOM):
+            data = data[len(_BOM) :]
+
+        try:
+            current = self._decode(data)
+        except ValueError:
+            return {}
+
+        for key in self.section_key:
+            if isinstance(current, dict) and key in current:
+                current = current[key]
+            else:
+                return {}
+
+        return current if isinstance(current, dict) else {}
+
+    def _decode(self, data: bytes) -> typing.Any:
+        """Decode a document, falling back to `json` where the backend differs.
+
+        Args:
+            data: the document, without a byte order mark
+
+        Returns:
+            the decoded document
+
+        Raises:
+            ValueError: when the document isn't valid JSON
+        """
+        if self._loads is json.loads or _LONG_NUMBER_PATTERN.search(data):
+            return json.loads(data)
+
+        try:
+            return self._loads(data)
+        except ValueError:
+            return json.loads(data)
@@ -1,19 +1,221 @@
 """A parser for pyproject.toml files."""
 
+import hashlib
+import re
+import sys
+
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+import typing
+
+from maison import caching
+from maison import typedefs
 from maison.parsers import toml
 
 
+# the start of any table or array of tables header
+_HEADER_PATTERN = re.compile(rb"^[ \t]*\[", re.MULTILINE)
+# a header which could hold a tool's values without naming it plainly, such as
+# `[tool]`, `[tool."acme"]` or any header with a quoted `tool` key like `["tool".acme]`
+_OBSCURE_TOOL_HEADER_PATTERN = re.compile(
+    rb"[ \t]*\[\[?[ \t]*(?:[\"']tool[\"']|tool[ \t]*(?:\]|\.[ \t]*[\"']))"
+)
+# a key of the root table which could hold a tool's values, such as `tool.acme.x`
+_ROOT_TOOL_KEY_PATTERN = re.compile(rb"^[ \t]*[\"']?tool[\"']?[ \t]*[.=]", re.MULTILINE)
+_MULTILINE_STRING_DELIMITERS = (b'"""', b"'''")
+
+
+def _slice_tool_tables(data: bytes, tool_name: str) -> typing.Optional[bytes]:
+    """Cut the tables of a tool out of a pyproject document.
+
+    Args:
+        data: the contents of the document
+        tool_name: the name of the tool
+
+    Returns:
+        the headers and bodies of the `[tool.<tool_name>...]` tables, or `None` if
+        the tool's values might be defined in a way the slice would miss, in which
+        case the whole document has to be parsed
+    """
+    # a header-like line inside a multiline string can't be told apart from a
+    # header without parsing the document
+    if any(delimiter in data for delimiter in _MULTILINE_STRING_DELIMITERS):
+        return None
+
+    tool_header = re.compile(
+        rb"[ \t]*\[\[?[ \t]*tool[ \t]*\.[ \t]*"
+        + re.escape(tool_name.encode())
+        + rb"[ \t]*[\].]"
+    )
+
+    header_starts = [match.start() for match in _HEADER_PATTERN.finditer(data)]
+
+    tables: list[bytes] = []
+    for start, end in zip([0, *header_starts], [*header_starts, len(data)]):
+        if tool_header.match(data, start):
+            tables.append(data[start:end])
+        # a header-like line may be a row of a multiline array, so a root key can
+        # follow it: a `tool` key anywhere outside the tool's tables may be one
+        elif _OBSCURE_TOOL_HEADER_PATTERN.match(
+            data, start
+        ) or _ROOT_TOOL_KEY_PATTERN.search(data, start, end):
+            return None
+
+    return b"\n".join(tables)
+
+
+def _get_tool_values(
+    tools: typedefs.ConfigValues, tool_name: str
+) -> typedefs.ConfigValues:
+    """Get the values of a tool from the `tool` table of a pyproject document.
+
+    Args:
+        tools: the `tool` table
+        tool_name: the name of the tool
+
+    Returns:
+        the values of the tool, or an empty dict if there are none
+    """
+    values = tools.get(tool_name)
+    return values if isinstance(values, dict) else {}
+
+
+def _parse_tools(data: bytes) -> typedefs.ConfigValues:
+    """Parse the whole of a pyproject document and get its `tool` table.
+
+    Args:
+        data: the contents of the document
+
+    Returns:
+        the `tool` table, or an empty dict if there is none or the document is
+        invalid
+    """
+    try:
+        document = tomllib.loads(data.decode())
+    except tomllib.TOMLDecodeError:
+        return {}
+
+    tools = document.get("tool")
+    return tools if isinstance(tools, dict) else {}
+
+
+def _parse_tool(data: bytes, tool_name: str) -> typedefs.ConfigValues:
+    """Parse the values of a single tool from a pyproject document.
+
+    Only the tables of the tool are parsed when that is known to give the same
+    values as parsing the whole document.
+
+    Args:
+        data: the contents of the document
+        tool_name: the name of the tool
+
+    Returns:
+        the values of the tool, or an empty dict if there are none
+    """
+    if tool_name.encode() not in data:
+        return {}
+
+    tables = _slice_tool_tables(data, tool_name=tool_name)
+    if tables is not None:
+        try:
+            document = tomllib.loads(tables.decode())
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError):
+            pass
+        else:
+            return _get_tool_values(document.get("tool", {}), tool_name)
+
+    return _get_tool_values(_parse_tools(data), tool_name)
+
+
+class PyprojectLoader:
+    """Parses each pyproject document once for all the tools reading it.
+
+    Documents are identified by a digest of their contents. The first tool to read
+    a document only has its own tables parsed. Once another tool reads the same
+    document, the whole document is parsed and its `tool` table is kept for every
+    later reader.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        """Instantiate the class.
+
+        Args:
+            maxsize: the maximum number of documents to keep the `tool` table of
+        """
+        self._tools: caching.LRUCache[bytes, typedefs.ConfigValues] = caching.LRUCache(
+            maxsize=maxsize
+        )
+        self._first_readers: caching.LRUCache[bytes, str] = caching.LRUCache(
+            maxsize=maxsize
+        )
+
+    def load(self, data: bytes, tool_name: str) -> typedefs.ConfigValues:
+        """Get the values of a tool from a pyproject document.
+
+        Args:
+            data: the contents of the document
+            tool_name: the name of the tool
+
+        Returns:
+            the values of the tool, or an empty dict if there are none. The values
+            may be shared between tools and must not be mutated.
+        """
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+
+        tools = self._tools.get(digest)
+        if tools is None:
+            first_reader = self._first_readers.get(digest)
+            if first_reader is None or first_reader == tool_name:
+                self._first_readers.put(digest, tool_name)
+                return _parse_tool(data, tool_name=tool_name)
+
+            tools = _parse_tools(data)
+            self._tools.put(digest, tools)
+            self._first_readers.discard(digest)
+
+        return _get_tool_values(tools, tool_name)
+
+    def clear(self) -> None:
+        """Forget every document."""
+        self._tools.clear()
+        self._first_readers.clear()
+
+
 class PyprojectParser(toml.TomlParser):
     """Responsible for parsing pyproject.toml files.
 
+    Rather than parsing the whole document, only the tables of the tool are parsed
+    when that is known to give the same values. As a result, syntax errors outside
+    of those tables may go unnoticed.
+
     Implements the `Parser` protocol
     """
 
-    def __init__(self, tool_name: str) -> None:
+    def __init__(
+        self, tool_name: str, loader: typing.Optional[PyprojectLoader] = None
+    ) -> None:
         """Initialise the pyproject reader.
 
         Args:
             tool_name: the name of the package to look for in file, e.g.
                 `acme` part of `[tool.acme]`.
+            loader: an optional loader shared with the parsers of other tools, so
+                that a document read by several tools is parsed once
         """
         super().__init__(section_key=("tool", tool_name))
+        self.tool_name = tool_name
+        self.loader = loader
+
+    def parse_config(self, data: bytes) -> typedefs.ConfigValues:
+        """See the Parser.parse_config method."""
+        if self.loader is not None:
+            return self.loader.load(data, tool_name=self.tool_name)
+        return _parse_tool(data, tool_name=self.tool_name)
+
+
+loader = PyprojectLoader()
+"""The process-wide `PyprojectLoader` used by `UserConfig`."""
@@ -35,13 +35,33 @@ class TomlParser:
         """
         self.section_key = section_key or ()
 
-    def parse_config(self, file: typing.BinaryIO) -> typedefs.ConfigValues:
+    @property
+    def cache_key(self) -> typing.Hashable:
+        """Identify the values this parser produces for a given file.
+
+        Returns:
+            a key which is equal for parsers selecting the same section
+        """
+        return ("toml", self.section_key)
+
+    def parse_config(self, data: bytes) -> typedefs.ConfigValues:
         """See the Parser.parse_config method."""
         try:
-            values = dict(tomllib.load(file))
+            values = dict(tomllib.loads(data.decode()))
         except tomllib.TOMLDecodeError:
             return {}
 
+        return self._select_section(values)
+
+    def _select_section(self, values: typedefs.ConfigValues) -> typedefs.ConfigValues:
+        """Select the section identified by the section key.
+
+        Args:
+            values: the values of the whole document
+
+        Returns:
+            the values of the section, or an empty dict if there is no such section
+        """
         current = values
         for key in self.section_key:
             if key in current and isinstance(current[key], dict):
@@ -0,0 +1,117 @@
+"""Holds an index of config values by key path."""
+
+import bisect
+import functools
+import typing
+from collections.abc import Mapping
+
+from maison import subscriptions
+from maison import typedefs
+
+
+_WILDCARD = "*"
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_path(key_path: str) -> subscriptions.KeyPath:
+    """Split a dotted key path into its keys, remembering recent paths.
+
+    Args:
+        key_path: a dotted key path, e.g. `"db.pool"`
+
+    Returns:
+        the keys of the path
+    """
+    return subscriptions.parse_key_path(key_path)
+
+
+class PathIndex:
+    """The values of a config indexed by the key path of every table and value.
+
+    Looking up a key path is a single dict lookup, whatever its depth, and the
+    paths below a prefix are found by bisecting the sorted paths, which are only
+    sorted when first needed. The index is built once, and doesn't reflect later
+    changes to the values. Keys which aren't strings, such as those a schema may
+    give, can't be named in a key path, so the values below them aren't found.
+    """
+
+    def __init__(self, values: typedefs.ConfigValues) -> None:
+        """Index config values.
+
+        Args:
+            values: the config values
+        """
+        self._values: dict[subscriptions.KeyPath, typing.Any] = {(): values}
+        stack: list[tuple[subscriptions.KeyPath, Mapping[str, typing.Any]]] = [
+            ((), values)
+        ]
+
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = (*prefix, key)
+                self._values[path] = value
+                if isinstance(value, Mapping):
+                    stack.append((path, value))
+
+        self._paths: typing.Optional[list[subscriptions.KeyPath]] = None
+
+    def __len__(self) -> int:
+        """Return the number of indexed key paths.
+
+        Returns:
+            the number of key paths, including the empty path of the whole config
+        """
+        return len(self._values)
+
+    def get(self, key_path: str, default: typing.Any = None) -> typing.Any:
+        """Get the value at a key path.
+
+        Args:
+            key_path: a dotted key path, e.g. `"db.pool.size"`
+            default: the value to return if there is none at the key path
+
+        Returns:
+            the value at the key path, or the default
+        """
+        return self._values.get(compile_path(key_path), default)
+
+    def select(self, pattern: str) -> dict[str, typing.Any]:
+        """Get the values at the key paths matching a pattern.
+
+        Args:
+            pattern: a dotted key path in which `*` matches any single key, e.g.
+                `"services.*.port"` or `"db.*"`
+
+        Returns:
+            the matching dotted key paths and their values, in sorted order of the
+            paths
+        """
+        keys = compile_path(pattern)
+        if _WILDCARD not in keys:
+            value = self._values.get(keys, _MISSING)
+            return {} if value is _MISSING else {pattern: value}
+
+        if self._paths is None:
+            # concurrent readers may both sort the paths, to equal lists
+            self._paths = sorted(
+                path
+                for path in self._values
+                if all(isinstance(key, str) for key in path)
+            )
+        paths = self._paths
+
+        prefix = keys[: keys.index(_WILDCARD)]
+        selected: dict[str, typing.Any] = {}
+
+        for position in range(bisect.bisect_left(paths, prefix), len(paths)):
+            path = paths[position]
+            if path[: len(prefix)] != prefix:
+                break
+            if len(path) == len(keys) and all(
+                key in (_WILDCARD, path_key) for key, path_key in zip(keys, path)
+            ):
+                selected[".".join(path)] = self._values[path]
+
+        return selected
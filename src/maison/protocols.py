@@ -31,17 +31,68 @@ class Filesystem(typing.Protocol):
         """
         ...
 
-    def open_file(self, path: pathlib.Path) -> typing.BinaryIO:
-        """Open a file.
+    def get_file_paths(
+        self,
+        file_names: typing.Sequence[str],
+        starting_path: typing.Optional[pathlib.Path] = None,
+    ) -> list[pathlib.Path]:
+        """Search for several files in a single traversal up a filesystem from a path.
+
+        Args:
+            file_names: the names of the files or absolute paths to configs to search
+                for
+            starting_path: an optional path from which to start searching
+
+        Returns:
+            The `Path`s to the files that exist, in the same order as `file_names`
+        """
+        ...
+
+    def get_fingerprint(self, path: pathlib.Path) -> typedefs.FileFingerprint:
+        """Get a fingerprint of a file which changes whenever the file does.
 
         Args:
             path: the path to the file
 
         Returns:
-            the opened file as a binary I/O stream
+            the fingerprint of the file
         """
         ...
 
+    def read_file(self, path: pathlib.Path) -> bytes:
+        """Read the whole of a file, closing it before returning.
+
+        Args:
+            path: the path to the file
+
+        Returns:
+            the contents of the file
+        """
+        ...
+
+
+class AsyncFilesystem(typing.Protocol):
+    """Defines the interface for a class that interacts with a filesystem from asyncio.
+
+    The methods mirror those of `Filesystem` but must not block the event loop.
+    """
+
+    async def get_file_paths(
+        self,
+        file_names: typing.Sequence[str],
+        starting_path: typing.Optional[pathlib.Path] = None,
+    ) -> list[pathlib.Path]:
+        """See `Filesystem.get_file_paths`."""
+        ...
+
+    async def get_fingerprint(self, path: pathlib.Path) -> typedefs.FileFingerprint:
+        """See `Filesystem.get_fingerprint`."""
+        ...
+
+    async def read_file(self, path: pathlib.Path) -> bytes:
+        """See `Filesystem.read_file`."""
+        ...
+
 
 class ConfigParser(typing.Protocol):
     """Defines the interface for a class that parses a config."""
@@ -49,19 +100,33 @@ class ConfigParser(typing.Protocol):
     def parse_config(
         self,
         file_path: pathlib.Path,
-        file: typing.BinaryIO,
+        data: bytes,
     ) -> typedefs.ConfigValues:
         """Parse a config.
 
         Args:
             file_path: the path to a config file.
-            file: the binary I/O stream of the file.
+            data: the contents of the file.
 
         Returns:
             the parsed config
         """
         ...
 
+    def get_cache_key(
+        self, file_path: pathlib.Path
+    ) -> typing.Optional[typing.Hashable]:
+        """Get a key identifying how a config file will be parsed.
+
+        Args:
+            file_path: the path to a config file.
+
+        Returns:
+            a key which is equal for parsers producing the same values from the same
+            file, or `None` if the parsed values shouldn't be cached
+        """
+        ...
+
 
 class Validator(typing.Protocol):
     """Defines the interface for a class that validates some config values."""
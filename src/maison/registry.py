@@ -0,0 +1,217 @@
+"""Holds a registry which memoizes configs and the services behind them."""
+
+import pathlib
+import typing
+
+from maison import caching
+from maison import config
+from maison import disk_filesystem
+from maison import errors
+from maison import protocols
+from maison import service
+from maison import typedefs
+
+
+ConfigKey = tuple[str, pathlib.Path, tuple[str, ...], bool]
+
+
+class SharedConfig(config.UserConfig):
+    """A `UserConfig` shared by every caller asking a registry for it.
+
+    Its values are frozen and can't be replaced, so that no caller can change them
+    for the others. It can still be reloaded, which every caller sees.
+    """
+
+    @property
+    def values(self) -> typedefs.ConfigValues:
+        """Return the user's configuration values.
+
+        Returns:
+            the user's configuration values, which are frozen
+        """
+        return super().values
+
+    @values.setter
+    def values(self, values: typedefs.ConfigValues) -> None:  # noqa: ARG002
+        """Reject setting the values, which would change them for every caller.
+
+        Raises:
+            ReadOnlyConfigError: always
+        """
+        raise errors.ReadOnlyConfigError(
+            "The values of a shared config can't be set, create a UserConfig instead"
+        )
+
+    def validate(
+        self,
+        schema: typing.Optional[type[protocols.IsSchema]] = None,
+        use_schema_values: bool = True,
+    ) -> typedefs.ConfigValues:
+        """Validate the configuration without changing its values.
+
+        See `UserConfig.validate`.
+
+        Args:
+            schema: an optional class that follows the `IsSchema` protocol that
+                defines the schema
+            use_schema_values: must be `False`, as the values of a shared config
+                can't be replaced by the validated values
+
+        Returns:
+            the config values
+
+        Raises:
+            ReadOnlyConfigError: when `use_schema_values` is `True`
+        """
+        if use_schema_values:
+            raise errors.ReadOnlyConfigError(
+                "A shared config can't be validated with use_schema_values=True, "
+                "validate a UserConfig instead"
+            )
+        return super().validate(schema=schema, use_schema_values=False)
+
+
+class ConfigRegistry:
+    """A bounded registry of loaded `UserConfig` objects.
+
+    Configs are memoized by package name, starting path, source files and whether
+    they are merged. A service is memoized per package name and every service shares
+    a single filesystem, and so a single discovery cache.
+
+    A config is shared by every caller asking for it, so it is a `SharedConfig`: its
+    values are frozen and can't be set, and it can only be validated without using
+    the schema's values. Create a `UserConfig` to change the values.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        filesystem: typing.Optional[disk_filesystem.DiskFilesystem] = None,
+    ) -> None:
+        """Instantiate the class.
+
+        Args:
+            maxsize: the maximum number of configs, and of services, to hold. The
+                least recently used are evicted first.
+            filesystem: an optional filesystem to share between services
+        """
+        self.filesystem = filesystem or disk_filesystem.DiskFilesystem()
+        self._configs: caching.LRUCache[ConfigKey, SharedConfig] = caching.LRUCache(
+            maxsize=maxsize
+        )
+        self._services: caching.LRUCache[str, service.ConfigService] = caching.LRUCache(
+            maxsize=maxsize
+        )
+
+    def get_config(
+        self,
+        package_name: str,
+        starting_path: typing.Optional[pathlib.Path] = None,
+        source_files: typing.Optional[list[str]] = None,
+        merge_configs: bool = False,
+    ) -> SharedConfig:
+        """Get a config, loading it only if it isn't already held.
+
+        Args:
+            package_name: the name of the package, to be used to find the right section
+                in the config file
+            starting_path: an optional starting path to start the search for config
+                file. Defaults to the current working directory.
+            source_files: an optional list of source config filenames or absolute paths
+                to search for. If none is provided then `pyproject.toml` will be used.
+            merge_configs: an optional boolean to determine whether configs should be
+                merged if multiple are found
+
+        Returns:
+            the config, which is shared with every caller using the same arguments
+            and can't be modified
+        """
+        key: ConfigKey = (
+            package_name,
+            starting_path or pathlib.Path.cwd(),
+            tuple(source_files or ["pyproject.toml"]),
+            merge_configs,
+        )
+
+        user_config = self._configs.get(key)
+        if user_config is not None:
+            return user_config
+
+        # loading happens outside of any lock so that configs are loaded
+        # concurrently; of racing loads of the same config the first one is kept
+        user_config = SharedConfig(
+            package_name=package_name,
+            starting_path=key[1],
+            source_files=list(key[2]),
+            merge_configs=merge_configs,
+            frozen=True,
+            config_service=self._get_service(package_name=package_name),
+        )
+        return self._configs.setdefault(key, user_config)
+
+    def clear(self) -> None:
+        """Remove every config and service from the registry."""
+        self._configs.clear()
+        self._services.clear()
+
+    def cache_info(self) -> caching.CacheInfo:
+        """Return statistics about the configs held by the registry.
+
+        Returns:
+            the hits, misses, maximum size and current size of the registry
+        """
+        return self._configs.cache_info()
+
+    def _get_service(self, package_name: str) -> service.ConfigService:
+        """Get the service for a package, creating it if it isn't already held.
+
+        Args:
+            package_name: the name of the package
+
+        Returns:
+            the service
+        """
+        config_service = self._services.get(package_name)
+        if config_service is None:
+            config_service = self._services.setdefault(
+                package_name,
+                config.bootstrap_service(
+                    package_name=package_name, filesystem=self.filesystem
+                ),
+            )
+        return config_service
+
+
+_registry = ConfigRegistry()
+
+
+def get_config(
+    package_name: str,
+    starting_path: typing.Optional[pathlib.Path] = None,
+    source_files: typing.Optional[list[str]] = None,
+    merge_configs: bool = False,
+) -> SharedConfig:
+    """Get a config from the process-wide registry.
+
+    See `ConfigRegistry.get_config`.
+
+    Args:
+        package_name: the name of the package, to be used to find the right section
+            in the config file
+        starting_path: an optional starting path to start the search for config
+            file
+        source_files: an optional list of source config filenames or absolute paths
+            to search for
+        merge_configs: an optional boolean to determine whether configs should be
+            merged if multiple are found
+
+    Returns:
+        the config, which is shared with every caller using the same arguments
+        and has frozen values
+    """
+    return _registry.get_config(
+        package_name=package_name,
+        starting_path=starting_path,
+        source_files=source_files,
+        merge_configs=merge_configs,
+    )
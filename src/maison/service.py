@@ -1,14 +1,144 @@
 """Holds the definition of the main service class."""
 
+import hashlib
 import pathlib
 import typing
 from collections.abc import Iterable
+from concurrent import futures
 
+from maison import caching
+from maison import environment as config_environment
+from maison import layers as config_layers
+from maison import merging
 from maison import protocols
 from maison import typedefs
 from maison import utils
 
 
+if typing.TYPE_CHECKING:
+    from maison import disk_cache as persistent_cache
+
+
+def _get_cached_values(
+    key: caching.ParseKey,
+    parse_cache: typing.Optional[caching.ParseCache],
+    disk_cache: typing.Optional["persistent_cache.DiskCache"],
+) -> typing.Optional[typedefs.ConfigValues]:
+    """Get parsed config values from the parse cache, then the disk cache.
+
+    Args:
+        key: the fingerprint of the config file and the cache key of its parser
+        parse_cache: an optional cache of parsed config values
+        disk_cache: an optional cache of parsed config values on disk
+
+    Returns:
+        the cached values, or `None` if neither cache holds them
+    """
+    if parse_cache is not None:
+        values = parse_cache.get(key)
+        if values is not None:
+            return values
+
+    values = disk_cache.get(key) if disk_cache is not None else None
+    if values is not None and parse_cache is not None:
+        parse_cache.put(key, values)
+
+    return values
+
+
+def _cache_values(
+    key: caching.ParseKey,
+    values: typedefs.ConfigValues,
+    parse_cache: typing.Optional[caching.ParseCache],
+    disk_cache: typing.Optional["persistent_cache.DiskCache"],
+) -> None:
+    """Store parsed config values in the parse and disk caches.
+
+    Args:
+        key: the fingerprint of the config file and the cache key of its parser
+        values: the parsed values
+        parse_cache: an optional cache of parsed config values
+        disk_cache: an optional cache of parsed config values on disk
+    """
+    if disk_cache is not None:
+        disk_cache.put(key, values)
+    if parse_cache is not None:
+        parse_cache.put(key, values)
+
+
+def _add_environment_layer(
+    layers: list[typedefs.ConfigLayer],
+    environment: typing.Optional[config_environment.EnvironmentSource],
+    priority: config_environment.Priority,
+) -> list[typedefs.ConfigLayer]:
+    """Add the layer of an environment source to the layers of the config files.
+
+    Args:
+        layers: the layers of the config files
+        environment: an optional source of config values in environment variables
+        priority: whether the environment takes precedence over the config files,
+            `"highest"`, or the other way round, `"lowest"`
+
+    Returns:
+        the layers, with the environment's layer last if its priority is highest
+        and first if it is lowest
+    """
+    if environment is None:
+        return layers
+    if priority == "highest":
+        return [*layers, environment.get_layer()]
+    return [environment.get_layer(), *layers]
+
+
+def _get_fingerprint(
+    layers: Iterable[typedefs.ConfigLayer],
+    config_parser: protocols.ConfigParser,
+    merge_plan: typing.Optional[merging.MergePlan],
+) -> str:
+    """Compute a digest identifying the merge of some config layers.
+
+    Args:
+        layers: the layers
+        config_parser: the parser the layers' files were parsed with
+        merge_plan: the plan the layers are merged with
+
+    Returns:
+        a hex digest of the fingerprints of the layers, the cache keys of their
+        parsers and the strategies of the plan
+    """
+    key = (
+        tuple(
+            (
+                layer.fingerprint,
+                None
+                if layer.path is None
+                else config_parser.get_cache_key(file_path=layer.path),
+            )
+            for layer in layers
+        ),
+        None
+        if merge_plan is None
+        else (sorted(merge_plan.strategies.items()), merge_plan.list_key),
+    )
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+def _check_priority(priority: str) -> None:
+    """Check the priority of an environment source.
+
+    Args:
+        priority: the priority
+
+    Raises:
+        ValueError: when the priority is neither `"highest"` nor `"lowest"`
+    """
+    if priority not in config_environment.PRIORITIES:
+        raise ValueError(
+            f"The environment priority must be one of "
+            f"{config_environment.PRIORITIES}, not {priority!r}"
+        )
+
+
 class ConfigService:
     """The main service class."""
 
@@ -17,6 +147,12 @@ class ConfigService:
         filesystem: protocols.Filesystem,
         config_parser: protocols.ConfigParser,
         validator: protocols.Validator,
+        parse_cache: typing.Optional[caching.ParseCache] = None,
+        disk_cache: typing.Optional["persistent_cache.DiskCache"] = None,
+        max_workers: typing.Optional[int] = None,
+        environment: typing.Optional[config_environment.EnvironmentSource] = None,
+        environment_priority: config_environment.Priority = "highest",
+        merge_plan: typing.Optional[merging.MergePlan] = None,
     ) -> None:
         """Initialize the class.
 
@@ -24,10 +160,31 @@ class ConfigService:
             filesystem: a concretion of the `Filesystem` interface
             config_parser: a concretion of the `ConfigParser` interface
             validator: a concretion of the `Validator` interface
+            parse_cache: an optional cache of parsed config values, which may be
+                shared between services
+            disk_cache: an optional cache of parsed config values which persists
+                between processes
+            max_workers: an optional maximum number of threads with which to read
+                and parse the config files concurrently when merging them. If not
+                provided, the files are read and parsed one after the other.
+            environment: an optional source of config values in environment
+                variables, merged with the config files as a layer of its own
+            environment_priority: whether the environment takes precedence over
+                the config files, `"highest"`, or the other way round, `"lowest"`
+            merge_plan: an optional plan of the strategies with which to merge
+                the layers
         """
+        _check_priority(environment_priority)
+
         self.filesystem = filesystem
         self.config_parser = config_parser
         self.validator = validator
+        self.parse_cache = parse_cache
+        self.disk_cache = disk_cache
+        self.max_workers = max_workers
+        self.environment = environment
+        self.environment_priority = environment_priority
+        self.merge_plan = merge_plan
 
     def find_configs(
         self,
@@ -43,11 +200,9 @@ class ConfigService:
         Yields:
             An iterator of found config files.
         """
-        for source in source_files:
-            if filepath := self.filesystem.get_file_path(
-                file_name=source, starting_path=starting_path
-            ):
-                yield filepath
+        yield from self.filesystem.get_file_paths(
+            file_names=source_files, starting_path=starting_path
+        )
 
     def get_config_values(
         self,
@@ -62,19 +217,130 @@ class ConfigService:
                 configs are merged from right to left
 
         Returns:
-            The values from the config file(s)
+            The values from the config file(s), which share nothing with the
+            cached values
         """
-        config_values: typedefs.ConfigValues = {}
+        layers = self.get_config_layers(
+            config_file_paths=config_file_paths, merge_configs=merge_configs
+        )
+        return utils.copy_values(self.merge_layers(layers=layers).values)
+
+    def get_config_layers(
+        self,
+        config_file_paths: Iterable[pathlib.Path],
+        merge_configs: bool,
+        previous_layers: Iterable[typedefs.ConfigLayer] = (),
+    ) -> list[typedefs.ConfigLayer]:
+        """Get the parsed values of each config file as a separate layer.
+
+        If the service has an environment source, its layer is added too.
+
+        Args:
+            config_file_paths: an iterable of file paths for config files
+            merge_configs: whether or not the configs will be merged. If not, only
+                the first config is parsed.
+            previous_layers: an optional iterable of layers from an earlier call.
+                A file whose fingerprint is unchanged since then isn't parsed again.
+
+        Returns:
+            a layer for each config file, in the order of `config_file_paths`
+            whether or not they were parsed concurrently, and the environment's
+            layer first or last depending on its priority. The values of a layer
+            may be shared and must not be mutated.
+        """
+        paths = list(config_file_paths)
+        if not merge_configs:
+            paths = paths[:1]
+
+        previous = {layer.fingerprint: layer for layer in previous_layers}
+
+        def _get_layer(path: pathlib.Path) -> typedefs.ConfigLayer:
+            fingerprint = self.filesystem.get_fingerprint(path=path)
+            layer = previous.get(fingerprint)
+            if layer is None:
+                layer = typedefs.ConfigLayer(
+                    path=path,
+                    fingerprint=fingerprint,
+                    values=self._parse_config(path=path, fingerprint=fingerprint),
+                )
+            return layer
+
+        max_workers = min(self.max_workers or 1, len(paths))
+        if max_workers <= 1:
+            layers = [_get_layer(path) for path in paths]
+        else:
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # `map` yields the results in the order of the paths
+                layers = list(executor.map(_get_layer, paths))
+
+        return _add_environment_layer(
+            layers, environment=self.environment, priority=self.environment_priority
+        )
+
+    def merge_layers(
+        self,
+        layers: Iterable[typedefs.ConfigLayer],
+        previous: typing.Optional[config_layers.LayerStack] = None,
+    ) -> config_layers.LayerStack:
+        """Merge the values of config layers, later layers taking precedence.
+
+        Args:
+            layers: the layers to merge
+            previous: an optional result of an earlier merge. Only the layers from
+                the first one which differs from it onwards are merged again.
+
+        Returns:
+            the merged layers
+        """
+        return config_layers.LayerStack(
+            layers=list(layers), previous=previous, plan=self.merge_plan
+        )
+
+    def get_fingerprint(self, layers: Iterable[typedefs.ConfigLayer]) -> str:
+        """Compute a digest identifying the merge of config layers.
+
+        The digest is computed from the fingerprints of the layers rather than from
+        their values, so it changes whenever a file is modified, even if its values
+        don't.
+
+        Args:
+            layers: the layers
+
+        Returns:
+            a hex digest, which is the same for the same files parsed and merged the
+            same way
+        """
+        return _get_fingerprint(
+            layers, config_parser=self.config_parser, merge_plan=self.merge_plan
+        )
+
+    def _parse_config(
+        self, path: pathlib.Path, fingerprint: typedefs.FileFingerprint
+    ) -> typedefs.ConfigValues:
+        """Parse a config file, using the parse and disk caches if available.
+
+        Args:
+            path: the path to the config file
+            fingerprint: the fingerprint of the config file
+
+        Returns:
+            the parsed values, which may be shared with the caches
+        """
+        cache_key = self.config_parser.get_cache_key(file_path=path)
+
+        if cache_key is None:
+            data = self.filesystem.read_file(path=path)
+            return self.config_parser.parse_config(file_path=path, data=data)
 
-        for path in config_file_paths:
-            file = self.filesystem.open_file(path=path)
-            parsed_config = self.config_parser.parse_config(file_path=path, file=file)
-            config_values = utils.deep_merge(config_values, parsed_config)
+        key = (fingerprint, cache_key)
 
-            if not merge_configs:
-                break
+        parsed_config = _get_cached_values(key, self.parse_cache, self.disk_cache)
+        if parsed_config is None:
+            data = self.filesystem.read_file(path=path)
+            parsed_config = self.config_parser.parse_config(file_path=path, data=data)
+            _cache_values(key, parsed_config, self.parse_cache, self.disk_cache)
 
-        return config_values
+        return parsed_config
 
     def validate_config(
         self, values: typedefs.ConfigValues, schema: type[protocols.IsSchema]
@@ -89,3 +355,185 @@ class ConfigService:
             the validated values
         """
         return self.validator.validate(values=values, schema=schema)
+
+
+class AsyncConfigService:
+    """The main service class, for use with `asyncio`.
+
+    Filesystem access and parsing never block the event loop, and the config files
+    are fingerprinted and parsed concurrently.
+    """
+
+    def __init__(
+        self,
+        filesystem: protocols.AsyncFilesystem,
+        config_parser: protocols.ConfigParser,
+        validator: protocols.Validator,
+        parse_cache: typing.Optional[caching.ParseCache] = None,
+        disk_cache: typing.Optional["persistent_cache.DiskCache"] = None,
+        environment: typing.Optional[config_environment.EnvironmentSource] = None,
+        environment_priority: config_environment.Priority = "highest",
+        merge_plan: typing.Optional[merging.MergePlan] = None,
+    ) -> None:
+        """Initialize the class.
+
+        Args:
+            filesystem: a concretion of the `AsyncFilesystem` interface
+            config_parser: a concretion of the `ConfigParser` interface
+            validator: a concretion of the `Validator` interface
+            parse_cache: an optional cache of parsed config values, which may be
+                shared between services
+            disk_cache: an optional cache of parsed config values which persists
+                between processes
+            environment: an optional source of config values in environment
+                variables, merged with the config files as a layer of its own
+            environment_priority: whether the environment takes precedence over
+                the config files, `"highest"`, or the other way round, `"lowest"`
+            merge_plan: an optional plan of the strategies with which to merge
+                the layers
+        """
+        _check_priority(environment_priority)
+
+        self.filesystem = filesystem
+        self.config_parser = config_parser
+        self.validator = validator
+        self.parse_cache = parse_cache
+        self.disk_cache = disk_cache
+        self.environment = environment
+        self.environment_priority = environment_priority
+        self.merge_plan = merge_plan
+
+    async def find_configs(
+        self,
+        source_files: list[str],
+        starting_path: typing.Optional[pathlib.Path] = None,
+    ) -> list[pathlib.Path]:
+        """See `ConfigService.find_configs`."""
+        return await self.filesystem.get_file_paths(
+            file_names=source_files, starting_path=starting_path
+        )
+
+    async def get_config_values(
+        self,
+        config_file_paths: Iterable[pathlib.Path],
+        merge_configs: bool,
+    ) -> typedefs.ConfigValues:
+        """See `ConfigService.get_config_values`."""
+        layers = await self.get_config_layers(
+            config_file_paths=config_file_paths, merge_configs=merge_configs
+        )
+        return utils.copy_values(self.merge_layers(layers=layers).values)
+
+    async def get_config_layers(
+        self,
+        config_file_paths: Iterable[pathlib.Path],
+        merge_configs: bool,
+        previous_layers: Iterable[typedefs.ConfigLayer] = (),
+    ) -> list[typedefs.ConfigLayer]:
+        """See `ConfigService.get_config_layers`."""
+        import asyncio
+
+        paths = list(config_file_paths)
+        if not merge_configs:
+            paths = paths[:1]
+
+        previous = {layer.fingerprint: layer for layer in previous_layers}
+
+        fingerprints = await asyncio.gather(
+            *(self.filesystem.get_fingerprint(path=path) for path in paths)
+        )
+
+        async def _get_layer(
+            path: pathlib.Path, fingerprint: typedefs.FileFingerprint
+        ) -> typedefs.ConfigLayer:
+            layer = previous.get(fingerprint)
+            if layer is None:
+                layer = typedefs.ConfigLayer(
+                    path=path,
+                    fingerprint=fingerprint,
+                    values=await self._parse_config(path=path, fingerprint=fingerprint),
+                )
+            return layer
+
+        layers = await asyncio.gather(
+            *(_get_layer(path, fp) for path, fp in zip(paths, fingerprints))
+        )
+        return _add_environment_layer(
+            list(layers),
+            environment=self.environment,
+            priority=self.environment_priority,
+        )
+
+    def merge_layers(
+        self,
+        layers: Iterable[typedefs.ConfigLayer],
+        previous: typing.Optional[config_layers.LayerStack] = None,
+    ) -> config_layers.LayerStack:
+        """See `ConfigService.merge_layers`."""
+        return config_layers.LayerStack(
+            layers=list(layers), previous=previous, plan=self.merge_plan
+        )
+
+    def get_fingerprint(self, layers: Iterable[typedefs.ConfigLayer]) -> str:
+        """See `ConfigService.get_fingerprint`."""
+        return _get_fingerprint(
+            layers, config_parser=self.config_parser, merge_plan=self.merge_plan
+        )
+
+    async def _parse_config(
+        self, path: pathlib.Path, fingerprint: typedefs.FileFingerprint
+    ) -> typedefs.ConfigValues:
+        """See `ConfigService._parse_config`."""
+        import asyncio
+
+        cache_key = self.config_parser.get_cache_key(file_path=path)
+
+        if cache_key is None:
+            return await self._read_and_parse_config(path=path)
+
+        key = (fingerprint, cache_key)
+
+        # the disk cache blocks on file I/O, the parse cache alone doesn't
+        if self.disk_cache is None:
+            parsed_config = _get_cached_values(key, self.parse_cache, None)
+        else:
+            parsed_config = await asyncio.to_thread(
+                _get_cached_values, key, self.parse_cache, self.disk_cache
+            )
+
+        if parsed_config is None:
+            parsed_config = await self._read_and_parse_config(path=path)
+            if self.disk_cache is None:
+                _cache_values(key, parsed_config, self.parse_cache, None)
+            else:
+                await asyncio.to_thread(
+                    _cache_values,
+                    key,
+                    parsed_config,
+                    self.parse_cache,
+                    self.disk_cache,
+                )
+
+        return parsed_config
+
+    async def _read_and_parse_config(self, path: pathlib.Path) -> typedefs.ConfigValues:
+        """Read and parse a config file in a worker thread.
+
+        Args:
+            path: the path to the config file
+
+        Returns:
+            the parsed values
+        """
+        import asyncio
+
+        data = await self.filesystem.read_file(path=path)
+        return await asyncio.to_thread(
+            self.config_parser.parse_config, file_path=path, data=data
+        )
+
+    def validate_config(
+        self, values: typedefs.ConfigValues, schema: type[protocols.IsSchema]
+    ) -> typedefs.ConfigValues:
+        """See `ConfigService.validate_config`."""
+        return self.validator.validate(values=values, schema=schema)
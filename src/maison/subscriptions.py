@@ -0,0 +1,169 @@
+"""Holds the tools for notifying subscribers of changes to parts of a config."""
+
+import threading
+import typing
+from collections.abc import Mapping
+
+from maison import typedefs
+
+
+KeyPath = tuple[str, ...]
+Callback = typing.Callable[[typing.Any, typing.Any], None]
+
+_MISSING = object()
+
+
+def parse_key_path(key_path: str) -> KeyPath:
+    """Split a dotted key path into its keys.
+
+    Args:
+        key_path: a dotted key path, e.g. `"db.pool"`. An empty string refers to
+            the whole config.
+
+    Returns:
+        the keys of the path
+    """
+    return tuple(key_path.split(".")) if key_path else ()
+
+
+def get_value(values: typedefs.ConfigValues, key_path: KeyPath) -> typing.Any:
+    """Get the value at a key path.
+
+    Args:
+        values: the config values
+        key_path: the keys leading to the value
+
+    Returns:
+        the value, or `None` if there is no value at the path
+    """
+    current: typing.Any = values
+    for key in key_path:
+        if not isinstance(current, Mapping) or key not in current:
+            return None
+        current = current[key]
+    return current
+
+
+def diff_values(old: typedefs.ConfigValues, new: typedefs.ConfigValues) -> set[KeyPath]:
+    """Find the key paths at which two configs differ.
+
+    Mappings are compared key by key, any other values are compared as a whole.
+
+    Args:
+        old: the old config values
+        new: the new config values
+
+    Returns:
+        the deepest key paths at which a value was added, removed or changed
+    """
+    changes: set[KeyPath] = set()
+    stack: list[tuple[KeyPath, Mapping[str, typing.Any], Mapping[str, typing.Any]]] = [
+        ((), old, new)
+    ]
+
+    while stack:
+        prefix, old_node, new_node = stack.pop()
+        if old_node is new_node:
+            continue
+
+        for key in old_node.keys() | new_node.keys():
+            old_value = old_node.get(key, _MISSING)
+            new_value = new_node.get(key, _MISSING)
+
+            if isinstance(old_value, Mapping) and isinstance(new_value, Mapping):
+                stack.append(((*prefix, key), old_value, new_value))
+            elif old_value != new_value:
+                changes.add((*prefix, key))
+
+    return changes
+
+
+class Subscriptions:
+    """Callables subscribed to changes at key paths of a config."""
+
+    def __init__(self) -> None:
+        """Instantiate the class."""
+        self._callbacks: dict[KeyPath, list[Callback]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of subscribed callables.
+
+        Returns:
+            the number of subscribed callables
+        """
+        return sum(len(callbacks) for callbacks in self._callbacks.values())
+
+    def subscribe(self, key_path: str, callback: Callback) -> typing.Callable[[], None]:
+        """Subscribe a callable to changes at or below a key path.
+
+        Args:
+            key_path: a dotted key path, e.g. `"db.pool"`
+            callback: a callable to call with the old and new values at the key
+                path, either of which is `None` if there is no value there
+
+        Returns:
+            a callable which unsubscribes the callable
+        """
+        path = parse_key_path(key_path)
+
+        with self._lock:
+            self._callbacks.setdefault(path, []).append(callback)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                callbacks = self._callbacks.get(path, [])
+                if callback in callbacks:
+                    callbacks.remove(callback)
+                if not callbacks:
+                    _ = self._callbacks.pop(path, None)
+
+        return _unsubscribe
+
+    def dispatch(
+        self,
+        old: typedefs.ConfigValues,
+        new: typedefs.ConfigValues,
+        copy: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+    ) -> None:
+        """Call the callables subscribed to the key paths which changed.
+
+        The configs are diffed once, whatever the number of subscriptions, and
+        subtrees they share are skipped.
+
+        Args:
+            old: the old config values
+            new: the new config values
+            copy: an optional callable to copy the old and new values given to each
+                callable, so that the configs can't be modified through them
+        """
+        with self._lock:
+            if not self._callbacks:
+                return
+            subscriptions = [
+                (path, list(callbacks)) for path, callbacks in self._callbacks.items()
+            ]
+
+        changes = diff_values(old, new)
+        if not changes:
+            return
+
+        # a subscription is affected by a change at or below its path, which is
+        # then a prefix of the change, or by a change above its path
+        changed_prefixes = {
+            change[:index] for change in changes for index in range(len(change) + 1)
+        }
+
+        for path, callbacks in subscriptions:
+            if path not in changed_prefixes and not any(
+                path[:index] in changes for index in range(len(path))
+            ):
+                continue
+
+            old_value = get_value(old, path)
+            new_value = get_value(new, path)
+            for callback in callbacks:
+                if copy is None:
+                    callback(old_value, new_value)
+                else:
+                    callback(copy(old_value), copy(new_value))
@@ -1,6 +1,31 @@
 """Holds type definitions that are used across the package."""
 
+import pathlib
 import typing
 
 
 ConfigValues = dict[str, typing.Union[str, int, float, bool, None, "ConfigValues"]]
+
+
+class FileFingerprint(typing.NamedTuple):
+    """Identifies the contents of a file on disk without reading it."""
+
+    path: pathlib.Path
+    mtime_ns: int
+    size: int
+    inode: int
+
+
+class EnvironmentFingerprint(typing.NamedTuple):
+    """Identifies the environment variables behind a config layer."""
+
+    prefix: str
+    digest: str
+
+
+class ConfigLayer(typing.NamedTuple):
+    """The values of a single config source, a file or the environment."""
+
+    path: typing.Optional[pathlib.Path]
+    fingerprint: typing.Union[FileFingerprint, EnvironmentFingerprint]
+    values: ConfigValues
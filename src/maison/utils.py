@@ -1,5 +1,7 @@
 """Module to hold various utils."""
 
+import typing
+
 from maison import typedefs
 
 
@@ -15,7 +17,8 @@ def deep_merge(
     ...     "first": {"all_rows": {"pass": "dog", "fail": "cat", "number": "5"}}
     ... }
 
-    Note that the arguments may be modified!
+    Note that the arguments may be modified! See `merging.MergePlan.merge` for a
+    merge which modifies neither argument.
 
     Based on https://stackoverflow.com/a/20666342
 
@@ -44,3 +47,33 @@ def deep_merge(
             destination[key] = src_value
 
     return destination
+
+
+def copy_values(values: typedefs.ConfigValues) -> typedefs.ConfigValues:
+    """Copy config values so the copy can be modified without affecting the original.
+
+    Only dicts and lists are copied, every other value in a config is immutable.
+
+    Args:
+        values: the config values to copy
+
+    Returns:
+        the copied values
+    """
+    return typing.cast("typedefs.ConfigValues", copy_value(values))
+
+
+def copy_value(value: object) -> object:
+    """Copy a single config value, recursing into dicts and lists.
+
+    Args:
+        value: the value to copy
+
+    Returns:
+        the copied value
+    """
+    if isinstance(value, dict):
+        return {key: copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_value(item) for item in value]
+    return value
@@ -0,0 +1,452 @@
+"""Holds the tools for watching config files for changes."""
+
+import contextlib
+import ctypes
+import ctypes.util
+import logging
+import os
+import pathlib
+import select
+import struct
+import sys
+import threading
+import typing
+from collections.abc import AsyncIterator
+
+from maison import disk_filesystem
+from maison import typedefs
+
+
+logger = logging.getLogger(__name__)
+
+Callback = typing.Callable[[typedefs.ConfigValues], None]
+Targets = tuple[set[pathlib.Path], set[str]]
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def get_watch_targets(
+    source_files: typing.Iterable[str],
+    starting_path: typing.Optional[pathlib.Path] = None,
+    discovered_paths: typing.Iterable[pathlib.Path] = (),
+) -> Targets:
+    """Get the directories and entry names to watch for changes to a config.
+
+    Inotify only reports changes to the entries directly within a watched
+    directory, so for a nested relative source such as `.config/acme.toml` the
+    existing intermediate directories are watched too. Those created later are
+    found by getting the targets again.
+
+    Args:
+        source_files: the file names or absolute paths searched for
+        starting_path: the path the search starts from, defaulting to the current
+            working directory
+        discovered_paths: the paths to the config files found, whose parents are
+            watched
+
+    Returns:
+        the directories in which a config file could appear, change or disappear,
+        and the names of the directory entries which matter within them
+    """
+    start = starting_path or pathlib.Path.cwd()
+    directories: set[pathlib.Path] = set()
+    names: set[str] = set()
+
+    for source in source_files:
+        source_path = pathlib.Path(source).expanduser()
+        if source_path.is_absolute():
+            directories.add(source_path.parent)
+            names.add(source_path.name)
+            continue
+
+        names.update(source_path.parts)
+        for path in (start, *start.parents):
+            directories.add(path)
+            directories.update(
+                directory
+                for directory in disk_filesystem.get_candidate_directories(
+                    path, source
+                )[1:]
+                if directory.is_dir()
+            )
+
+    for discovered_path in discovered_paths:
+        directories.add(discovered_path.parent)
+        names.add(discovered_path.name)
+
+    return directories, names
+
+
+class _PollingBackend:
+    """Wakes up at a fixed interval, leaving it to the caller to look for changes."""
+
+    def __init__(self, interval: float) -> None:
+        """Instantiate the class.
+
+        Args:
+            interval: how long to wait between checks, in seconds
+        """
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def wait(self) -> bool:
+        """Wait for the next check.
+
+        Returns:
+            `True` when it's time to check, `False` when the backend was closed
+        """
+        return not self._stopped.wait(self.interval)
+
+    def drain(self, timeout: float) -> bool:  # noqa: ARG002
+        """Consume further changes, of which polling never knows.
+
+        Args:
+            timeout: how long to wait for a further change, in seconds
+
+        Returns:
+            `False`
+        """
+        return False
+
+    def update(self, directories: set[pathlib.Path], names: set[str]) -> None:
+        """Change what is watched, which polling doesn't need to know.
+
+        Args:
+            directories: the directories to watch
+            names: the names of the entries which matter in the directories
+        """
+
+    def close(self) -> None:
+        """Stop waiting."""
+        self._stopped.set()
+
+    def release(self) -> None:
+        """Release the resources of the backend, of which polling has none."""
+
+
+class _InotifyBackend:
+    """Wakes up when a relevant entry in one of the watched directories changes."""
+
+    def __init__(self, directories: set[pathlib.Path], names: set[str]) -> None:
+        """Instantiate the class.
+
+        Args:
+            directories: the directories to watch
+            names: the names of the entries which matter in the directories
+
+        Raises:
+            OSError: when inotify is unavailable or a directory can't be watched
+        """
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("libc not found")
+
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._names = {name.encode() for name in names}
+        self._fd: int = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._wake_read, self._wake_write = os.pipe()
+
+        for directory in directories:
+            if not self._add_watch(directory):
+                self.release()
+                raise OSError(ctypes.get_errno(), f"Can't watch {directory}")
+
+    def _add_watch(self, directory: pathlib.Path) -> bool:
+        """Watch a directory, which is a no-op if it is already watched.
+
+        Args:
+            directory: the directory
+
+        Returns:
+            whether the directory is watched
+        """
+        return self._libc.inotify_add_watch(self._fd, bytes(directory), _IN_MASK) >= 0
+
+    def update(self, directories: set[pathlib.Path], names: set[str]) -> None:
+        """Watch further directories, such as those created since watching began.
+
+        Args:
+            directories: the directories to watch
+            names: the names of the entries which matter in the directories
+        """
+        self._names = {name.encode() for name in names}
+        for directory in directories:
+            # a directory removed in the meantime is watched once it's back
+            if not self._add_watch(directory):
+                logger.debug("Can't watch %s", directory)
+
+    def wait(self) -> bool:
+        """Wait for a relevant change.
+
+        Returns:
+            `True` when a relevant change happened, `False` when the backend was
+            closed
+        """
+        return self.drain(timeout=None)
+
+    def drain(self, timeout: typing.Optional[float]) -> bool:
+        """Wait for a relevant change for a limited time.
+
+        Args:
+            timeout: how long to wait, in seconds, or `None` to wait indefinitely
+
+        Returns:
+            whether a relevant change happened in time
+        """
+        while True:
+            readable, _, _ = select.select([self._fd, self._wake_read], [], [], timeout)
+            if self._wake_read in readable or self._fd not in readable:
+                return False
+
+            # an irrelevant event isn't a reason to stop waiting
+            if self._read_events():
+                return True
+
+    def _read_events(self) -> bool:
+        """Read the pending events.
+
+        Returns:
+            whether any of the events concerned a relevant entry
+        """
+        relevant = False
+        with contextlib.suppress(BlockingIOError):
+            while data := os.read(self._fd, 64 * 1024):
+                offset = 0
+                while offset < len(data):
+                    _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                    offset += _EVENT_HEADER.size
+                    name = data[offset : offset + length].rstrip(b"\0")
+                    offset += length
+                    relevant = relevant or name in self._names
+        return relevant
+
+    def close(self) -> None:
+        """Stop waiting."""
+        with contextlib.suppress(OSError):
+            _ = os.write(self._wake_write, b"\0")
+
+    def release(self) -> None:
+        """Release the inotify instance, once nothing is waiting any more."""
+        for fd in (self._fd, self._wake_read, self._wake_write):
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+
+class ConfigWatcher:
+    """Watch the files behind a config and push new values to subscribers.
+
+    Changes are detected with inotify on Linux and by polling elsewhere. Bursts of
+    changes are debounced into a single check, which runs in a background thread.
+    """
+
+    def __init__(
+        self,
+        refresh: typing.Callable[[], bool],
+        get_values: typing.Callable[[], typedefs.ConfigValues],
+        directories: typing.Iterable[pathlib.Path],
+        names: typing.Iterable[str],
+        debounce: float = 0.1,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+        get_targets: typing.Optional[typing.Callable[[], Targets]] = None,
+    ) -> None:
+        """Instantiate the class.
+
+        Args:
+            refresh: a callable which reloads the config if it has changed and
+                returns whether it did
+            get_values: a callable which returns the current config values
+            directories: the directories to watch
+            names: the names of the entries which matter in the directories
+            debounce: how long to wait for changes to settle before reloading, in
+                seconds
+            poll_interval: how often to check for changes when polling, in seconds
+            use_inotify: whether to use inotify where it's available
+            get_targets: an optional callable which gets the directories and names
+                to watch again, called after each change so that directories
+                created since watching began are watched too
+        """
+        self._refresh = refresh
+        self._get_values = get_values
+        self._directories = set(directories)
+        self._names = set(names)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._get_targets = get_targets
+
+        self._callbacks: list[Callback] = []
+        self._lock = threading.Lock()
+        self._thread: typing.Optional[threading.Thread] = None
+        self._backend: typing.Union[_InotifyBackend, _PollingBackend, None] = None
+
+    def __enter__(self) -> "ConfigWatcher":
+        """Start watching.
+
+        Returns:
+            the watcher
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop watching."""
+        self.stop()
+
+    @property
+    def backend(self) -> typing.Optional[str]:
+        """Return the name of the mechanism used to detect changes.
+
+        Returns:
+            `"inotify"` or `"polling"` while the watcher runs, otherwise `None`
+        """
+        if isinstance(self._backend, _InotifyBackend):
+            return "inotify"
+        if isinstance(self._backend, _PollingBackend):
+            return "polling"
+        return None
+
+    def subscribe(self, callback: Callback) -> None:
+        """Call a callable with the new config values whenever they change.
+
+        Args:
+            callback: the callable
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callback) -> None:
+        """Stop calling a callable subscribed with `subscribe`.
+
+        Args:
+            callback: the callable
+        """
+        with self._lock, contextlib.suppress(ValueError):
+            self._callbacks.remove(callback)
+
+    def start(self) -> None:
+        """Start watching in a background thread, unless already watching."""
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._backend = self._create_backend()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._backend,), daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background thread to finish."""
+        with self._lock:
+            thread, backend = self._thread, self._backend
+            self._thread = self._backend = None
+
+        if backend is not None:
+            backend.close()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __aiter__(self) -> AsyncIterator[typedefs.ConfigValues]:
+        """Iterate asynchronously over the new config values as they change.
+
+        Returns:
+            an async iterator, which starts the watcher if needed
+        """
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[typedefs.ConfigValues]:
+        """Yield the new config values as they change.
+
+        Yields:
+            the new config values
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[typedefs.ConfigValues] = asyncio.Queue()
+
+        def _callback(values: typedefs.ConfigValues) -> None:
+            _ = loop.call_soon_threadsafe(queue.put_nowait, values)
+
+        self.subscribe(_callback)
+        self.start()
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.unsubscribe(_callback)
+
+    def _create_backend(self) -> typing.Union[_InotifyBackend, _PollingBackend]:
+        """Create the mechanism used to detect changes.
+
+        Returns:
+            an inotify backend if possible, otherwise a polling backend
+        """
+        if self.use_inotify and sys.platform.startswith("linux"):
+            try:
+                return _InotifyBackend(directories=self._directories, names=self._names)
+            except (OSError, AttributeError):
+                logger.debug("inotify is unavailable, falling back to polling")
+        return _PollingBackend(interval=self.poll_interval)
+
+    def _run(self, backend: typing.Union[_InotifyBackend, _PollingBackend]) -> None:
+        """Reload the config whenever the backend detects a change, until stopped.
+
+        Args:
+            backend: the mechanism used to detect changes
+        """
+        try:
+            while backend.wait():
+                # let a burst of changes settle before looking at the files
+                while backend.drain(timeout=self.debounce):
+                    pass
+
+                if self._backend is not backend:
+                    return
+
+                try:
+                    # watch the new directories before reloading, so that a file
+                    # created in them since is either read now or noticed later
+                    if self._get_targets is not None:
+                        backend.update(*self._get_targets())
+                    if self._refresh():
+                        self._notify(self._get_values())
+                except Exception:
+                    logger.exception("Failed to reload the config")
+        finally:
+            backend.release()
+
+    def _notify(self, values: typedefs.ConfigValues) -> None:
+        """Call the subscribed callables with new config values.
+
+        Args:
+            values: the new config values
+        """
+        with self._lock:
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(values)
+            except Exception:
+                logger.exception("A config watcher callback failed")
@@ -20,7 +20,7 @@ class TestConfig:
         cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
 
         assert cfg.values == {"hello": True}
-        assert cfg.discovered_paths == [fp]
+        assert cfg.discovered_paths == (fp,)
         assert cfg.path == fp
 
     def test_merges_configs(self, tmp_path: pathlib.Path):
@@ -45,7 +45,7 @@ class TestConfig:
         )
 
         assert cfg.values == {"hello": True, "goodbye": True}
-        assert cfg.discovered_paths == [pyproject_fp, toml_fp]
+        assert cfg.discovered_paths == (pyproject_fp, toml_fp)
         assert cfg.path == [pyproject_fp, toml_fp]
 
 
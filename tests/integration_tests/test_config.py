@@ -1,10 +1,22 @@
+import asyncio
 import pathlib
+import subprocess
+import sys
 import textwrap
+import threading
+import typing
+import warnings
 
 import pytest
 
 from maison import config
+from maison import config_parser
+from maison import config_validator
+from maison import disk_filesystem
 from maison import errors
+from maison import frozen
+from maison import parsers
+from maison import service
 from maison import typedefs
 
 
@@ -33,6 +45,36 @@ class TestUserConfig:
 
         assert cfg.values == {"hello": True}
 
+    def test_mutating_values_does_not_affect_other_configs(
+        self, tmp_path: pathlib.Path
+    ):
+        _ = (tmp_path / "first.toml").write_text("[db]\nhost = 'first'\n")
+        _ = (tmp_path / "second.toml").write_text("[db]\nport = 1\n")
+        kwargs = {
+            "package_name": "acme",
+            "starting_path": tmp_path,
+            "source_files": ["first.toml", "second.toml"],
+            "merge_configs": True,
+        }
+
+        cfg = config.UserConfig(**kwargs)  # type: ignore[arg-type]
+        cfg.values["db"]["host"] = "changed"  # type: ignore[index]
+
+        assert config.UserConfig(**kwargs).values == {  # type: ignore[arg-type]
+            "db": {"host": "first", "port": 1}
+        }
+
+    def test_values_are_reparsed_after_edit(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+
+        _ = config.UserConfig(package_name="acme", starting_path=tmp_path)
+        _ = fp.write_text("[tool.acme]\nhello = 'world'\n")
+
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        assert cfg.values == {"hello": "world"}
+
     def test_discovered_paths(self, tmp_path: pathlib.Path):
         fp = tmp_path / "pyproject.toml"
         content = textwrap.dedent("""
@@ -43,7 +85,363 @@ class TestUserConfig:
 
         cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
 
-        assert cfg.discovered_paths == [fp]
+        assert cfg.discovered_paths == (fp,)
+
+    def test_discovered_paths_are_memoized(self, tmp_path: pathlib.Path):
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+
+        assert cfg.discovered_paths == ()
+        assert cfg.path is None
+
+    def test_reload(self, tmp_path: pathlib.Path):
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+        cfg.values = {"set": True}
+
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        cfg.reload()
+
+        assert cfg.discovered_paths == (fp,)
+        assert cfg.values == {"hello": True}
+
+    def test_refresh_if_changed_without_changes(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+        values = cfg.values
+
+        assert cfg.refresh_if_changed() is False
+        assert cfg.values is values
+
+    def test_refresh_if_changed_after_edit(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        _ = fp.write_text("[tool.acme]\nhello = 'world'\n")
+
+        assert cfg.refresh_if_changed() is True
+        assert cfg.values == {"hello": "world"}
+
+    def test_refresh_if_changed_after_shadowing_file_appears(
+        self, tmp_path: pathlib.Path
+    ):
+        nested = tmp_path / "nested"
+        nested.mkdir()
+        _ = (tmp_path / "pyproject.toml").write_text("[tool.acme]\nhello = true\n")
+        cfg = config.UserConfig(package_name="acme", starting_path=nested)
+
+        closest = nested / "pyproject.toml"
+        _ = closest.write_text("[tool.acme]\nhello = false\n")
+
+        assert cfg.refresh_if_changed() is True
+        assert cfg.path == closest
+        assert cfg.values == {"hello": False}
+
+    def test_refresh_if_changed_reparses_only_changed_files(
+        self, tmp_path: pathlib.Path
+    ):
+        first = tmp_path / "first.toml"
+        _ = first.write_text("a = 1\n")
+        second = tmp_path / "second.toml"
+        _ = second.write_text("b = 1\n")
+        cfg = config.UserConfig(
+            package_name="acme",
+            starting_path=tmp_path,
+            source_files=["first.toml", "second.toml"],
+            merge_configs=True,
+        )
+        first_layer = cfg._load().stack.layers[0]
+
+        _ = second.write_text("b = 22\n")
+
+        assert cfg.refresh_if_changed() is True
+        assert cfg._load().stack.layers[0] is first_layer
+        assert cfg.values == {"a": 1, "b": 22}
+
+    def test_env_prefix(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        _ = (tmp_path / "pyproject.toml").write_text(
+            "[tool.acme]\nhello = true\n[tool.acme.db]\nhost = 'localhost'\n"
+        )
+        monkeypatch.setenv("ACME__DB__POOL_SIZE", "20")
+
+        cfg = config.UserConfig(
+            package_name="acme", starting_path=tmp_path, env_prefix="ACME"
+        )
+
+        assert cfg.values == {
+            "hello": True,
+            "db": {"host": "localhost", "pool_size": 20},
+        }
+
+        monkeypatch.setenv("ACME__HELLO", "false")
+
+        assert cfg.refresh_if_changed()
+        assert cfg.values["hello"] is False
+
+    def test_json_source_file(self, tmp_path: pathlib.Path):
+        _ = (tmp_path / "acme.json").write_text('{"hello": {"world": true}}')
+
+        cfg = config.UserConfig(
+            package_name="acme", starting_path=tmp_path, source_files=["acme.json"]
+        )
+
+        assert cfg.values == {"hello": {"world": True}}
+
+    def test_merges_configs_parsed_in_parallel(self, tmp_path: pathlib.Path):
+        source_files = [f"{index}.toml" for index in range(8)]
+        for index, source_file in enumerate(source_files):
+            _ = (tmp_path / source_file).write_text(
+                f"value = {index}\nkey{index} = 1\n"
+            )
+
+        cfg = config.UserConfig(
+            package_name="acme",
+            starting_path=tmp_path,
+            source_files=source_files,
+            merge_configs=True,
+            max_workers=4,
+        )
+
+        assert cfg.values == {
+            "value": 7,
+            **{f"key{index}": 1 for index in range(8)},
+        }
+
+    def test_merge_strategies(self, tmp_path: pathlib.Path):
+        _ = (tmp_path / "base.toml").write_text(
+            "plugins = ['a']\n[[hooks]]\nname = 'lint'\nargs = ['-q']\n"
+        )
+        _ = (tmp_path / "local.toml").write_text(
+            "plugins = ['b']\n[[hooks]]\nname = 'lint'\nfix = true\n"
+        )
+
+        cfg = config.UserConfig(
+            package_name="acme",
+            starting_path=tmp_path,
+            source_files=["base.toml", "local.toml"],
+            merge_configs=True,
+            merge_strategies={"plugins": "append", "hooks": "keyed"},
+        )
+
+        assert cfg.values == {
+            "plugins": ["a", "b"],
+            "hooks": [{"name": "lint", "args": ["-q"], "fix": True}],
+        }
+
+    def test_view(self, tmp_path: pathlib.Path):
+        _ = (tmp_path / "base.toml").write_text("[db]\nhost = 'a'\nport = 1\n")
+        _ = (tmp_path / "local.toml").write_text("[db]\nport = 2\n")
+
+        cfg = config.UserConfig(
+            package_name="acme",
+            starting_path=tmp_path,
+            source_files=["base.toml", "local.toml"],
+            merge_configs=True,
+        )
+
+        assert cfg.view["db"]["port"] == 2
+        assert cfg._load().values is None
+        assert cfg.view == cfg.values == {"db": {"host": "a", "port": 2}}
+
+        _ = (tmp_path / "local.toml").write_text("[db]\nport = 3\n")
+
+        assert cfg.refresh_if_changed()
+        assert cfg.view["db"]["port"] == 3
+
+    def test_mutating_view_does_not_leak(self, tmp_path: pathlib.Path):
+        _ = (tmp_path / "pyproject.toml").write_text(
+            "[[tool.acme.plugins]]\nname = 'a'\n[[tool.acme.plugins]]\nname = 'b'\n"
+        )
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        cfg.view["plugins"][0]["v"] = "changed"
+        cfg.view["plugins"].append("junk")
+
+        assert config.UserConfig(
+            package_name="acme", starting_path=tmp_path
+        ).values == {"plugins": [{"name": "a"}, {"name": "b"}]}
+        with pytest.raises(TypeError):
+            cfg.view["plugins"] = []  # type: ignore[index]
+
+    def test_get_and_select(self, tmp_path: pathlib.Path):
+        _ = (tmp_path / "pyproject.toml").write_text(
+            "[tool.acme.db]\nhost = 'a'\nport = 1\n"
+        )
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        assert cfg.get("db.port") == 1
+        assert cfg.get("db.user", default="root") == "root"
+        assert cfg.select("db.*") == {"db.host": "a", "db.port": 1}
+
+        cfg.values = {"db": {"port": 2}}
+
+        assert cfg.get("db.port") == 2
+
+        # e.g. validated with a `dict[int, str]` field
+        cfg.values = {"ports": {80: "http"}, "db": {"port": 3}}
+
+        assert cfg.get("db.port") == 3
+        assert cfg.select("ports.*") == {}
+
+    def test_frozen(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhosts = ['a']\n[tool.acme.db]\nport = 1\n")
+        cfg = config.UserConfig(
+            package_name="acme", starting_path=tmp_path, frozen=True
+        )
+        values = cfg.values
+        changes: list[tuple[object, object]] = []
+        _ = cfg.subscribe("db.port", lambda old, new: changes.append((old, new)))
+
+        assert isinstance(values, frozen.FrozenDict)
+        assert values == {"hosts": ("a",), "db": {"port": 1}}
+        assert cfg.get("db.port") == 1
+        assert cfg.values is values
+
+        _ = fp.write_text("[tool.acme]\nhosts = ['a']\n[tool.acme.db]\nport = 2\n")
+
+        assert cfg.refresh_if_changed()
+        assert cfg.values == {"hosts": ("a",), "db": {"port": 2}}
+        assert hash(cfg.values) != hash(values)
+        assert changes == [(1, 2)]
+
+        cfg.values = {"db": {"port": 1}, "hosts": ["a"]}
+
+        assert isinstance(cfg.values, frozen.FrozenDict)
+        assert hash(cfg.values) == hash(values)
+
+    def test_fingerprint(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+        fingerprint = cfg.fingerprint
+
+        assert len(fingerprint) == 64
+        assert (
+            config.UserConfig(package_name="acme", starting_path=tmp_path).fingerprint
+            == fingerprint
+        )
+        assert (
+            config.UserConfig(package_name="other", starting_path=tmp_path).fingerprint
+            != fingerprint
+        )
+
+        _ = fp.write_text("[tool.acme]\nhello = 'world'\n")
+
+        assert cfg.refresh_if_changed()
+        assert cfg.fingerprint != fingerprint
+
+    def test_generation(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        assert cfg.generation == 0
+
+        _ = fp.write_text("[tool.acme]\nhello = true \n")
+        cfg.reload()
+
+        assert cfg.generation == 0
+
+        _ = fp.write_text("[tool.acme]\nhello = false\n")
+
+        assert cfg.refresh_if_changed()
+        assert cfg.generation == 1
+
+        cfg.values = {"hello": False}
+
+        assert cfg.generation == 1
+
+        cfg.values = {"hello": True}
+
+        assert cfg.generation == 2
+
+        _ = fp.write_text("[tool.acme]\nhello = 'world'\n")
+        cfg.reload()
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        cfg.reload()
+
+        # the change was undone before the generation was read
+        assert cfg.generation == 2
+
+    def test_reload_does_not_merge_values_read_through_view(
+        self, tmp_path: pathlib.Path
+    ):
+        _ = (tmp_path / "base.toml").write_text("[db]\nhost = 'a'\nport = 1\n")
+        _ = (tmp_path / "local.toml").write_text("[db]\nport = 2\n")
+        cfg = config.UserConfig(
+            package_name="acme",
+            starting_path=tmp_path,
+            source_files=["base.toml", "local.toml"],
+            merge_configs=True,
+        )
+        assert cfg.view["db"]["port"] == 2
+
+        _ = (tmp_path / "local.toml").write_text("[db]\nport = 3\n")
+        cfg.reload()
+        _ = (tmp_path / "local.toml").write_text("[db]\nport = 4\n")
+
+        assert cfg.refresh_if_changed()
+        assert cfg.view["db"]["port"] == 4
+        assert cfg._load().stack._merges is None
+        assert cfg.generation == 1
+
+    def test_frozen_touch_without_changes_returns_false(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhosts = ['a']\n")
+        cfg = config.UserConfig(
+            package_name="acme", starting_path=tmp_path, frozen=True
+        )
+        _ = cfg.values
+
+        _ = fp.write_text("[tool.acme]\nhosts = ['a'] \n")
+
+        assert cfg.refresh_if_changed() is False
+        assert cfg.generation == 0
+
+    def test_touch_without_changes_returns_false(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        _ = fp.write_text("[tool.acme]\nhello =  true\n")
+
+        assert cfg.refresh_if_changed() is False
+        assert cfg.values == {"hello": True}
+
+    def test_subscribe(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme.db]\npool = 1\n[tool.acme.cache]\nttl = 1\n")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+        calls: list[tuple[str, object, object]] = []
+        _ = cfg.subscribe("db.pool", lambda old, new: calls.append(("db", old, new)))
+        _ = cfg.subscribe("cache", lambda old, new: calls.append(("cache", old, new)))
+
+        _ = fp.write_text("[tool.acme.db]\npool = 20\n[tool.acme.cache]\nttl = 1\n")
+        _ = cfg.refresh_if_changed()
+
+        assert calls == [("db", 1, 20)]
+
+    def test_mutating_subscriber_does_not_leak(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme.db]\nport = 1\n")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        def _mutate(old: typing.Any, new: typing.Any) -> None:
+            old["port"] = new["port"] = 999
+
+        _ = cfg.subscribe("db", _mutate)
+        _ = fp.write_text("[tool.acme.db]\nport = 2\n")
+
+        assert cfg.refresh_if_changed()
+        assert cfg.values == {"db": {"port": 2}}
+        assert config.UserConfig(
+            package_name="acme", starting_path=tmp_path
+        ).values == {"db": {"port": 2}}
 
     def test_path_no_sources(self, tmp_path: pathlib.Path):
         cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
@@ -79,6 +477,118 @@ class TestUserConfig:
         assert cfg.schema == NewSchema
 
 
+class TestImports:
+    def test_parsers_are_imported_when_first_used(self, tmp_path: pathlib.Path):
+        _ = (tmp_path / "acme.ini").write_text("[section]\nkey = value\n")
+        script = textwrap.dedent(f"""
+            import pathlib
+            import sys
+            import maison
+
+            assert "tomllib" not in sys.modules
+            assert "configparser" not in sys.modules
+
+            config = maison.UserConfig(
+                package_name="acme",
+                starting_path=pathlib.Path({str(tmp_path)!r}),
+                source_files=["acme.ini"],
+            )
+
+            assert config.values == {{"section": {{"key": "value"}}}}
+            assert "configparser" in sys.modules
+            assert "maison.parsers.toml" not in sys.modules
+        """)
+
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script], capture_output=True, text=True, check=False
+        )
+
+        assert result.returncode == 0, result.stderr
+
+
+class TestFileHandles:
+    def test_loading_closes_every_file(self, tmp_path: pathlib.Path):
+        fd_directory = pathlib.Path("/proc/self/fd")
+        if not fd_directory.is_dir():
+            pytest.skip("requires /proc/self/fd")
+
+        _ = (tmp_path / "pyproject.toml").write_text("[tool.acme]\nhello = true\n")
+        _ = (tmp_path / "acme.ini").write_text("[section]\nkey = value\n")
+        _config_parser = config_parser.ConfigParser()
+        _config_parser.register_parser(
+            suffix=".toml",
+            parser=parsers.PyprojectParser(tool_name="acme"),
+            stem="pyproject",
+        )
+        _config_parser.register_parser(suffix=".ini", parser=parsers.IniParser())
+        config_service = service.ConfigService(
+            filesystem=disk_filesystem.DiskFilesystem(),
+            config_parser=_config_parser,
+            validator=config_validator.Validator(),
+        )
+        paths = [tmp_path / "pyproject.toml", tmp_path / "acme.ini"]
+
+        fd_count = len(list(fd_directory.iterdir()))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            for _ in range(200):
+                values = config_service.get_config_values(
+                    config_file_paths=paths, merge_configs=True
+                )
+
+        assert values == {"hello": True, "section": {"key": "value"}}
+        assert len(list(fd_directory.iterdir())) == fd_count
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+class TestLazy:
+    def test_defers_loading_until_values_are_read(self, tmp_path: pathlib.Path):
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path, lazy=True)
+
+        assert cfg._service_instance is None
+
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+
+        assert cfg.values == {"hello": True}
+        assert cfg.path == fp
+
+    def test_loads_once_across_threads(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path, lazy=True)
+
+        results: list[typedefs.ConfigValues] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cfg.values))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+
+    def test_validate_loads_values(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+
+        class Schema:
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                self.kwargs = kwargs
+
+            def model_dump(self) -> typedefs.ConfigValues:
+                return dict(self.kwargs)  # type: ignore[arg-type]
+
+        cfg = config.UserConfig(
+            package_name="acme", starting_path=tmp_path, schema=Schema, lazy=True
+        )
+
+        assert cfg.validate() == {"hello": True}
+
+
 class TestValidate:
     def test_no_schema(self):
         cfg = config.UserConfig(package_name="acme")
@@ -133,3 +643,80 @@ class TestValidate:
         values = cfg.validate(use_schema_values=True)
 
         assert values == {"key": "validated"}
+
+
+class TestAsyncUserConfig:
+    def test_str(self):
+        cfg = config.AsyncUserConfig(package_name="acme")
+
+        assert str(cfg) == "<class 'AsyncUserConfig'>"
+
+    def test_load(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+
+        cfg = asyncio.run(
+            config.AsyncUserConfig.load(package_name="acme", starting_path=tmp_path)
+        )
+
+        assert cfg.values == {"hello": True}
+        assert cfg.discovered_paths == (fp,)
+        assert cfg.path == fp
+
+    def test_merges_configs(self, tmp_path: pathlib.Path):
+        _ = (tmp_path / "pyproject.toml").write_text("[tool.acme]\nhello = true\n")
+        _ = (tmp_path / "acme.ini").write_text("[section]\nkey = value\n")
+
+        cfg = asyncio.run(
+            config.AsyncUserConfig.load(
+                package_name="acme",
+                starting_path=tmp_path,
+                source_files=["pyproject.toml", "acme.ini"],
+                merge_configs=True,
+            )
+        )
+
+        assert cfg.values == {"hello": True, "section": {"key": "value"}}
+
+    def test_values_before_load(self):
+        cfg = config.AsyncUserConfig(package_name="acme")
+
+        with pytest.raises(errors.NotLoadedError):
+            _ = cfg.values
+
+    def test_refresh_if_changed(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        changes: list[tuple[object, object]] = []
+
+        async def _refresh() -> tuple[bool, bool]:
+            cfg = await config.AsyncUserConfig.load(
+                package_name="acme", starting_path=tmp_path
+            )
+            _ = cfg.subscribe("hello", lambda old, new: changes.append((old, new)))
+            unchanged = await cfg.refresh_if_changed()
+            _ = fp.write_text("[tool.acme]\nhello = 'world'\n")
+            changed = await cfg.refresh_if_changed()
+            return unchanged, changed
+
+        assert asyncio.run(_refresh()) == (False, True)
+        assert changes == [(True, "world")]
+
+    def test_validate(self, tmp_path: pathlib.Path):
+        class Schema:
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                pass
+
+            def model_dump(self) -> typedefs.ConfigValues:
+                return {"key": "validated"}
+
+        _ = (tmp_path / "pyproject.toml").write_text("[tool.acme]\nhello = 1\n")
+
+        cfg = asyncio.run(
+            config.AsyncUserConfig.load(
+                package_name="acme", starting_path=tmp_path, schema=Schema
+            )
+        )
+
+        assert cfg.validate() == {"key": "validated"}
+        assert cfg.values == {"key": "validated"}
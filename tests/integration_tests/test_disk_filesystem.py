@@ -45,6 +45,67 @@ class TestGetFilePath:
         assert result is None
 
 
+class TestGetFilePaths:
+    def test_returns_paths_in_priority_order(self, tmp_path: pathlib.Path):
+        fs = disk_filesystem.DiskFilesystem()
+
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+
+        upper = tmp_path / "acme.ini"
+        _ = upper.write_text("")
+        lower = nested / "pyproject.toml"
+        _ = lower.write_text("")
+
+        result = fs.get_file_paths(
+            ["acme.ini", "ghost.toml", "pyproject.toml"], starting_path=nested
+        )
+
+        assert result == [upper, lower]
+
+    def test_finds_closest_file(self, tmp_path: pathlib.Path):
+        fs = disk_filesystem.DiskFilesystem()
+
+        nested = tmp_path / "a"
+        nested.mkdir()
+
+        _ = (tmp_path / "pyproject.toml").write_text("")
+        closest = nested / "pyproject.toml"
+        _ = closest.write_text("")
+
+        result = fs.get_file_paths(["pyproject.toml"], starting_path=nested)
+
+        assert result == [closest]
+
+    def test_ignores_directories(self, tmp_path: pathlib.Path):
+        fs = disk_filesystem.DiskFilesystem()
+
+        nested = tmp_path / "a"
+        (nested / "pyproject.toml").mkdir(parents=True)
+        file = tmp_path / "pyproject.toml"
+        _ = file.write_text("")
+
+        result = fs.get_file_paths(["pyproject.toml"], starting_path=nested)
+
+        assert result == [file]
+
+    def test_handles_absolute_and_nested_relative_paths(self, tmp_path: pathlib.Path):
+        fs = disk_filesystem.DiskFilesystem()
+
+        nested = tmp_path / "a"
+        (nested / ".config").mkdir(parents=True)
+        relative = nested / ".config" / "acme.toml"
+        _ = relative.write_text("")
+        absolute = tmp_path / "absolute.ini"
+        _ = absolute.write_text("")
+
+        result = fs.get_file_paths(
+            [".config/acme.toml", str(absolute)], starting_path=nested
+        )
+
+        assert result == [relative, absolute]
+
+
 class TestOpenFile:
     def test_opens_file(self, tmp_path: pathlib.Path):
         fs = disk_filesystem.DiskFilesystem()
@@ -52,6 +113,85 @@ class TestOpenFile:
         file = tmp_path / "thing.txt"
         _ = file.write_text("hello")
 
-        result = fs.open_file(path=file)
+        with fs.open_file(path=file) as result:
+            assert result.read() == b"hello"
+
+
+class TestReadFile:
+    def test_reads_file(self, tmp_path: pathlib.Path):
+        fs = disk_filesystem.DiskFilesystem()
+
+        file = tmp_path / "thing.txt"
+        _ = file.write_text("hello")
+
+        result = fs.read_file(path=file)
+
+        assert result == b"hello"
+
+
+class TestDiscoveryCache:
+    def test_serves_repeated_lookups_from_cache(self, tmp_path: pathlib.Path):
+        fs = disk_filesystem.DiskFilesystem()
+        file = tmp_path / "pyproject.toml"
+        _ = file.write_text("")
+
+        first = fs.get_file_paths(["pyproject.toml"], starting_path=tmp_path)
+        second = fs.get_file_paths(["pyproject.toml"], starting_path=tmp_path)
+
+        assert first == second == [file]
+        assert fs.cache.cache_info().hits == 1
+
+    def test_notices_created_file(self, tmp_path: pathlib.Path):
+        fs = disk_filesystem.DiskFilesystem()
+        nested = tmp_path / "a"
+        nested.mkdir()
+        _ = (tmp_path / "pyproject.toml").write_text("")
+
+        _ = fs.get_file_path("pyproject.toml", starting_path=nested)
+        closest = nested / "pyproject.toml"
+        _ = closest.write_text("")
+
+        assert fs.get_file_path("pyproject.toml", starting_path=nested) == closest
+
+    def test_notices_deleted_file(self, tmp_path: pathlib.Path):
+        fs = disk_filesystem.DiskFilesystem()
+        file = tmp_path / "acme.ini"
+        _ = file.write_text("")
+
+        _ = fs.get_file_path(str(file))
+        file.unlink()
+
+        assert fs.get_file_path(str(file)) is None
+
+    def test_without_validation_serves_stale_until_invalidated(
+        self, tmp_path: pathlib.Path
+    ):
+        cache = disk_filesystem.DiscoveryCache(validate=False)
+        fs = disk_filesystem.DiskFilesystem(cache=cache)
+
+        assert fs.get_file_path("acme.ini", starting_path=tmp_path) is None
+
+        file = tmp_path / "acme.ini"
+        _ = file.write_text("")
+
+        assert fs.get_file_path("acme.ini", starting_path=tmp_path) is None
+
+        cache.invalidate(file)
+
+        assert fs.get_file_path("acme.ini", starting_path=tmp_path) == file
+
+    def test_invalidate_without_path_drops_everything(self, tmp_path: pathlib.Path):
+        fs = disk_filesystem.DiskFilesystem()
+        _ = fs.get_file_paths(["a.ini", "b.ini"], starting_path=tmp_path)
+
+        fs.cache.invalidate()
+
+        assert len(fs.cache) == 0
+
+    def test_is_bounded(self, tmp_path: pathlib.Path):
+        cache = disk_filesystem.DiscoveryCache(maxsize=2)
+        fs = disk_filesystem.DiskFilesystem(cache=cache)
+
+        _ = fs.get_file_paths(["a.ini", "b.ini", "c.ini"], starting_path=tmp_path)
 
-        assert result.read() == b"hello"
+        assert len(cache) == 2
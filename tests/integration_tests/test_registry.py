@@ -0,0 +1,101 @@
+import pathlib
+
+import pydantic
+import pytest
+
+import maison
+from maison import errors
+from maison import registry
+
+
+class Schema(pydantic.BaseModel):
+    hello: int
+
+
+class TestConfigRegistry:
+    def test_memoizes_configs(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        reg = registry.ConfigRegistry()
+
+        first = reg.get_config("acme", starting_path=tmp_path)
+        second = reg.get_config("acme", starting_path=tmp_path)
+
+        assert first is second
+        assert first.values == {"hello": True}
+        assert reg.cache_info().hits == 1
+
+    def test_counts_one_miss_per_load(self, tmp_path: pathlib.Path):
+        reg = registry.ConfigRegistry()
+
+        _ = reg.get_config("acme", starting_path=tmp_path)
+
+        assert reg.cache_info().misses == 1
+
+    def test_shares_frozen_values(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = true\n")
+        reg = registry.ConfigRegistry()
+        first = reg.get_config("acme", starting_path=tmp_path)
+
+        with pytest.raises(TypeError):
+            first.values["hello"] = False  # type: ignore[index]
+
+        with pytest.raises(errors.ReadOnlyConfigError):
+            first.values = {"hello": False}
+
+        assert reg.get_config("acme", starting_path=tmp_path).values == {"hello": True}
+
+    def test_validates_without_using_schema_values(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        _ = fp.write_text("[tool.acme]\nhello = '1'\n")
+        reg = registry.ConfigRegistry()
+        first = reg.get_config("acme", starting_path=tmp_path)
+
+        with pytest.raises(errors.ReadOnlyConfigError):
+            _ = first.validate(schema=Schema)
+
+        assert first.validate(schema=Schema, use_schema_values=False) == {"hello": "1"}
+        assert reg.get_config("acme", starting_path=tmp_path).values == {"hello": "1"}
+
+    def test_distinguishes_arguments(self, tmp_path: pathlib.Path):
+        reg = registry.ConfigRegistry()
+
+        first = reg.get_config("acme", starting_path=tmp_path)
+        second = reg.get_config("acme", starting_path=tmp_path, merge_configs=True)
+        third = reg.get_config("other", starting_path=tmp_path)
+
+        assert len({id(first), id(second), id(third)}) == 3
+
+    def test_shares_services_and_filesystem(self, tmp_path: pathlib.Path):
+        reg = registry.ConfigRegistry()
+
+        first = reg.get_config("acme", starting_path=tmp_path)
+        second = reg.get_config("acme", starting_path=tmp_path, merge_configs=True)
+        third = reg.get_config("other", starting_path=tmp_path)
+
+        assert first._service is second._service
+        assert first._service.filesystem is third._service.filesystem is reg.filesystem
+
+    def test_evicts_least_recently_used(self, tmp_path: pathlib.Path):
+        reg = registry.ConfigRegistry(maxsize=1)
+
+        first = reg.get_config("acme", starting_path=tmp_path)
+        _ = reg.get_config("other", starting_path=tmp_path)
+
+        assert reg.get_config("acme", starting_path=tmp_path) is not first
+        assert reg.cache_info().currsize == 1
+
+    def test_clear(self, tmp_path: pathlib.Path):
+        reg = registry.ConfigRegistry()
+        first = reg.get_config("acme", starting_path=tmp_path)
+
+        reg.clear()
+
+        assert reg.get_config("acme", starting_path=tmp_path) is not first
+
+
+def test_get_config(tmp_path: pathlib.Path):
+    first = maison.get_config("acme", starting_path=tmp_path)
+
+    assert maison.get_config("acme", starting_path=tmp_path) is first
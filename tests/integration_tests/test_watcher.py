@@ -0,0 +1,206 @@
+import asyncio
+import pathlib
+import sys
+import threading
+import time
+
+import pytest
+
+from maison import config
+from maison import typedefs
+from maison import watcher
+
+
+def write_config(path: pathlib.Path, value: str) -> None:
+    _ = path.write_text(f"[tool.acme]\nhello = '{value}'\n")
+
+
+class TestGetWatchTargets:
+    def test_watches_search_paths_and_absolute_parents(self, tmp_path: pathlib.Path):
+        nested = tmp_path / "a"
+        absolute = tmp_path / "b" / "acme.ini"
+
+        directories, names = watcher.get_watch_targets(
+            source_files=["pyproject.toml", str(absolute)], starting_path=nested
+        )
+
+        assert directories == {nested, *nested.parents, absolute.parent}
+        assert names == {"pyproject.toml", "acme.ini"}
+
+    def test_watches_intermediate_directories(self, tmp_path: pathlib.Path):
+        config_directory = tmp_path / ".config"
+        config_directory.mkdir()
+
+        directories, names = watcher.get_watch_targets(
+            source_files=[".config/acme.toml"],
+            starting_path=tmp_path,
+            discovered_paths=[config_directory / "acme.toml"],
+        )
+
+        assert directories == {tmp_path, *tmp_path.parents, config_directory}
+        assert names == {".config", "acme.toml"}
+
+
+class TestWatch:
+    @pytest.mark.parametrize(
+        "use_inotify",
+        [
+            pytest.param(False, id="polling"),
+            pytest.param(
+                True,
+                id="inotify",
+                marks=pytest.mark.skipif(
+                    not sys.platform.startswith("linux"), reason="requires Linux"
+                ),
+            ),
+        ],
+    )
+    def test_calls_callback_with_new_values(
+        self, tmp_path: pathlib.Path, use_inotify: bool
+    ):
+        fp = tmp_path / "pyproject.toml"
+        write_config(fp, "one")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        received: list[typedefs.ConfigValues] = []
+        changed = threading.Event()
+
+        def _callback(values: typedefs.ConfigValues) -> None:
+            received.append(values)
+            changed.set()
+
+        with cfg.watch(
+            _callback, debounce=0.01, poll_interval=0.01, use_inotify=use_inotify
+        ) as config_watcher:
+            if use_inotify and config_watcher.backend != "inotify":
+                pytest.skip("inotify is unavailable")
+
+            write_config(fp, "two")
+
+            assert changed.wait(timeout=5)
+
+        assert received == [{"hello": "two"}]
+        assert config_watcher.backend is None
+
+    def test_ignores_unrelated_files(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        write_config(fp, "one")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+        changed = threading.Event()
+
+        with cfg.watch(lambda _: changed.set(), debounce=0.01, poll_interval=0.01):
+            _ = (tmp_path / "unrelated.txt").write_text("")
+
+            assert not changed.wait(timeout=0.2)
+
+    @pytest.mark.parametrize(
+        "use_inotify",
+        [
+            pytest.param(False, id="polling"),
+            pytest.param(
+                True,
+                id="inotify",
+                marks=pytest.mark.skipif(
+                    not sys.platform.startswith("linux"), reason="requires Linux"
+                ),
+            ),
+        ],
+    )
+    def test_calls_callback_for_nested_file(
+        self, tmp_path: pathlib.Path, use_inotify: bool
+    ):
+        fp = tmp_path / ".config" / "acme.toml"
+        fp.parent.mkdir()
+        _ = fp.write_text("hello = 'one'\n")
+        cfg = config.UserConfig(
+            package_name="acme",
+            starting_path=tmp_path,
+            source_files=[".config/acme.toml"],
+        )
+        changed = threading.Event()
+
+        with cfg.watch(
+            lambda _: changed.set(),
+            debounce=0.01,
+            poll_interval=0.01,
+            use_inotify=use_inotify,
+        ) as config_watcher:
+            if use_inotify and config_watcher.backend != "inotify":
+                pytest.skip("inotify is unavailable")
+
+            _ = fp.write_text("hello = 'two'\n")
+
+            assert changed.wait(timeout=5)
+
+        assert cfg.values == {"hello": "two"}
+
+    @pytest.mark.parametrize(
+        "use_inotify",
+        [
+            pytest.param(False, id="polling"),
+            pytest.param(
+                True,
+                id="inotify",
+                marks=pytest.mark.skipif(
+                    not sys.platform.startswith("linux"), reason="requires Linux"
+                ),
+            ),
+        ],
+    )
+    def test_calls_callback_for_file_in_new_directory(
+        self, tmp_path: pathlib.Path, use_inotify: bool
+    ):
+        fp = tmp_path / ".config" / "acme.toml"
+        cfg = config.UserConfig(
+            package_name="acme",
+            starting_path=tmp_path,
+            source_files=[".config/acme.toml"],
+        )
+        changed = threading.Event()
+
+        with cfg.watch(
+            lambda _: changed.set(),
+            debounce=0.01,
+            poll_interval=0.01,
+            use_inotify=use_inotify,
+        ) as config_watcher:
+            if use_inotify and config_watcher.backend != "inotify":
+                pytest.skip("inotify is unavailable")
+
+            fp.parent.mkdir()
+            # let the watcher handle the new directory before the file appears
+            time.sleep(0.2)
+            _ = fp.write_text("hello = 'one'\n")
+
+            assert changed.wait(timeout=5)
+
+        assert cfg.values == {"hello": "one"}
+
+    def test_picks_up_shadowing_file(self, tmp_path: pathlib.Path):
+        nested = tmp_path / "nested"
+        nested.mkdir()
+        write_config(tmp_path / "pyproject.toml", "outer")
+        cfg = config.UserConfig(package_name="acme", starting_path=nested)
+        changed = threading.Event()
+
+        with cfg.watch(lambda _: changed.set(), debounce=0.01, poll_interval=0.01):
+            write_config(nested / "pyproject.toml", "inner")
+
+            assert changed.wait(timeout=5)
+
+        assert cfg.values == {"hello": "inner"}
+
+    def test_async_iteration(self, tmp_path: pathlib.Path):
+        fp = tmp_path / "pyproject.toml"
+        write_config(fp, "one")
+        cfg = config.UserConfig(package_name="acme", starting_path=tmp_path)
+
+        async def _next_values() -> typedefs.ConfigValues:
+            with cfg.watch(debounce=0.01, poll_interval=0.01) as config_watcher:
+                iterator = config_watcher.__aiter__()
+                next_values = asyncio.ensure_future(iterator.__anext__())
+                await asyncio.sleep(0.05)
+                write_config(fp, "two")
+                return await asyncio.wait_for(next_values, timeout=5)
+
+        assert asyncio.run(_next_values()) == {"hello": "two"}
@@ -1,4 +1,3 @@
-import io
 import textwrap
 
 from maison.parsers import ini
@@ -11,10 +10,10 @@ class TestParseConfig:
             host = localhost
             port = 5432
         """)
-        file = io.BytesIO(ini_content.encode())
+        data = ini_content.encode()
 
         reader = ini.IniParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {"database": {"host": "localhost", "port": "5432"}}
 
@@ -28,10 +27,10 @@ class TestParseConfig:
             key = secret
             endpoint = https://example.com
         """)
-        file = io.BytesIO(ini_content.encode())
+        data = ini_content.encode()
 
         reader = ini.IniParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {
             "database": {"host": "localhost", "port": "5432"},
@@ -39,19 +38,19 @@ class TestParseConfig:
         }
 
     def test_empty_file_returns_empty_dict(self):
-        file = io.BytesIO()
+        data = b""
 
         reader = ini.IniParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {}
 
     def test_invalid_bytes_returns_empty_dict(self):
         ini_content = b"\xff\xfe\x00bad ini"
-        file = io.BytesIO(ini_content)
+        data = ini_content
 
         reader = ini.IniParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {}
 
@@ -63,9 +62,9 @@ class TestParseConfig:
             [section2]
             key = value2
         """)
-        file = io.BytesIO(ini_content.encode())
+        data = ini_content.encode()
 
         reader = ini.IniParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {"section1": {"key": "value1"}, "section2": {"key": "value2"}}
@@ -0,0 +1,94 @@
+import json
+import math
+
+import pytest
+
+from maison import typedefs
+from maison.parsers import json as json_parser
+
+
+@pytest.fixture(params=sorted(json_parser.BACKENDS))
+def backend(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+class TestParseConfig:
+    def test_parse_document(self, backend: str):
+        data = json.dumps({"database": {"host": "localhost", "port": 5432}}).encode()
+
+        reader = json_parser.JsonParser(backend=backend)
+        result = reader.parse_config(data)
+
+        assert result == {"database": {"host": "localhost", "port": 5432}}
+
+    def test_parse_section(self, backend: str):
+        data = json.dumps({"tool": {"acme": {"hello": [1, 2]}}}).encode()
+
+        reader = json_parser.JsonParser(section_key=("tool", "acme"), backend=backend)
+        result = reader.parse_config(data)
+
+        assert result == {"hello": [1, 2]}
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            pytest.param(b'\xef\xbb\xbf{"a": 1}', {"a": 1}, id="bom"),
+            pytest.param(
+                b'{"a": 123456789012345678901234567890}',
+                {"a": 123456789012345678901234567890},
+                id="large-int",
+            ),
+            pytest.param(b'{"a": -Infinity}', {"a": float("-inf")}, id="infinity"),
+        ],
+    )
+    def test_matches_the_standard_library(
+        self, backend: str, data: bytes, expected: typedefs.ConfigValues
+    ):
+        reader = json_parser.JsonParser(backend=backend)
+
+        result = reader.parse_config(data)
+
+        assert result == expected
+        assert type(result["a"]) is type(expected["a"])
+
+    def test_parses_nan(self, backend: str):
+        reader = json_parser.JsonParser(backend=backend)
+
+        result = reader.parse_config(b'{"a": NaN}')
+
+        assert math.isnan(result["a"])
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param(b"", id="empty"),
+            pytest.param(b"{not json", id="invalid"),
+            pytest.param(b"\xff\xfe\x00", id="invalid-bytes"),
+            pytest.param(b"[1, 2]", id="not-an-object"),
+            pytest.param(b'{"tool": {"acme": 1}}', id="section-not-an-object"),
+            pytest.param(b'{"tool": {}}', id="missing-section"),
+        ],
+    )
+    def test_returns_empty_dict(self, backend: str, data: bytes):
+        reader = json_parser.JsonParser(section_key=("tool", "acme"), backend=backend)
+
+        result = reader.parse_config(data)
+
+        assert result == {}
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="backend"):
+            _ = json_parser.JsonParser(backend="unknown")
+
+    def test_cache_key_depends_on_section(self):
+        assert (
+            json_parser.JsonParser(section_key=("a",)).cache_key
+            != json_parser.JsonParser(section_key=("b",)).cache_key
+        )
+
+    @pytest.mark.skipif("orjson" not in json_parser.BACKENDS, reason="requires orjson")
+    def test_cache_key_depends_on_backend(self):
+        assert (
+            json_parser.JsonParser(backend="json").cache_key
+            != json_parser.JsonParser(backend="orjson").cache_key
+        )
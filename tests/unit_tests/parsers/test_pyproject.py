@@ -0,0 +1,149 @@
+import textwrap
+
+import pytest
+
+from maison.parsers import pyproject
+
+
+class TestParseConfig:
+    def test_returns_tool_section(self):
+        toml_content = textwrap.dedent("""
+            [project]
+            name = "acme"
+
+            [tool.other]
+            key = "other"
+
+            [tool.acme]
+            hello = true
+
+            [tool.acme.nested]
+            key = "value"
+
+            [[tool.acme.items]]
+            name = "first"
+
+            [tool.acmeish]
+            key = "acmeish"
+        """)
+
+        reader = pyproject.PyprojectParser(tool_name="acme")
+        result = reader.parse_config(toml_content.encode())
+
+        assert result == {
+            "hello": True,
+            "nested": {"key": "value"},
+            "items": [{"name": "first"}],
+        }
+
+    def test_returns_empty_dict_if_name_absent(self):
+        reader = pyproject.PyprojectParser(tool_name="acme")
+
+        result = reader.parse_config(b"[tool.other]\nkey = 1\n")
+
+        assert result == {}
+
+    def test_returns_empty_dict_if_tool_section_absent(self):
+        reader = pyproject.PyprojectParser(tool_name="acme")
+
+        result = reader.parse_config(b'[project]\nname = "acme"\n')
+
+        assert result == {}
+
+    def test_ignores_invalid_toml_outside_tool_section(self):
+        reader = pyproject.PyprojectParser(tool_name="acme")
+
+        result = reader.parse_config(b"[other]\nkey = \n\n[tool.acme]\nhello = true\n")
+
+        assert result == {"hello": True}
+
+    @pytest.mark.parametrize(
+        "toml_content",
+        [
+            pytest.param("tool.acme.hello = true\n", id="root-dotted-key"),
+            pytest.param("[tool]\nacme.hello = true\n", id="tool-table"),
+            pytest.param("[tool]\nacme = {hello = true}\n", id="inline-table"),
+            pytest.param('[tool."acme"]\nhello = true\n', id="quoted-key"),
+            pytest.param('["tool".acme]\nhello = true\n', id="quoted-tool"),
+            pytest.param("['tool'.acme]\nhello = true\n", id="literal-quoted-tool"),
+            pytest.param('["tool"."acme"]\nhello = true\n', id="quoted-tool-and-key"),
+            pytest.param(
+                '[tool.acme]\nhello = true\n[tool.other]\nkey = """\n[tool.acme]\n"""\n',
+                id="multiline-string",
+            ),
+            pytest.param(
+                "[tool.acme]\nhello = true\nitems = [\n  [1, 2],\n]\n",
+                id="array-of-arrays",
+            ),
+            pytest.param(
+                "arr = [\n  [1],\n]\ntool.acme.hello = true\n",
+                id="root-key-after-array-of-arrays",
+            ),
+        ],
+    )
+    def test_falls_back_to_parsing_whole_document(self, toml_content: str):
+        reader = pyproject.PyprojectParser(tool_name="acme")
+
+        result = reader.parse_config(toml_content.encode())
+
+        assert result["hello"] is True
+
+    def test_invalid_toml_returns_empty_dict(self):
+        reader = pyproject.PyprojectParser(tool_name="acme")
+
+        result = reader.parse_config(b"[tool.acme]\nhello = \n")
+
+        assert result == {}
+
+
+class TestPyprojectLoader:
+    toml_content = textwrap.dedent("""
+        [tool.first]
+        key = "first"
+
+        [tool.second]
+        key = "second"
+
+        [tool.third]
+        key = "third"
+    """).encode()
+
+    def test_loads_each_tool(self):
+        loader = pyproject.PyprojectLoader()
+
+        results = [
+            loader.load(self.toml_content, tool_name=tool_name)
+            for tool_name in ("first", "second", "third", "fourth")
+        ]
+
+        assert results == [{"key": "first"}, {"key": "second"}, {"key": "third"}, {}]
+
+    def test_parses_whole_document_once(self, monkeypatch: pytest.MonkeyPatch):
+        calls: list[bytes] = []
+        parse_tools = pyproject._parse_tools
+
+        def _parse_tools(data: bytes) -> dict[str, object]:
+            calls.append(data)
+            return parse_tools(data)
+
+        monkeypatch.setattr(pyproject, "_parse_tools", _parse_tools)
+        loader = pyproject.PyprojectLoader()
+
+        _ = loader.load(self.toml_content, tool_name="first")
+        _ = loader.load(self.toml_content, tool_name="first")
+        assert calls == []
+
+        for tool_name in ("second", "third", "first"):
+            _ = loader.load(self.toml_content, tool_name=tool_name)
+        assert calls == [self.toml_content]
+
+    def test_parser_uses_loader(self):
+        loader = pyproject.PyprojectLoader()
+        parsers = [
+            pyproject.PyprojectParser(tool_name=tool_name, loader=loader)
+            for tool_name in ("first", "second")
+        ]
+
+        results = [parser.parse_config(self.toml_content) for parser in parsers]
+
+        assert results == [{"key": "first"}, {"key": "second"}]
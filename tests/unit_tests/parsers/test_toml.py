@@ -1,4 +1,3 @@
-import io
 import textwrap
 
 from maison.parsers import toml
@@ -11,10 +10,10 @@ class TestParseConfig:
             host = "localhost"
             port = 5432
         """)
-        file = io.BytesIO(toml_content.encode())
+        data = toml_content.encode()
 
         reader = toml.TomlParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {"database": {"host": "localhost", "port": 5432}}
 
@@ -28,10 +27,10 @@ class TestParseConfig:
             key = "secret"
             endpoint = "https://example.com"
         """)
-        file = io.BytesIO(toml_content.encode())
+        data = toml_content.encode()
 
         reader = toml.TomlParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {
             "database": {"host": "localhost", "port": 5432},
@@ -39,15 +38,15 @@ class TestParseConfig:
         }
 
     def test_empty_file_returns_empty_dict(self):
-        file = io.BytesIO(b"")
+        data = b""
         reader = toml.TomlParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
         assert result == {}
 
     def test_invalid_toml_returns_empty_dict(self):
-        file = io.BytesIO(b"not valid toml!")
+        data = b"not valid toml!"
         reader = toml.TomlParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
         assert result == {}
 
     def test_overlapping_keys_in_different_sections(self):
@@ -58,10 +57,10 @@ class TestParseConfig:
             [section2]
             key = "value2"
         """)
-        file = io.BytesIO(toml_content.encode())
+        data = toml_content.encode()
 
         reader = toml.TomlParser()
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {"section1": {"key": "value1"}, "section2": {"key": "value2"}}
 
@@ -70,10 +69,10 @@ class TestParseConfig:
             [tool.section]
             key = "value"
         """)
-        file = io.BytesIO(toml_content.encode())
+        data = toml_content.encode()
 
         reader = toml.TomlParser(section_key=("tool", "section"))
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {"key": "value"}
 
@@ -82,9 +81,9 @@ class TestParseConfig:
             [tool.section]
             key = "value"
         """)
-        file = io.BytesIO(toml_content.encode())
+        data = toml_content.encode()
 
         reader = toml.TomlParser(section_key=("tool", "other_section"))
-        result = reader.parse_config(file)
+        result = reader.parse_config(data)
 
         assert result == {}
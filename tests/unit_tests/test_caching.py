@@ -0,0 +1,70 @@
+from maison import caching
+
+
+class TestLRUCache:
+    def test_get_and_put(self):
+        cache: caching.LRUCache[str, int] = caching.LRUCache()
+
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.cache_info() == caching.CacheInfo(
+            hits=1, misses=1, maxsize=128, currsize=1
+        )
+
+    def test_evicts_least_recently_used(self):
+        cache: caching.LRUCache[str, int] = caching.LRUCache(maxsize=2)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        _ = cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_zero_maxsize_disables_cache(self):
+        cache: caching.LRUCache[str, int] = caching.LRUCache(maxsize=0)
+
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
+
+    def test_invalid_entries_are_evicted(self):
+        cache: caching.LRUCache[str, int] = caching.LRUCache()
+        cache.put("a", 1)
+
+        assert cache.get("a", is_valid=lambda value: value > 1) is None
+        assert len(cache) == 0
+        assert cache.cache_info().misses == 1
+
+    def test_setdefault(self):
+        cache: caching.LRUCache[str, int] = caching.LRUCache(maxsize=2)
+
+        assert cache.setdefault("a", 1) == 1
+        assert cache.setdefault("a", 2) == 1
+        assert cache.get("a") == 1
+        assert cache.cache_info().misses == 0
+
+    def test_discard(self):
+        cache: caching.LRUCache[str, int] = caching.LRUCache()
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        cache.discard("a")
+        cache.discard_where(lambda _key, value: value == 2)
+
+        assert len(cache) == 0
+
+    def test_clear_resets_statistics(self):
+        cache: caching.LRUCache[str, int] = caching.LRUCache()
+        cache.put("a", 1)
+        _ = cache.get("a")
+
+        cache.clear()
+
+        assert cache.cache_info() == caching.CacheInfo(
+            hits=0, misses=0, maxsize=128, currsize=0
+        )
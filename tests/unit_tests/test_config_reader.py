@@ -1,6 +1,5 @@
-import io
+import importlib.metadata
 import pathlib
-import typing
 
 import pytest
 
@@ -10,12 +9,12 @@ from maison import typedefs
 
 
 class FakePyprojectParser:
-    def parse_config(self, file: typing.BinaryIO) -> typedefs.ConfigValues:
+    def parse_config(self, data: bytes) -> typedefs.ConfigValues:
         return {"config": "pyproject"}
 
 
 class FakeTomlParser:
-    def parse_config(self, file: typing.BinaryIO) -> typedefs.ConfigValues:
+    def parse_config(self, data: bytes) -> typedefs.ConfigValues:
         return {"config": "toml"}
 
 
@@ -30,7 +29,7 @@ class TestParsesConfig:
 
         values = self.parser.parse_config(
             file_path=pathlib.Path("path/to/pyproject.toml"),
-            file=io.BytesIO(b"file"),
+            data=b"file",
         )
 
         assert values == {"config": "pyproject"}
@@ -43,7 +42,7 @@ class TestParsesConfig:
 
         values = self.parser.parse_config(
             pathlib.Path("path/to/.acme.toml"),
-            file=io.BytesIO(b"file"),
+            data=b"file",
         )
 
         assert values == {"config": "toml"}
@@ -52,5 +51,137 @@ class TestParsesConfig:
         with pytest.raises(errors.UnsupportedConfigError):
             _ = self.parser.parse_config(
                 pathlib.Path("path/to/.acme.toml"),
-                file=io.BytesIO(b"file"),
+                data=b"file",
             )
+
+
+class TestGetCacheKey:
+    def setup_method(self):
+        self.parser = config_parser.ConfigParser()
+
+    def test_uses_parser_cache_key(self):
+        parser = FakeTomlParser()
+        parser.cache_key = ("fake",)
+        self.parser.register_parser(suffix=".toml", parser=parser)
+
+        key = self.parser.get_cache_key(pathlib.Path("path/to/.acme.toml"))
+
+        assert key == ("fake",)
+
+    def test_returns_none_if_parser_has_no_cache_key(self):
+        self.parser.register_parser(suffix=".toml", parser=FakeTomlParser())
+
+        key = self.parser.get_cache_key(pathlib.Path("path/to/.acme.toml"))
+
+        assert key is None
+
+
+def create_fake_parser(package_name: str) -> FakeTomlParser:
+    parser = FakeTomlParser()
+    parser.cache_key = ("fake", package_name)
+    return parser
+
+
+class TestLazyParser:
+    def test_creates_parser_on_first_use(self):
+        created: list[FakeTomlParser] = []
+
+        def _factory() -> FakeTomlParser:
+            created.append(FakeTomlParser())
+            return created[-1]
+
+        parser = config_parser.LazyParser(_factory)
+        assert created == []
+
+        values = parser.parse_config(b"file")
+        _ = parser.parse_config(b"file")
+
+        assert values == {"config": "toml"}
+        assert len(created) == 1
+
+    def test_exposes_cache_key_of_parser(self):
+        parser = config_parser.LazyParser(lambda: create_fake_parser("acme"))
+
+        assert parser.cache_key == ("fake", "acme")
+
+
+FAKE_ENTRY_POINTS = (
+    importlib.metadata.EntryPoint(
+        name=".fake",
+        value="tests.unit_tests.test_config_reader:create_fake_parser",
+        group=config_parser.ENTRY_POINT_GROUP,
+    ),
+    importlib.metadata.EntryPoint(
+        name="special.toml",
+        value="tests.unit_tests.test_config_reader:create_fake_parser",
+        group=config_parser.ENTRY_POINT_GROUP,
+    ),
+)
+
+
+class TestRegisterEntryPoints:
+    def test_replaces_parsers_when_asked(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(
+            config_parser, "_get_entry_points", lambda _group: FAKE_ENTRY_POINTS
+        )
+        parser = config_parser.ConfigParser()
+        parser.register_parser(suffix=".toml", parser=FakePyprojectParser())
+
+        parser.register_entry_points(package_name="acme", replace=True)
+
+        assert parser.parse_config(
+            pathlib.Path("path/to/config.fake"), data=b"file"
+        ) == {"config": "toml"}
+        assert parser.get_cache_key(pathlib.Path("path/to/special.toml")) == (
+            "fake",
+            "acme",
+        )
+        assert parser.parse_config(
+            pathlib.Path("path/to/other.toml"), data=b"file"
+        ) == {"config": "pyproject"}
+
+    def test_scans_only_for_files_without_exact_parser(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        scanned: list[str] = []
+        entry_points = (
+            *FAKE_ENTRY_POINTS,
+            importlib.metadata.EntryPoint(
+                name=".toml",
+                value="tests.unit_tests.test_config_reader:create_fake_parser",
+                group=config_parser.ENTRY_POINT_GROUP,
+            ),
+        )
+
+        def _get_entry_points(group: str) -> tuple[importlib.metadata.EntryPoint, ...]:
+            scanned.append(group)
+            return entry_points
+
+        monkeypatch.setattr(config_parser, "_get_entry_points", _get_entry_points)
+        parser = config_parser.ConfigParser()
+        parser.register_parser(
+            suffix=".toml", parser=FakePyprojectParser(), stem="pyproject"
+        )
+        parser.register_parser(suffix=".toml", parser=FakePyprojectParser())
+
+        parser.register_entry_points(package_name="acme")
+
+        assert parser.parse_config(
+            pathlib.Path("path/to/pyproject.toml"), data=b"file"
+        ) == {"config": "pyproject"}
+        assert scanned == []
+
+        # a stem-specific plugin fills in for a suffix with a built-in parser
+        assert parser.parse_config(
+            pathlib.Path("path/to/special.toml"), data=b"file"
+        ) == {"config": "toml"}
+        # but a plugin for the whole suffix doesn't replace it
+        assert parser.parse_config(
+            pathlib.Path("path/to/other.toml"), data=b"file"
+        ) == {"config": "pyproject"}
+        assert parser.parse_config(
+            pathlib.Path("path/to/config.fake"), data=b"file"
+        ) == {"config": "toml"}
+        with pytest.raises(errors.UnsupportedConfigError):
+            _ = parser.parse_config(pathlib.Path("path/to/config.yaml"), data=b"file")
+        assert scanned == [config_parser.ENTRY_POINT_GROUP]
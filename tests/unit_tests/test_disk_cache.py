@@ -0,0 +1,78 @@
+import os
+import pathlib
+
+from maison import disk_cache
+
+
+class TestDiskCache:
+    def test_round_trips_values(self, tmp_path: pathlib.Path):
+        cache = disk_cache.DiskCache(directory=tmp_path / "cache")
+
+        cache.put(("key", 1), {"a": {"b": [1, 2]}})
+
+        assert cache.get(("key", 1)) == {"a": {"b": [1, 2]}}
+        assert cache.get(("key", 2)) is None
+
+    def test_leaves_no_temporary_files(self, tmp_path: pathlib.Path):
+        cache = disk_cache.DiskCache(directory=tmp_path)
+
+        cache.put("key", {"a": 1})
+
+        assert [path.suffix for path in tmp_path.iterdir()] == [".pickle"]
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: pathlib.Path):
+        cache = disk_cache.DiskCache(directory=tmp_path)
+        cache.put("key", {"a": 1})
+
+        for path in tmp_path.iterdir():
+            _ = path.write_bytes(b"not a pickle")
+
+        assert cache.get("key") is None
+
+    def test_entry_of_missing_class_is_a_miss(self, tmp_path: pathlib.Path):
+        cache = disk_cache.DiskCache(directory=tmp_path)
+        cache.put("key", {"a": 1})
+
+        for path in tmp_path.iterdir():
+            _ = path.write_bytes(b"cmaison_missing_module\nThing\n.")
+
+        assert cache.get("key") is None
+
+    def test_evicts_least_recently_used_entries(self, tmp_path: pathlib.Path):
+        cache = disk_cache.DiskCache(directory=tmp_path, max_entries=2)
+
+        for index, key in enumerate(["a", "b"]):
+            cache.put(key, {"key": key})
+            entry_path = cache._get_entry_path(key)
+            os.utime(entry_path, ns=(index, index))
+
+        _ = cache.get("a")
+        cache.put("c", {"key": "c"})
+
+        assert cache.get("a") == {"key": "a"}
+        assert cache.get("b") is None
+        assert cache.get("c") == {"key": "c"}
+
+    def test_evicts_entries_beyond_max_bytes(self, tmp_path: pathlib.Path):
+        cache = disk_cache.DiskCache(directory=tmp_path, max_bytes=0)
+
+        cache.put("key", {"a": 1})
+
+        assert cache.get("key") is None
+
+    def test_clear(self, tmp_path: pathlib.Path):
+        cache = disk_cache.DiskCache(directory=tmp_path)
+        cache.put("key", {"a": 1})
+
+        cache.clear()
+
+        assert cache.get("key") is None
+
+    def test_unwritable_directory_is_ignored(self, tmp_path: pathlib.Path):
+        directory = tmp_path / "file"
+        _ = directory.write_text("")
+        cache = disk_cache.DiskCache(directory=directory)
+
+        cache.put("key", {"a": 1})
+
+        assert cache.get("key") is None
@@ -0,0 +1,117 @@
+import pytest
+
+from maison import environment
+from maison import typedefs
+
+
+class TestCoerceValue:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("20", 20),
+            ("-3", -3),
+            ("1.5", 1.5),
+            ("1e3", 1000.0),
+            ("true", True),
+            ("False", False),
+            ("hello", "hello"),
+            ("", ""),
+            ("1.2.3", "1.2.3"),
+            ("inf", "inf"),
+            ("0", 0),
+            ("+0", 0),
+            ("1_000", 1000),
+            ("0x1F", 31),
+            ("0o755", 493),
+            ("0b11", 3),
+            ("0.5", 0.5),
+            ("0755", "0755"),
+            ("007", "007"),
+            ("00.5", "00.5"),
+            ("1__0", "1__0"),
+            ("_1", "_1"),
+            ("-0x1F", "-0x1F"),
+        ],
+    )
+    def test_coerces_scalars(self, value: str, expected: object):
+        result = environment.coerce_value(value)
+
+        assert result == expected
+        assert type(result) is type(expected)
+
+
+class TestBuildValues:
+    def test_builds_nested_values(self):
+        values = environment.build_values(
+            [("DB__POOL_SIZE", "20"), ("DB__HOST", "localhost"), ("DEBUG", "true")],
+            separator="__",
+        )
+
+        assert values == {
+            "db": {"pool_size": 20, "host": "localhost"},
+            "debug": True,
+        }
+
+    @pytest.mark.parametrize(
+        "variables",
+        [
+            [("DB", "1"), ("DB__POOL", "2")],
+            [("DB__POOL", "2"), ("DB", "1")],
+        ],
+    )
+    def test_tables_win_over_values(self, variables: list[tuple[str, str]]):
+        values = environment.build_values(variables, separator="__")
+
+        assert values == {"db": {"pool": 2}}
+
+    def test_skips_empty_keys(self):
+        values = environment.build_values(
+            [("DB____POOL", "1"), ("", "2"), ("DB__", "3")], separator="__"
+        )
+
+        assert values == {}
+
+
+class TestEnvironmentSource:
+    def test_reads_prefixed_variables(self):
+        source = environment.EnvironmentSource(
+            prefix="ACME",
+            environ={"ACME__DB__POOL_SIZE": "20", "ACMEISH__X": "1", "OTHER": "2"},
+        )
+
+        layer = source.get_layer()
+
+        assert layer.values == {"db": {"pool_size": 20}}
+        assert layer.path is None
+
+    def test_reuses_layer_while_variables_are_unchanged(self):
+        environ = {"ACME__DEBUG": "true"}
+        source = environment.EnvironmentSource(prefix="ACME", environ=environ)
+
+        layer = source.get_layer()
+        environ["OTHER"] = "1"
+
+        assert source.get_layer() is layer
+
+    def test_builds_layer_again_when_variables_change(self):
+        environ = {"ACME__DEBUG": "true"}
+        source = environment.EnvironmentSource(prefix="ACME", environ=environ)
+
+        layer = source.get_layer()
+        environ["ACME__DEBUG"] = "false"
+        new_layer = source.get_layer()
+
+        assert new_layer.values == {"debug": False}
+        assert new_layer.fingerprint != layer.fingerprint
+
+    def test_fingerprint_is_stable_between_processes(self):
+        source = environment.EnvironmentSource(
+            prefix="ACME", environ={"ACME__DEBUG": "true"}
+        )
+
+        fingerprint = source.get_layer().fingerprint
+
+        # unlike hash(), the digest doesn't depend on PYTHONHASHSEED
+        assert fingerprint == typedefs.EnvironmentFingerprint(
+            prefix="ACME__", digest="1ffe27e01129b1cb7b41b2c067633551"
+        )
@@ -0,0 +1,47 @@
+import pytest
+
+from maison import frozen
+
+
+class TestFrozenDict:
+    def test_freezes_nested_values(self):
+        values = {"a": {"b": [1, {"c": 2}]}, "d": 1}
+
+        frozen_dict = frozen.FrozenDict(values)
+
+        assert isinstance(frozen_dict["a"], frozen.FrozenDict)
+        assert frozen_dict["a"]["b"] == (1, frozen.FrozenDict({"c": 2}))
+        assert values == {"a": {"b": [1, {"c": 2}]}, "d": 1}
+
+    def test_is_read_only(self):
+        frozen_dict = frozen.FrozenDict({"a": 1})
+
+        with pytest.raises(TypeError):
+            frozen_dict["a"] = 2  # type: ignore[index]
+
+    def test_equal_mappings_have_equal_hashes(self):
+        first = frozen.FrozenDict({"a": {"b": [1, 2]}, "c": "d"})
+        second = frozen.FrozenDict({"c": "d", "a": {"b": (1, 2)}})
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert {first: 1}[second] == 1
+
+    def test_not_equal(self):
+        assert frozen.FrozenDict({"a": 1}) != frozen.FrozenDict({"a": 2})
+        assert frozen.FrozenDict({"a": 1}) != frozen.FrozenDict({"b": 1})
+
+    def test_equals_dicts(self):
+        assert frozen.FrozenDict({"a": {"b": 1}}) == {"a": {"b": 1}}
+        assert frozen.FrozenDict({"a": 1}) != {"a": 2}
+        assert frozen.FrozenDict({"a": 1}) != 1
+
+    def test_unhashable_value(self):
+        frozen_dict = frozen.FrozenDict({"a": {1, 2}, "b": 1})
+
+        assert frozen_dict["b"] == 1
+        with pytest.raises(TypeError):
+            _ = hash(frozen_dict)
+
+    def test_repr(self):
+        assert repr(frozen.FrozenDict({"a": 1})) == "FrozenDict({'a': 1})"
@@ -0,0 +1,74 @@
+import pathlib
+
+from maison import layers
+from maison import typedefs
+
+
+def make_layer(name: str, values: typedefs.ConfigValues, mtime_ns: int = 1):
+    path = pathlib.Path(name)
+    return typedefs.ConfigLayer(
+        path=path,
+        fingerprint=typedefs.FileFingerprint(
+            path=path, mtime_ns=mtime_ns, size=1, inode=1
+        ),
+        values=values,
+    )
+
+
+class TestLayerStack:
+    def test_merges_layers_in_order(self):
+        stack = layers.LayerStack(
+            [
+                make_layer("a", {"x": {"y": 1, "z": 1}}),
+                make_layer("b", {"x": {"y": 2}}),
+            ]
+        )
+
+        assert stack.values == {"x": {"y": 2, "z": 1}}
+
+    def test_empty(self):
+        assert layers.LayerStack().values == {}
+
+    def test_does_not_modify_layers(self):
+        first = make_layer("a", {"x": {"y": 1}, "z": {"w": 1}})
+        second = make_layer("b", {"x": {"y": 2}})
+
+        stack = layers.LayerStack([first, second])
+
+        assert first.values == {"x": {"y": 1}, "z": {"w": 1}}
+        assert second.values == {"x": {"y": 2}}
+        assert stack.values["z"] is first.values["z"]
+
+    def test_reuses_merges_before_changed_layer(self):
+        first = make_layer("a", {"a": 1})
+        second = make_layer("b", {"b": 1})
+        third = make_layer("c", {"c": 1})
+        previous = layers.LayerStack([first, second, third])
+
+        changed = make_layer("c", {"c": 2}, mtime_ns=2)
+        stack = layers.LayerStack([first, second, changed], previous=previous)
+
+        assert stack.merges[:2] == previous.merges[:2]
+        assert all(
+            new is old for new, old in zip(stack.merges[:2], previous.merges[:2])
+        )
+        assert stack.values == {"a": 1, "b": 1, "c": 2}
+
+    def test_reuses_last_merge_when_layer_is_added(self):
+        first = make_layer("a", {"a": 1})
+        previous = layers.LayerStack([first])
+
+        stack = layers.LayerStack([first, make_layer("b", {"b": 1})], previous=previous)
+
+        assert stack.merges[0] is previous.merges[0]
+        assert stack.values == {"a": 1, "b": 1}
+
+    def test_merges_only_when_read(self):
+        stack = layers.LayerStack(
+            [make_layer("a", {"x": {"y": 1}}), make_layer("b", {"x": {"z": 2}})]
+        )
+
+        assert stack.view["x"]["z"] == 2
+        assert stack._merges is None
+        assert stack.values == {"x": {"y": 1, "z": 2}}
+        assert stack.view is stack.view
@@ -0,0 +1,273 @@
+import copy
+
+import pytest
+
+from maison import merging
+from maison import utils
+
+
+class TestMergePlan:
+    def test_default_matches_deep_merge(self):
+        base = {"a": {"b": 1, "c": [1]}, "d": 1}
+        overlay = {"a": {"c": [2], "e": 3}, "f": 4}
+
+        plan = merging.MergePlan()
+
+        assert plan.merge(base, overlay) == utils.deep_merge(
+            copy.deepcopy(base), copy.deepcopy(overlay)
+        )
+
+    def test_replaces_dict_with_value(self):
+        assert merging.MergePlan().merge({"a": {"b": 1}}, {"a": 1}) == {"a": 1}
+
+    @pytest.mark.parametrize(
+        ("strategy", "expected"),
+        [
+            ("merge", [3, 4]),
+            ("replace", [3, 4]),
+            ("append", [1, 2, 3, 4]),
+            ("prepend", [3, 4, 1, 2]),
+            ("union", [1, 2, 3, 4]),
+        ],
+    )
+    def test_list_strategies(self, strategy: merging.Strategy, expected: list[int]):
+        plan = merging.MergePlan(strategies={"a.b": strategy})
+
+        merged = plan.merge({"a": {"b": [1, 2]}}, {"a": {"b": [3, 4]}})
+
+        assert merged == {"a": {"b": expected}}
+
+    def test_union_skips_existing_items(self):
+        plan = merging.MergePlan(strategies={"a": "union"})
+
+        merged = plan.merge({"a": [1, {"x": 1}]}, {"a": [1, {"x": 1}, 2, 2]})
+
+        assert merged == {"a": [1, {"x": 1}, 2]}
+
+    def test_replace_allows_dict_over_non_dict(self):
+        plan = merging.MergePlan(strategies={"a": "replace"})
+
+        assert plan.merge({"a": 1}, {"a": {"b": 1}}) == {"a": {"b": 1}}
+
+    def test_replace_does_not_merge_dicts(self):
+        plan = merging.MergePlan(strategies={"a": "replace"})
+
+        assert plan.merge({"a": {"b": 1}}, {"a": {"c": 2}}) == {"a": {"c": 2}}
+
+    def test_merge_raises_for_dict_over_non_dict(self):
+        with pytest.raises(RuntimeError):
+            _ = merging.MergePlan().merge({"a": 1}, {"a": {"b": 1}})
+
+    def test_list_strategy_replaces_non_lists(self):
+        plan = merging.MergePlan(strategies={"a": "append"})
+
+        assert plan.merge({"a": 1}, {"a": [2]}) == {"a": [2]}
+
+    def test_wildcard(self):
+        plan = merging.MergePlan(strategies={"services.*.ports": "append"})
+
+        merged = plan.merge(
+            {"services": {"web": {"ports": [80]}, "db": {"ports": [5432]}}},
+            {"services": {"web": {"ports": [443]}, "db": {"ports": [5433]}}},
+        )
+
+        assert merged == {
+            "services": {"web": {"ports": [80, 443]}, "db": {"ports": [5432, 5433]}}
+        }
+
+    def test_explicit_path_takes_precedence_over_wildcard(self):
+        plan = merging.MergePlan(strategies={"*": "append", "b": "prepend"})
+
+        merged = plan.merge({"a": [1], "b": [1]}, {"a": [2], "b": [2]})
+
+        assert merged == {"a": [1, 2], "b": [2, 1]}
+
+    def test_keyed(self):
+        plan = merging.MergePlan(strategies={"plugins": "keyed"})
+
+        merged = plan.merge(
+            {"plugins": [{"name": "a", "x": 1, "y": 1}, {"name": "b", "x": 1}]},
+            {"plugins": [{"name": "a", "x": 2}, {"name": "c"}, "d"]},
+        )
+
+        assert merged == {
+            "plugins": [
+                {"name": "a", "x": 2, "y": 1},
+                {"name": "b", "x": 1},
+                {"name": "c"},
+                "d",
+            ]
+        }
+
+    def test_keyed_applies_strategies_below_the_list(self):
+        plan = merging.MergePlan(
+            strategies={"plugins": "keyed", "plugins.args": "append"}
+        )
+
+        merged = plan.merge(
+            {"plugins": [{"name": "a", "args": [1]}]},
+            {"plugins": [{"name": "a", "args": [2]}]},
+        )
+
+        assert merged == {"plugins": [{"name": "a", "args": [1, 2]}]}
+
+    def test_keyed_later_duplicates_take_precedence(self):
+        plan = merging.MergePlan(strategies={"plugins": "keyed"})
+
+        merged = plan.merge(
+            {"plugins": [{"name": "a", "x": 1}]},
+            {"plugins": [{"name": "a", "x": 2, "y": 2}, {"name": "a", "x": 3}]},
+        )
+
+        assert merged == {"plugins": [{"name": "a", "x": 3, "y": 2}]}
+
+    def test_keyed_with_custom_key(self):
+        plan = merging.MergePlan(strategies={"hooks": "keyed"}, list_key="id")
+
+        merged = plan.merge(
+            {"hooks": [{"id": 1, "x": 1}]}, {"hooks": [{"id": 1, "y": 2}]}
+        )
+
+        assert merged == {"hooks": [{"id": 1, "x": 1, "y": 2}]}
+
+    def test_does_not_modify_arguments(self):
+        base = {"a": {"b": [1]}, "plugins": [{"name": "a", "x": 1}], "c": {"d": 1}}
+        overlay = {"a": {"b": [2]}, "plugins": [{"name": "a", "x": 2}]}
+        plan = merging.MergePlan(strategies={"a.b": "append", "plugins": "keyed"})
+
+        merged = plan.merge(base, overlay)
+
+        assert base == {
+            "a": {"b": [1]},
+            "plugins": [{"name": "a", "x": 1}],
+            "c": {"d": 1},
+        }
+        assert overlay == {"a": {"b": [2]}, "plugins": [{"name": "a", "x": 2}]}
+        assert merged["c"] is base["c"]
+
+    def test_deep_configs(self):
+        depth = 5000
+        base: dict = {}
+        overlay: dict = {}
+        base_node, overlay_node = base, overlay
+        for _ in range(depth):
+            base_node["a"], overlay_node["a"] = {"b": 1}, {"c": 2}
+            base_node, overlay_node = base_node["a"], overlay_node["a"]
+
+        merged = merging.MergePlan().merge(base, overlay)
+
+        node = merged
+        for _ in range(depth):
+            node = node["a"]
+            assert node["b"] == 1
+            assert node["c"] == 2
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError, match="Unknown merge strategy"):
+            _ = merging.MergePlan(strategies={"a": "zip"})  # type: ignore[dict-item]
+
+    def test_empty_path(self):
+        with pytest.raises(ValueError, match="non-empty path"):
+            _ = merging.MergePlan(strategies={"": "append"})
+
+
+class TestLayeredView:
+    def test_reads_merged_values(self):
+        layers = [
+            {"a": {"b": 1, "c": {"d": 1}}, "e": [1]},
+            {"a": {"c": {"f": 2}}, "e": [2]},
+            {"a": {"b": 3}, "g": 4},
+        ]
+
+        view = merging.LayeredView(layers)
+
+        assert view["a"]["b"] == 3
+        assert view["a"]["c"] == {"d": 1, "f": 2}
+        assert view["e"] == [2]
+        assert view == merging.MergePlan().merge(
+            merging.MergePlan().merge(layers[0], layers[1]), layers[2]
+        )
+
+    def test_follows_the_plan(self):
+        layers = [
+            {"plugins": [{"name": "a", "x": 1}], "s": {"p": [1]}},
+            {"plugins": [{"name": "a", "y": 2}], "s": {"p": [2]}},
+        ]
+        plan = merging.MergePlan(strategies={"plugins": "keyed", "*.p": "append"})
+
+        view = merging.LayeredView(layers, plan=plan)
+
+        assert view.to_dict() == plan.merge(*layers)
+        assert view["plugins"] == [{"name": "a", "x": 1, "y": 2}]
+        assert view["s"]["p"] == [1, 2]
+
+    def test_iterates_in_merge_order(self):
+        view = merging.LayeredView([{"b": 1, "a": 1}, {"c": 1, "b": 2}])
+
+        assert list(view) == ["b", "a", "c"]
+        assert len(view) == 3
+
+    def test_missing_key(self):
+        view = merging.LayeredView([{"a": 1}])
+
+        assert "b" not in view
+        assert view.get("b") is None
+        with pytest.raises(KeyError):
+            _ = view["b"]
+
+    def test_caches_resolved_values(self):
+        view = merging.LayeredView([{"a": {"b": 1}}, {"a": {"c": 2}}])
+
+        assert view["a"] is view["a"]
+
+    @pytest.mark.parametrize(
+        ("layers", "plan"),
+        [
+            pytest.param(
+                [{"a": {"b": {"c": 1}}}, {"d": 1}], merging.MergePlan(), id="single"
+            ),
+            pytest.param(
+                [{"a": {"x": 1}}, {"a": {"b": {"c": 1}}}],
+                merging.MergePlan(strategies={"a": "replace"}),
+                id="replaced",
+            ),
+        ],
+    )
+    def test_layer_dicts_are_read_only(
+        self, layers: list[dict], plan: merging.MergePlan
+    ):
+        original = copy.deepcopy(layers)
+        view = merging.LayeredView(layers, plan=plan)
+
+        assert view["a"] == {"b": {"c": 1}}
+        with pytest.raises(TypeError):
+            view["a"]["b"]["c"] = 2
+        assert layers == original
+
+    def test_lists_are_copied(self):
+        layers = [{"a": [{"b": 1}]}, {"a": [{"c": 2}]}, {"d": [{"e": 3}]}]
+        original = copy.deepcopy(layers)
+        view = merging.LayeredView(
+            layers, plan=merging.MergePlan(strategies={"a": "append"})
+        )
+
+        view["a"][0]["b"] = 2
+        view["a"].append(3)
+        view["d"][0]["e"] = 4
+
+        assert layers == original
+
+    def test_resolves_only_what_is_read(self):
+        view = merging.LayeredView([{"a": {"b": 1}, "x": 1}, {"a": 2, "x": {"y": 1}}])
+
+        assert view["a"] == 2
+        with pytest.raises(RuntimeError):
+            _ = view["x"]
+
+    def test_to_dict(self):
+        view = merging.LayeredView([{"a": {"b": {"c": 1}}}, {"a": {"b": {"d": 2}}}])
+
+        merged = view.to_dict()
+
+        assert merged == {"a": {"b": {"c": 1, "d": 2}}}
+        assert type(merged["a"]["b"]) is dict
@@ -0,0 +1,81 @@
+import pytest
+
+from maison import path_index
+
+
+VALUES = {
+    "db": {"host": "localhost", "pool": {"size": 5}},
+    "services": {
+        "web": {"port": 80, "tags": ["a"]},
+        "api": {"port": 8080},
+        "worker": {"replicas": 2},
+    },
+    "debug": False,
+}
+
+
+class TestPathIndex:
+    @pytest.mark.parametrize(
+        ("key_path", "expected"),
+        [
+            ("db.pool.size", 5),
+            ("db.host", "localhost"),
+            ("db.pool", {"size": 5}),
+            ("debug", False),
+            ("services.web.tags", ["a"]),
+            ("", VALUES),
+        ],
+    )
+    def test_get(self, key_path: str, expected: object):
+        index = path_index.PathIndex(VALUES)
+
+        assert index.get(key_path) == expected
+
+    @pytest.mark.parametrize("key_path", ["missing", "db.missing", "debug.x"])
+    def test_get_default(self, key_path: str):
+        index = path_index.PathIndex(VALUES)
+
+        assert index.get(key_path) is None
+        assert index.get(key_path, default=1) == 1
+
+    def test_select_children(self):
+        index = path_index.PathIndex(VALUES)
+
+        assert index.select("db.*") == {
+            "db.host": "localhost",
+            "db.pool": {"size": 5},
+        }
+
+    def test_select_wildcard_in_the_middle(self):
+        index = path_index.PathIndex(VALUES)
+
+        assert index.select("services.*.port") == {
+            "services.api.port": 8080,
+            "services.web.port": 80,
+        }
+
+    def test_select_without_wildcard(self):
+        index = path_index.PathIndex(VALUES)
+
+        assert index.select("db.host") == {"db.host": "localhost"}
+        assert index.select("db.missing") == {}
+
+    def test_select_does_not_match_prefix_siblings(self):
+        index = path_index.PathIndex({"a": {"b": 1}, "ab": {"c": 2}})
+
+        assert index.select("a.*") == {"a.b": 1}
+
+    def test_non_string_keys(self):
+        index = path_index.PathIndex({"ports": {80: "http", "x": 1}, "y": 2})
+
+        assert index.get("ports.x") == 1
+        assert index.get("ports") == {80: "http", "x": 1}
+        assert index.select("ports.*") == {"ports.x": 1}
+        assert index.select("*") == {"ports": {80: "http", "x": 1}, "y": 2}
+
+    def test_len(self):
+        assert len(path_index.PathIndex({"a": {"b": 1}, "c": 2})) == 4
+
+
+def test_compile_path_is_cached():
+    assert path_index.compile_path("a.b") is path_index.compile_path("a.b")
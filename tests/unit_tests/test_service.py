@@ -1,7 +1,15 @@
-import io
+import asyncio
 import pathlib
+import threading
+import time
 import typing
 
+import pytest
+
+from maison import caching
+from maison import disk_cache
+from maison import environment
+from maison import merging
 from maison import protocols
 from maison import service as config_service
 from maison import typedefs
@@ -15,20 +23,62 @@ class FakeFileSystem:
             return None
         return pathlib.Path(f"/path/to/{file_name}")
 
-    def open_file(self, path: pathlib.Path, mode: str = "rb") -> typing.BinaryIO:
-        return io.BytesIO(b"file")
+    def get_file_paths(
+        self,
+        file_names: typing.Sequence[str],
+        starting_path: typing.Optional[pathlib.Path] = None,
+    ) -> list[pathlib.Path]:
+        return [
+            path
+            for file_name in file_names
+            if (path := self.get_file_path(file_name, starting_path))
+        ]
+
+    def get_fingerprint(self, path: pathlib.Path) -> typedefs.FileFingerprint:
+        return typedefs.FileFingerprint(path=path, mtime_ns=1, size=4, inode=1)
+
+    def read_file(self, path: pathlib.Path) -> bytes:
+        return b"file"
+
+
+class FakeAsyncFileSystem:
+    def __init__(self) -> None:
+        self.filesystem = FakeFileSystem()
+
+    async def get_file_paths(
+        self,
+        file_names: typing.Sequence[str],
+        starting_path: typing.Optional[pathlib.Path] = None,
+    ) -> list[pathlib.Path]:
+        return self.filesystem.get_file_paths(file_names, starting_path)
+
+    async def get_fingerprint(self, path: pathlib.Path) -> typedefs.FileFingerprint:
+        return self.filesystem.get_fingerprint(path)
+
+    async def read_file(self, path: pathlib.Path) -> bytes:
+        return self.filesystem.read_file(path)
 
 
 class FakeConfigParser:
+    def __init__(self, cache_key: typing.Optional[typing.Hashable] = None) -> None:
+        self.cache_key = cache_key
+        self.parse_count = 0
+
     def parse_config(
         self,
         file_path: pathlib.Path,
-        file: typing.BinaryIO,
+        data: bytes,
     ) -> typedefs.ConfigValues:
+        self.parse_count += 1
         return {
             "values": {file_path.stem: file_path.suffix},
         }
 
+    def get_cache_key(
+        self, file_path: pathlib.Path
+    ) -> typing.Optional[typing.Hashable]:
+        return self.cache_key
+
 
 class Schema:
     def model_dump(self) -> typedefs.ConfigValues:
@@ -102,6 +152,284 @@ class TestGetConfigValues:
         }
 
 
+class TestGetConfigLayers:
+    def test_returns_layer_per_file(self):
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=FakeConfigParser(),
+            validator=FakeValidator(),
+        )
+
+        layers = service.get_config_layers(
+            config_file_paths=[pathlib.Path("config.toml"), pathlib.Path("other.ini")],
+            merge_configs=True,
+        )
+
+        assert [layer.values for layer in layers] == [
+            {"values": {"config": ".toml"}},
+            {"values": {"other": ".ini"}},
+        ]
+
+    def test_reuses_unchanged_layers(self):
+        parser = FakeConfigParser()
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=parser,
+            validator=FakeValidator(),
+        )
+        paths = [pathlib.Path("config.toml")]
+
+        layers = service.get_config_layers(config_file_paths=paths, merge_configs=True)
+        new_layers = service.get_config_layers(
+            config_file_paths=paths, merge_configs=True, previous_layers=layers
+        )
+
+        assert new_layers == layers
+        assert parser.parse_count == 1
+
+    def test_merge_layers_does_not_modify_layers(self):
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=FakeConfigParser(),
+            validator=FakeValidator(),
+        )
+        layers = service.get_config_layers(
+            config_file_paths=[pathlib.Path("config.toml"), pathlib.Path("other.ini")],
+            merge_configs=True,
+        )
+
+        _ = service.merge_layers(layers)
+
+        assert [layer.values for layer in layers] == [
+            {"values": {"config": ".toml"}},
+            {"values": {"other": ".ini"}},
+        ]
+
+    def test_config_values_share_nothing_with_cache(self):
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=FakeConfigParser(cache_key="fake"),
+            validator=FakeValidator(),
+            parse_cache=caching.ParseCache(),
+        )
+        paths = [pathlib.Path("config.toml")]
+
+        values = service.get_config_values(config_file_paths=paths, merge_configs=True)
+        values["values"]["config"] = "changed"  # type: ignore[index]
+
+        assert service.get_config_values(
+            config_file_paths=paths, merge_configs=True
+        ) == {"values": {"config": ".toml"}}
+
+
+class BarrierConfigParser(FakeConfigParser):
+    def __init__(self, parties: int) -> None:
+        super().__init__()
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def parse_config(
+        self,
+        file_path: pathlib.Path,
+        data: bytes,
+    ) -> typedefs.ConfigValues:
+        _ = self.barrier.wait()
+        # let the first files finish last
+        time.sleep(0.01 * (3 - int(file_path.stem)))
+        return {"value": file_path.stem}
+
+
+class TestParallelParsing:
+    def test_parses_files_concurrently_in_order(self):
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=BarrierConfigParser(parties=3),
+            validator=FakeValidator(),
+            max_workers=3,
+        )
+
+        layers = service.get_config_layers(
+            config_file_paths=[pathlib.Path(f"{index}.toml") for index in range(3)],
+            merge_configs=True,
+        )
+
+        assert [layer.values for layer in layers] == [
+            {"value": "0"},
+            {"value": "1"},
+            {"value": "2"},
+        ]
+        assert service.merge_layers(layers).values == {"value": "2"}
+
+    def test_parses_single_file_without_threads(self):
+        parser = BarrierConfigParser(parties=1)
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=parser,
+            validator=FakeValidator(),
+            max_workers=4,
+        )
+
+        layers = service.get_config_layers(
+            config_file_paths=[pathlib.Path("0.toml"), pathlib.Path("1.toml")],
+            merge_configs=False,
+        )
+
+        assert [layer.values for layer in layers] == [{"value": "0"}]
+
+
+class TestEnvironment:
+    @pytest.mark.parametrize(
+        ("priority", "expected"),
+        [
+            ("highest", {"values": {"config": "environment"}}),
+            ("lowest", {"values": {"config": ".toml"}}),
+        ],
+    )
+    def test_merges_environment_layer(
+        self, priority: environment.Priority, expected: typedefs.ConfigValues
+    ):
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=FakeConfigParser(),
+            validator=FakeValidator(),
+            environment=environment.EnvironmentSource(
+                prefix="ACME", environ={"ACME__VALUES__CONFIG": "environment"}
+            ),
+            environment_priority=priority,
+        )
+
+        config_dict = service.get_config_values(
+            config_file_paths=[pathlib.Path("config.toml")], merge_configs=False
+        )
+
+        assert config_dict == expected
+
+    def test_invalid_priority(self):
+        with pytest.raises(ValueError, match="priority"):
+            _ = config_service.ConfigService(
+                filesystem=FakeFileSystem(),
+                config_parser=FakeConfigParser(),
+                validator=FakeValidator(),
+                environment_priority="middle",  # type: ignore[arg-type]
+            )
+
+
+class TestParseCache:
+    def test_reuses_parsed_values(self):
+        parser = FakeConfigParser(cache_key="fake")
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=parser,
+            validator=FakeValidator(),
+            parse_cache=caching.ParseCache(),
+        )
+
+        for _ in range(3):
+            config_dict = service.get_config_values(
+                config_file_paths=[pathlib.Path("config.toml")],
+                merge_configs=False,
+            )
+
+        assert config_dict == {"values": {"config": ".toml"}}
+        assert parser.parse_count == 1
+        assert service.parse_cache is not None
+        assert service.parse_cache.cache_info().hits == 2
+
+    def test_cached_values_are_not_shared(self):
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=FakeConfigParser(cache_key="fake"),
+            validator=FakeValidator(),
+            parse_cache=caching.ParseCache(),
+        )
+
+        first = service.get_config_values(
+            config_file_paths=[pathlib.Path("config.toml")],
+            merge_configs=False,
+        )
+        first["values"] = "changed"
+
+        second = service.get_config_values(
+            config_file_paths=[pathlib.Path("config.toml")],
+            merge_configs=False,
+        )
+
+        assert second == {"values": {"config": ".toml"}}
+
+    def test_skips_cache_without_cache_key(self):
+        parser = FakeConfigParser()
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=parser,
+            validator=FakeValidator(),
+            parse_cache=caching.ParseCache(),
+        )
+
+        for _ in range(2):
+            _ = service.get_config_values(
+                config_file_paths=[pathlib.Path("config.toml")],
+                merge_configs=False,
+            )
+
+        assert parser.parse_count == 2
+
+
+class TestDiskCache:
+    def test_reuses_values_from_disk(self, tmp_path: pathlib.Path):
+        parser = FakeConfigParser(cache_key="fake")
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=parser,
+            validator=FakeValidator(),
+            disk_cache=disk_cache.DiskCache(directory=tmp_path),
+        )
+
+        for _ in range(2):
+            config_dict = service.get_config_values(
+                config_file_paths=[pathlib.Path("config.toml"), pathlib.Path("b.ini")],
+                merge_configs=True,
+            )
+
+        assert config_dict == {"values": {"config": ".toml", "b": ".ini"}}
+        assert parser.parse_count == 2
+
+    def test_skips_disk_cache_without_cache_key(self, tmp_path: pathlib.Path):
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=FakeConfigParser(),
+            validator=FakeValidator(),
+            disk_cache=disk_cache.DiskCache(directory=tmp_path),
+        )
+
+        _ = service.get_config_values(
+            config_file_paths=[pathlib.Path("config.toml")],
+            merge_configs=False,
+        )
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestGetFingerprint:
+    def test_identifies_layers_and_merge_plan(self):
+        service = config_service.ConfigService(
+            filesystem=FakeFileSystem(),
+            config_parser=FakeConfigParser(cache_key="fake"),
+            validator=FakeValidator(),
+        )
+        layers = service.get_config_layers(
+            config_file_paths=[pathlib.Path("config.toml"), pathlib.Path("other.ini")],
+            merge_configs=True,
+        )
+        fingerprint = service.get_fingerprint(layers)
+
+        assert service.get_fingerprint(list(layers)) == fingerprint
+        assert service.get_fingerprint(layers[:1]) != fingerprint
+        assert service.get_fingerprint(layers[::-1]) != fingerprint
+
+        service.merge_plan = merging.MergePlan(strategies={"a": "append"})
+
+        assert service.get_fingerprint(layers) != fingerprint
+
+
 class TestValidate:
     @classmethod
     def setup_class(cls):
@@ -120,3 +448,89 @@ class TestValidate:
         validated_values = self.service.validate_config(values=values, schema=Schema)
 
         assert validated_values == {"key": "validated"}
+
+
+class TestAsyncConfigService:
+    def test_finds_configs(self):
+        service = config_service.AsyncConfigService(
+            filesystem=FakeAsyncFileSystem(),
+            config_parser=FakeConfigParser(),
+            validator=FakeValidator(),
+        )
+
+        configs = asyncio.run(
+            service.find_configs(source_files=["other.toml", "not.exists"])
+        )
+
+        assert configs == [pathlib.Path("/path/to/other.toml")]
+
+    def test_merges_configs_in_order(self):
+        service = config_service.AsyncConfigService(
+            filesystem=FakeAsyncFileSystem(),
+            config_parser=FakeConfigParser(),
+            validator=FakeValidator(),
+        )
+
+        config_dict = asyncio.run(
+            service.get_config_values(
+                config_file_paths=[
+                    pathlib.Path("config.toml"),
+                    pathlib.Path("other.ini"),
+                ],
+                merge_configs=True,
+            )
+        )
+
+        assert config_dict == {"values": {"config": ".toml", "other": ".ini"}}
+
+    def test_returns_first_layer_if_not_merge_configs(self):
+        service = config_service.AsyncConfigService(
+            filesystem=FakeAsyncFileSystem(),
+            config_parser=FakeConfigParser(),
+            validator=FakeValidator(),
+        )
+
+        layers = asyncio.run(
+            service.get_config_layers(
+                config_file_paths=[
+                    pathlib.Path("config.toml"),
+                    pathlib.Path("other.ini"),
+                ],
+                merge_configs=False,
+            )
+        )
+
+        assert [layer.path for layer in layers] == [pathlib.Path("config.toml")]
+
+    def test_reuses_parsed_values(self, tmp_path: pathlib.Path):
+        parser = FakeConfigParser(cache_key="fake")
+        service = config_service.AsyncConfigService(
+            filesystem=FakeAsyncFileSystem(),
+            config_parser=parser,
+            validator=FakeValidator(),
+            parse_cache=caching.ParseCache(),
+            disk_cache=disk_cache.DiskCache(directory=tmp_path),
+        )
+
+        async def _load_twice() -> None:
+            for _ in range(2):
+                _ = await service.get_config_values(
+                    config_file_paths=[pathlib.Path("config.toml")],
+                    merge_configs=False,
+                )
+
+        asyncio.run(_load_twice())
+
+        assert parser.parse_count == 1
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_validates_config(self):
+        service = config_service.AsyncConfigService(
+            filesystem=FakeAsyncFileSystem(),
+            config_parser=FakeConfigParser(),
+            validator=FakeValidator(),
+        )
+
+        validated_values = service.validate_config(values={}, schema=Schema)
+
+        assert validated_values == {"key": "validated"}
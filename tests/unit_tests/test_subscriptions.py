@@ -0,0 +1,93 @@
+import typing
+
+import pytest
+
+from maison import subscriptions
+from maison import typedefs
+
+
+class TestDiffValues:
+    @pytest.mark.parametrize(
+        ("old", "new", "expected"),
+        [
+            pytest.param({"a": 1}, {"a": 1}, set(), id="unchanged"),
+            pytest.param({"a": 1}, {"a": 2}, {("a",)}, id="changed"),
+            pytest.param({}, {"a": {"b": 1}}, {("a",)}, id="added"),
+            pytest.param({"a": {"b": 1}}, {"a": {}}, {("a", "b")}, id="removed"),
+            pytest.param(
+                {"a": {"b": {"c": 1, "d": 1}}, "e": [1]},
+                {"a": {"b": {"c": 2, "d": 1}}, "e": [1, 2]},
+                {("a", "b", "c"), ("e",)},
+                id="nested",
+            ),
+            pytest.param({"a": {"b": 1}}, {"a": 1}, {("a",)}, id="dict_replaced"),
+        ],
+    )
+    def test_diff(
+        self,
+        old: typedefs.ConfigValues,
+        new: typedefs.ConfigValues,
+        expected: set[subscriptions.KeyPath],
+    ):
+        assert subscriptions.diff_values(old, new) == expected
+
+
+class TestSubscriptions:
+    def setup_method(self):
+        self.subscriptions = subscriptions.Subscriptions()
+        self.calls: list[tuple[str, typing.Any, typing.Any]] = []
+
+    def subscribe(self, key_path: str) -> typing.Callable[[], None]:
+        return self.subscriptions.subscribe(
+            key_path, lambda old, new: self.calls.append((key_path, old, new))
+        )
+
+    def test_dispatches_to_changed_subtrees_only(self):
+        for key_path in ["db", "db.pool", "db.pool.size", "db.host", "cache", ""]:
+            _ = self.subscribe(key_path)
+
+        self.subscriptions.dispatch(
+            {"db": {"pool": {"size": 1}, "host": "a"}, "cache": {"ttl": 1}},
+            {"db": {"pool": {"size": 2}, "host": "a"}, "cache": {"ttl": 1}},
+        )
+
+        assert sorted(call[0] for call in self.calls) == [
+            "",
+            "db",
+            "db.pool",
+            "db.pool.size",
+        ]
+        assert ("db.pool.size", 1, 2) in self.calls
+
+    def test_dispatches_when_parent_is_replaced(self):
+        _ = self.subscribe("db.pool.size")
+
+        self.subscriptions.dispatch({"db": {"pool": {"size": 1}}}, {"db": "none"})
+
+        assert self.calls == [("db.pool.size", 1, None)]
+
+    def test_copies_values_given_to_callables(self):
+        _ = self.subscribe("db")
+        _ = self.subscribe("cache")
+        old = {"db": {"port": 1}, "cache": {"ttl": 1}}
+        new = {"db": {"port": 2}, "cache": old["cache"]}
+        copied: list[object] = []
+
+        def _copy(value: object) -> object:
+            copied.append(value)
+            return dict(typing.cast("dict[str, int]", value))
+
+        self.subscriptions.dispatch(old, new, copy=_copy)
+
+        assert self.calls == [("db", {"port": 1}, {"port": 2})]
+        assert self.calls[0][1] is not old["db"]
+        assert copied == [{"port": 1}, {"port": 2}]
+
+    def test_unsubscribe(self):
+        unsubscribe = self.subscribe("db")
+
+        unsubscribe()
+        self.subscriptions.dispatch({"db": 1}, {"db": 2})
+
+        assert self.calls == []
+        assert len(self.subscriptions) == 0
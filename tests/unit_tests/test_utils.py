@@ -3,6 +3,7 @@
 import pytest
 
 from maison import typedefs
+from maison.utils import copy_values
 from maison.utils import deep_merge
 
 
@@ -42,3 +43,16 @@ class TestDeepMerge:
 
         with pytest.raises(RuntimeError):
             _ = deep_merge(dict_a, dict_b)
+
+
+class TestCopyValues:
+    """Tests for the `copy_values` function."""
+
+    def test_copies_dicts_and_lists(self) -> None:
+        values: typedefs.ConfigValues = {"a": {"b": [{"c": 1}]}, "d": "e"}
+
+        copied = copy_values(values)
+
+        assert copied == values
+        assert copied["a"] is not values["a"]
+        assert copied["a"]["b"] is not values["a"]["b"]  # type: ignore[index]